@@ -23,6 +23,17 @@ PLAYER_MAGNETIC_STRENGTH = 1.0
 MAGNET_DEFAULT_RANGE = 150
 MAGNET_DEFAULT_STRENGTH = 0.8
 
+# Broad-phase settings
+SPATIAL_CELL_SIZE = 128
+GRID_MIN_PLATFORMS = 128  # Below this a full collidelistall sweep is faster
+CULL_MARGIN = 128  # Off-screen band in which enemies keep updating
+
+# Rendering settings
+STATIC_LAYER_MAX_AREA = 4096 * 4096  # Largest pre-rendered platform layer, in pixels
+TEXT_CACHE_SIZE = 128  # Rendered text surfaces kept by the renderer
+CAMERA_SNAP_DISTANCE = 0.5  # Camera jumps to its target once this close, in pixels
+DIRTY_RECT_MAX = 32  # Frames with more changed rects than this are flipped whole
+
 # Colors
 COLOR_BLACK = (0, 0, 0)
 COLOR_WHITE = (255, 255, 255)
@@ -38,17 +49,28 @@ COLOR_PLATFORM = (100, 100, 100)
 COLOR_MAGNETIC_PLATFORM = (100, 100, 200)
 COLOR_GOAL = (255, 215, 0)
 COLOR_ENEMY = (200, 50, 50)
+COLOR_HUD_OFF = (150, 150, 150)
 
 # Magnetic states
-MAGNETIC_STATE_NORMAL = "normal"
-MAGNETIC_STATE_STICKING = "sticking"
+MAGNETIC_STATE_NORMAL = 0
+MAGNETIC_STATE_STICKING = 1
 
 # Polarity
 POLARITY_ATTRACT = "attract"
 POLARITY_REPEL = "repel"
 
-# Platform orientations
-ORIENTATION_FLOOR = "floor"
-ORIENTATION_WALL_LEFT = "wall_left"
-ORIENTATION_WALL_RIGHT = "wall_right"
-ORIENTATION_CEILING = "ceiling"
+# Platform orientations, as small ints so they can index lookup tables
+ORIENTATION_FLOOR = 0
+ORIENTATION_CEILING = 1
+ORIENTATION_WALL_LEFT = 2
+ORIENTATION_WALL_RIGHT = 3
+# Collision side reported when a collision is not resolved
+ORIENTATION_NONE = -1
+# String names, written to saved levels and accepted when creating platforms
+ORIENTATION_BY_NAME = {
+    "floor": ORIENTATION_FLOOR,
+    "ceiling": ORIENTATION_CEILING,
+    "wall_left": ORIENTATION_WALL_LEFT,
+    "wall_right": ORIENTATION_WALL_RIGHT,
+}
+ORIENTATION_NAMES = {value: name for name, value in ORIENTATION_BY_NAME.items()}
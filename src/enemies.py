@@ -1,18 +1,33 @@
 """Enemy classes that respond to magnetic fields."""
 
-from typing import Tuple, List, Optional
+from typing import Callable, Iterable, Tuple, List, Optional
 import pygame
 import math
 
 from .constants import (
     COLOR_ENEMY, GRAVITY, MAX_FALL_SPEED
 )
-from .physics import check_rect_collision, calculate_distance
+from .physics import check_rect_collision
+
+# Sine lookup table used by FlyingEnemy instead of calling math.sin every frame
+SINE_TABLE_SIZE = 4096
+_SINE_TABLE = [math.sin(2 * math.pi * i / SINE_TABLE_SIZE) for i in range(SINE_TABLE_SIZE)]
+
+# Returns the platform rects that may overlap the given enemy rect
+PlatformRectQuery = Callable[
+    [Tuple[float, float, float, float]],
+    Iterable[Tuple[float, float, float, float]]
+]
 
 
 class Enemy:
     """Base enemy class that can be affected by magnetic fields."""
     
+    __slots__ = (
+        'x', 'y', 'width', 'height', 'velocity_x', 'velocity_y', 'speed',
+        'is_magnetic', 'alive', 'direction', '_rect', '_draw_rect'
+    )
+    
     def __init__(
         self,
         x: float,
@@ -43,6 +58,9 @@ class Enemy:
         self.is_magnetic = is_magnetic
         self.alive = True
         self.direction = 1
+        # pygame.Rect truncates float coordinates itself, like int()
+        self._rect = pygame.Rect(x, y, width, height)
+        self._draw_rect = pygame.Rect(0, 0, width, height)
     
     @property
     def position(self) -> Tuple[float, float]:
@@ -66,10 +84,14 @@ class Enemy:
     def pygame_rect(self) -> pygame.Rect:
         """Get enemy as pygame Rect.
 
+        The same Rect object is reused and refreshed on every access, so
+        callers should copy it if they need to keep or modify it.
+
         Returns:
             pygame.Rect: The enemy's bounding rectangle as a pygame Rect object.
         """
-        return pygame.Rect(int(self.x), int(self.y), int(self.width), int(self.height))
+        self._rect.update(self.x, self.y, self.width, self.height)
+        return self._rect
     
     def apply_magnetic_force(self, force: Tuple[float, float]) -> None:
         """Apply magnetic force to enemy.
@@ -90,23 +112,74 @@ class Enemy:
         Args:
             platforms: List of platform objects to check for collisions.
         """
-        if not self.alive:
-            return
-        
-        # Apply gravity
-        self.velocity_y = min(self.velocity_y + GRAVITY, MAX_FALL_SPEED)
-        
-        # Apply velocity
-        self.x += self.velocity_x
-        self.y += self.velocity_y
-        
-        # Basic collision with platforms
-        for platform in platforms:
-            if check_rect_collision(self.rect, platform.rect):
-                # Simple collision resolution
-                if self.velocity_y > 0:
-                    self.y = platform.y - self.height
-                    self.velocity_y = 0
+        platform_rects = [platform.rect for platform in platforms]
+        self.step(lambda rect: platform_rects)
+    
+    def step(self, platforms_near: PlatformRectQuery) -> None:
+        """Advance the enemy by one frame.
+
+        This is the per-frame body of ``update``. Instead of a platform list
+        it takes a query returning the platform rects that may overlap the
+        enemy's moved rect, which lets batch callers such as
+        ``EnemyPool.update_all`` answer from a spatial index.
+
+        Args:
+            platforms_near: Callable taking the enemy rect and returning
+                candidate platform rects as (x, y, width, height).
+        """
+        type(self).step_batch((self,), platforms_near)
+    
+    def steer(self) -> None:
+        """Adjust velocity before the enemy moves this frame.
+
+        The base enemy keeps its current velocity. Subclasses override this
+        to add movement behavior on top of the shared physics step.
+        """
+    
+    @staticmethod
+    def step_batch(enemies: Iterable['Enemy'], platforms_near: PlatformRectQuery) -> None:
+        """Advance many walking enemies in a single loop.
+
+        This is the per-frame physics kernel for gravity-bound enemies:
+        steering, gravity, integration and platform collision all run in one
+        loop with the physics constants bound once for the whole batch.
+
+        Args:
+            enemies: The enemies to update. Dead enemies are skipped.
+            platforms_near: Callable taking an enemy rect and returning
+                candidate platform rects as (x, y, width, height).
+        """
+        # Module globals and builtins bound to fast locals for the loop
+        gravity = GRAVITY
+        max_fall_speed = MAX_FALL_SPEED
+        min_ = min
+        for enemy in enemies:
+            if not enemy.alive:
+                continue
+            
+            enemy.steer()
+            
+            # Apply gravity
+            velocity_y = min_(enemy.velocity_y + gravity, max_fall_speed)
+            
+            # Apply velocity
+            x = enemy.x + enemy.velocity_x
+            y = enemy.y + velocity_y
+            width = enemy.width
+            height = enemy.height
+            
+            # Basic collision with platforms, with the AABB test inlined
+            right = x + width
+            for px, py, pw, ph in platforms_near((x, y, width, height)):
+                if x < px + pw and right > px and y < py + ph and y + height > py:
+                    # Simple collision resolution
+                    if velocity_y > 0:
+                        y = py - height
+                        velocity_y = 0
+            
+            enemy.x = x
+            enemy.y = y
+            enemy.velocity_y = velocity_y
     
     def check_player_collision(self, player_rect: Tuple[float, float, float, float]) -> bool:
         """Check if enemy collides with player.
@@ -140,11 +213,12 @@ class Enemy:
         if not self.alive:
             return
         
-        rect = pygame.Rect(
-            int(self.x - camera_offset[0]),
-            int(self.y - camera_offset[1]),
-            int(self.width),
-            int(self.height)
+        rect = self._draw_rect
+        rect.update(
+            self.x - camera_offset[0],
+            self.y - camera_offset[1],
+            self.width,
+            self.height
         )
         pygame.draw.rect(surface, COLOR_ENEMY, rect)
         
@@ -192,6 +266,8 @@ class Enemy:
 class PatrolEnemy(Enemy):
     """Enemy that patrols between two points."""
     
+    __slots__ = ('start_x', 'patrol_distance')
+    
     def __init__(
         self,
         x: float,
@@ -213,27 +289,18 @@ class PatrolEnemy(Enemy):
         self.patrol_distance = patrol_distance
         self.velocity_x = self.speed
     
-    def update(self, platforms: List) -> None:
+    def steer(self) -> None:
         """Update patrol enemy behavior.
 
         Handles patrol logic by reversing direction when reaching patrol
-        boundaries, then delegates to the parent update method.
-
-        Args:
-            platforms: List of platform objects to check for collisions.
+        boundaries. The shared physics step then moves the enemy.
         """
-        if not self.alive:
-            return
-        
-        # Patrol logic
         if self.x >= self.start_x + self.patrol_distance:
             self.direction = -1
             self.velocity_x = -self.speed
         elif self.x <= self.start_x:
             self.direction = 1
             self.velocity_x = self.speed
-        
-        super().update(platforms)
     
     def to_dict(self) -> dict:
         """Serialize patrol enemy to dictionary.
@@ -251,6 +318,8 @@ class PatrolEnemy(Enemy):
 class FlyingEnemy(Enemy):
     """Enemy that flies in a pattern."""
     
+    __slots__ = ('start_y', 'amplitude', 'frequency', 'time', '_phase', '_phase_step')
+    
     def __init__(
         self,
         x: float,
@@ -273,27 +342,53 @@ class FlyingEnemy(Enemy):
         self.amplitude = amplitude
         self.frequency = frequency
         self.time = 0.0
+        # Oscillation phase measured in sine table entries
+        self._phase = 0.0
+        self._phase_step = SINE_TABLE_SIZE * frequency / (2 * math.pi)
     
-    def update(self, platforms: List) -> None:
+    def step(self, platforms_near: PlatformRectQuery) -> None:
         """Update flying enemy behavior.
 
         Updates position using sinusoidal vertical movement and constant
         horizontal velocity. Ignores gravity and platform collisions.
 
         Args:
-            platforms: List of platform objects (unused, but kept for interface
+            platforms_near: Platform query (unused, but kept for interface
                 consistency with base class).
         """
-        if not self.alive:
-            return
-        
-        self.time += 1
-        
-        # Sinusoidal vertical movement
-        self.y = self.start_y + self.amplitude * math.sin(self.time * self.frequency)
-        
-        # Horizontal movement
-        self.x += self.velocity_x
+        FlyingEnemy.step_batch((self,))
+    
+    @staticmethod
+    def step_batch(
+        enemies: Iterable['FlyingEnemy'],
+        platforms_near: Optional[PlatformRectQuery] = None
+    ) -> None:
+        """Advance many flying enemies in a single loop.
+
+        The sine table and its size are bound once for the whole batch
+        instead of being looked up again for every enemy.
+
+        Args:
+            enemies: The flying enemies to update. Dead enemies are skipped.
+            platforms_near: Platform query (unused, flying enemies ignore
+                platforms).
+        """
+        table = _SINE_TABLE
+        size = SINE_TABLE_SIZE
+        mask = SINE_TABLE_SIZE - 1
+        for enemy in enemies:
+            if not enemy.alive:
+                continue
+            
+            enemy.time += 1
+            
+            # Sinusoidal vertical movement via the sine lookup table
+            phase = (enemy._phase + enemy._phase_step) % size
+            enemy._phase = phase
+            enemy.y = enemy.start_y + enemy.amplitude * table[int(phase) & mask]
+            
+            # Horizontal movement
+            enemy.x += enemy.velocity_x
     
     def to_dict(self) -> dict:
         """Serialize flying enemy to dictionary.
@@ -309,11 +404,21 @@ class FlyingEnemy(Enemy):
         return data
 
 
+# Constructor and accepted optional keys for each serialized enemy type
+_BASE_ENEMY_KEYS = frozenset(('width', 'height', 'speed', 'is_magnetic'))
+_ENEMY_TYPES = {
+    'basic': (Enemy, _BASE_ENEMY_KEYS),
+    'patrol': (PatrolEnemy, _BASE_ENEMY_KEYS | {'patrol_distance'}),
+    'flying': (FlyingEnemy, _BASE_ENEMY_KEYS | {'amplitude', 'frequency'}),
+}
+
+
 def create_enemy_from_dict(data: dict) -> Enemy:
     """Factory function to create enemy from dictionary.
 
     Creates the appropriate Enemy subclass based on the 'type' field
-    in the data dictionary.
+    in the data dictionary. Optional keys that are missing fall back to
+    the constructor defaults.
 
     Args:
         data: Dictionary containing enemy properties. Required keys: 'x', 'y'.
@@ -323,28 +428,6 @@ def create_enemy_from_dict(data: dict) -> Enemy:
     Returns:
         Enemy: An instance of Enemy, PatrolEnemy, or FlyingEnemy based on type.
     """
-    enemy_type = data.get('type', 'basic')
-    
-    if enemy_type == 'patrol':
-        return PatrolEnemy(
-            x=data['x'],
-            y=data['y'],
-            patrol_distance=data.get('patrol_distance', 100),
-            width=data.get('width', 32),
-            height=data.get('height', 32),
-            speed=data.get('speed', 2.0),
-            is_magnetic=data.get('is_magnetic', True)
-        )
-    elif enemy_type == 'flying':
-        return FlyingEnemy(
-            x=data['x'],
-            y=data['y'],
-            amplitude=data.get('amplitude', 50),
-            frequency=data.get('frequency', 0.05),
-            width=data.get('width', 32),
-            height=data.get('height', 32),
-            speed=data.get('speed', 2.0),
-            is_magnetic=data.get('is_magnetic', True)
-        )
-    else:
-        return Enemy.from_dict(data)
+    ctor, keys = _ENEMY_TYPES.get(data.get('type', 'basic'), _ENEMY_TYPES['basic'])
+    kwargs = {key: data[key] for key in keys.intersection(data)}
+    return ctor(data['x'], data['y'], **kwargs)
@@ -0,0 +1,175 @@
+"""Batched container for the enemies in a level."""
+
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from .enemies import Enemy, FlyingEnemy, PlatformRectQuery
+
+# Returns the total magnetic force (fx, fy) at each of a batch of positions
+MagneticForceQuery = Callable[
+    [Sequence[Tuple[float, float]]],
+    Sequence[Tuple[float, float]]
+]
+
+
+class EnemyPool:
+    """Owns a level's enemies and updates them in a single batched pass.
+
+    Platform lookups go through a shared query (typically backed by the
+    level's spatial grid) so each enemy only tests nearby platforms. Flying
+    enemies ignore platforms and are advanced together in one batch.
+    Enemies remain ordinary ``Enemy`` objects, so drawing, collision checks
+    and serialization keep working unchanged.
+    """
+
+    def __init__(self):
+        """Initialize an empty enemy pool."""
+        self.enemies: List[Enemy] = []
+        self._flying: List[FlyingEnemy] = []
+        self._walking: List[Enemy] = []
+        self._magnetic_flying: List[FlyingEnemy] = []
+        self._magnetic_walking: List[Enemy] = []
+        self._inert_walking: List[Enemy] = []
+
+    def __len__(self) -> int:
+        """Get the number of enemies in the pool.
+
+        Returns:
+            int: The number of enemies, alive or dead.
+        """
+        return len(self.enemies)
+
+    def __iter__(self) -> Iterator[Enemy]:
+        """Iterate over the enemies in the pool.
+
+        Returns:
+            Iterator[Enemy]: An iterator over all enemies in insertion order.
+        """
+        return iter(self.enemies)
+
+    def add(self, enemy: Enemy) -> None:
+        """Add an enemy to the pool.
+
+        Args:
+            enemy: The enemy to add.
+        """
+        self.enemies.append(enemy)
+
+    def _partition(self) -> None:
+        """Split enemies into batches by movement and magnetism if stale.
+
+        An enemy's type and ``is_magnetic`` flag are fixed once it is in the
+        pool, so the lists only need rebuilding when enemies are added.
+        """
+        if len(self._flying) + len(self._walking) == len(self.enemies):
+            return
+        self._flying = []
+        self._walking = []
+        self._magnetic_flying = []
+        self._magnetic_walking = []
+        self._inert_walking = []
+        for enemy in self.enemies:
+            if isinstance(enemy, FlyingEnemy):
+                self._flying.append(enemy)
+                if enemy.is_magnetic:
+                    self._magnetic_flying.append(enemy)
+            else:
+                self._walking.append(enemy)
+                if enemy.is_magnetic:
+                    self._magnetic_walking.append(enemy)
+                else:
+                    self._inert_walking.append(enemy)
+
+    @staticmethod
+    def _in_view(
+        enemies: List[Enemy],
+        view: Optional[Tuple[float, float, float, float]]
+    ) -> List[Enemy]:
+        """Filter enemies to those overlapping a view rect.
+
+        Args:
+            enemies: The enemies to filter.
+            view: The view rect as (x, y, width, height), or None for no
+                culling.
+
+        Returns:
+            List[Enemy]: The enemies inside the view, in their original order.
+        """
+        if view is None:
+            return enemies
+        vx, vy, vw, vh = view
+        right = vx + vw
+        bottom = vy + vh
+        return [
+            enemy for enemy in enemies
+            if (enemy.x < right and enemy.x + enemy.width > vx and
+                enemy.y < bottom and enemy.y + enemy.height > vy)
+        ]
+
+    def awake(
+        self,
+        view: Optional[Tuple[float, float, float, float]] = None
+    ) -> List[Enemy]:
+        """Get the living enemies that update_all advances for a view.
+
+        Walking enemies outside the view are frozen by update_all, so they
+        are left out along with dead enemies.
+
+        Args:
+            view: The view rect as (x, y, width, height), or None for no
+                culling.
+
+        Returns:
+            List[Enemy]: The living walking enemies inside the view, then
+                the living flying enemies.
+        """
+        self._partition()
+        return [
+            enemy for enemy in self._in_view(self._walking, view) + self._flying
+            if enemy.alive
+        ]
+
+    def update_all(
+        self,
+        platforms_near: PlatformRectQuery,
+        view: Optional[Tuple[float, float, float, float]] = None,
+        magnetic_forces: Optional[MagneticForceQuery] = None
+    ) -> None:
+        """Advance every living enemy by one frame.
+
+        Walking enemies outside the view are frozen until they come back
+        into it. Flying enemies are always advanced: their step is cheap and
+        keeps their oscillation in phase while off screen. Magnetic and
+        inert walking enemies are stepped as separate batches so the force
+        pass never visits inert ones; each enemy's step is independent, so
+        the batch order does not affect the result.
+
+        Args:
+            platforms_near: Callable taking an enemy rect and returning the
+                platform rects that may overlap it.
+            view: Optional rect as (x, y, width, height) limiting which
+                walking enemies are updated.
+            magnetic_forces: Optional callable taking a list of positions
+                and returning the magnetic force at each. It is called once
+                per frame for all magnetic enemies, and the forces are
+                applied before they move.
+        """
+        self._partition()
+        magnetic = self._in_view(self._magnetic_walking, view)
+        inert = self._in_view(self._inert_walking, view)
+        
+        if magnetic_forces is not None:
+            attracted = magnetic + self._magnetic_flying
+            if attracted:
+                # One batched query for every magnetic enemy, then scatter back
+                forces = magnetic_forces([enemy.position for enemy in attracted])
+                for enemy, force in zip(attracted, forces):
+                    enemy.apply_magnetic_force(force)
+        
+        Enemy.step_batch(magnetic, platforms_near)
+        Enemy.step_batch(inert, platforms_near)
+        FlyingEnemy.step_batch(self._flying)
+
+    def revive_all(self) -> None:
+        """Bring every enemy in the pool back to life."""
+        for enemy in self.enemies:
+            enemy.alive = True
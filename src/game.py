@@ -10,7 +10,10 @@ from .constants import (
 )
 from .player import Player
 from .level import Level, create_demo_level, create_tutorial_level
-from .input_handler import InputHandler
+from .enemies import Enemy
+from .input_handler import (
+    InputHandler, JUMP_BIT, TOGGLE_MAGNETIC_BIT, PAUSE_BIT, RESTART_BIT
+)
 from .renderer import Renderer
 from .physics import check_rect_collision
 
@@ -35,10 +38,16 @@ class Game:
             width: Screen width
             height: Screen height
         """
-        pygame.init()
+        # Only the display and font modules are used, so skip pygame.init()
+        pygame.display.init()
+        pygame.font.init()
         pygame.display.set_caption(TITLE)
         
         self.screen = pygame.display.set_mode((width, height))
+        # Only quit and key events are used, so keep everything else out of
+        # the SDL queue; fetching unfiltered then preserves event order
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed((pygame.QUIT,) + InputHandler.KEY_EVENT_FILTER)
         self.clock = pygame.time.Clock()
         self.running = True
         self.state = GameState.MENU
@@ -54,6 +63,10 @@ class Game:
         self.menu_selection = 0
         self.menu_options = ["Start Game", "Tutorial", "Quit"]
         
+        # Last gameplay frame, reused under overlays while the world is frozen
+        self._frozen_frame: Optional[pygame.Surface] = None
+        self._frozen_state: Optional[GameState] = None
+        
         self._load_levels()
     
     def _load_levels(self) -> None:
@@ -90,8 +103,7 @@ class Game:
             self.state = GameState.PLAYING
             
             # Reset enemies
-            for enemy in self.current_level.enemies:
-                enemy.alive = True
+            self.current_level.enemy_pool.revive_all()
     
     def _next_level(self) -> None:
         """Advance to the next level.
@@ -111,15 +123,24 @@ class Game:
         Processes quit events and updates the input handler.
         
         Returns:
-            List of pygame events that occurred this frame.
+            List of quit and key events that occurred this frame.
         """
+        # The queue only admits quit and key events (see __init__), so an
+        # unfiltered read returns them in the order they happened
         events = pygame.event.get()
-        
+        input_handler = self.input_handler
+        input_handler.begin_frame()
+        if not events:
+            return events
+        
+        # Quit detection and input state share a single pass over the events
+        quit_type = pygame.QUIT
+        feed = input_handler.feed
         for event in events:
-            if event.type == pygame.QUIT:
+            if event.type == quit_type:
                 self.running = False
-        
-        self.input_handler.update(events)
+            else:
+                feed(event)
         return events
     
     def update_menu(self) -> None:
@@ -145,58 +166,66 @@ class Game:
         Handles player input, physics, enemy collisions, goal detection,
         and camera updates during active gameplay.
         """
-        if not self.player or not self.current_level:
+        level = self.current_level
+        player = self.player
+        if not player or not level:
             return
         
+        # Read every just-pressed action at once
+        input_handler = self.input_handler
+        flags = input_handler.snapshot()
+        
         # Handle pause
-        if self.input_handler.is_action_just_pressed('pause'):
+        if flags & PAUSE_BIT:
             self.state = GameState.PAUSED
             return
         
         # Handle restart
-        if self.input_handler.is_action_just_pressed('restart'):
+        if flags & RESTART_BIT:
             self._restart_level()
             return
         
         # Handle player input
-        movement = self.input_handler.get_movement_vector()
-        self.player.move(movement[0], movement[1])
+        movement = input_handler.get_movement_vector()
+        player.move(movement[0], movement[1])
         
-        if self.input_handler.is_action_just_pressed('jump'):
-            self.player.jump()
+        if flags & JUMP_BIT:
+            player.jump()
         
-        if self.input_handler.is_action_just_pressed('toggle_magnetic'):
-            self.player.toggle_magnetic_state()
+        if flags & TOGGLE_MAGNETIC_BIT:
+            player.toggle_magnetic_state()
         
         # Apply magnetic forces from magnets
-        magnetic_force = self.current_level.get_total_magnetic_force(self.player.position)
-        self.player.apply_magnetic_force(magnetic_force)
+        magnetic_force = level.get_total_magnetic_force(player.position)
+        player.apply_magnetic_force(magnetic_force)
         
         # Update player
-        self.player.update(self.current_level.platforms)
+        player.update(level.platform_array)
         
         # Update level (enemies, moving platforms)
-        self.current_level.update()
+        renderer = self.renderer
+        level.update(renderer.camera.rect)
         
         # Check enemy collisions
-        for enemy in self.current_level.enemies:
-            if enemy.check_player_collision(self.player.rect):
+        player_rect = player.rect
+        for obj in level.dynamic_objects_near(player_rect):
+            if isinstance(obj, Enemy) and obj.check_player_collision(player_rect):
                 # Player hit by enemy - game over
                 self.state = GameState.GAME_OVER
                 return
         
         # Check goal
-        if check_rect_collision(self.player.rect, self.current_level.goal_rect):
+        if check_rect_collision(player_rect, level.goal_rect):
             self.state = GameState.LEVEL_COMPLETE
             return
         
         # Check if player fell off level
-        if self.player.y > self.current_level.height + 100:
+        if player.y > level.height + 100:
             self.state = GameState.GAME_OVER
             return
         
         # Update camera
-        self.renderer.update_camera(self.player, self.current_level)
+        renderer.update_camera(player, level)
     
     def update_paused(self) -> None:
         """Update paused state.
@@ -245,12 +274,36 @@ class Game:
         elif self.state == GameState.GAME_OVER:
             self.update_game_over()
     
+    def _draw_frozen_frame(self) -> None:
+        """Draw the gameplay frame shown behind a frozen-state overlay.
+
+        The level and player do not change while paused, on level complete
+        or on game over, so the scene is drawn once when entering one of
+        those states and the copy is blitted on every following frame.
+        """
+        if self._frozen_frame is None or self._frozen_state != self.state:
+            self._frozen_frame = None
+            self._frozen_state = self.state
+            if not (self.current_level and self.player):
+                return
+            self.renderer.draw_level(self.current_level)
+            self.renderer.draw_player(self.player)
+            if self.state == GameState.PAUSED:
+                self.renderer.draw_hud(self.player, self.current_level.name)
+            self._frozen_frame = self.screen.copy()
+        else:
+            self.screen.blit(self._frozen_frame, (0, 0))
+    
     def render(self) -> None:
         """Render the current game state.
         
         Draws the appropriate visuals based on the current game state,
         including menu, gameplay, pause overlay, or game over screens.
         """
+        if self.state not in (GameState.PAUSED, GameState.LEVEL_COMPLETE, GameState.GAME_OVER):
+            self._frozen_frame = None
+            self._frozen_state = None
+        
         if self.state == GameState.MENU:
             self.renderer.draw_menu(TITLE, self.menu_options, self.menu_selection)
         
@@ -261,22 +314,15 @@ class Game:
                 self.renderer.draw_hud(self.player, self.current_level.name)
         
         elif self.state == GameState.PAUSED:
-            if self.current_level and self.player:
-                self.renderer.draw_level(self.current_level)
-                self.renderer.draw_player(self.player)
-                self.renderer.draw_hud(self.player, self.current_level.name)
+            self._draw_frozen_frame()
             self.renderer.draw_pause_overlay()
         
         elif self.state == GameState.LEVEL_COMPLETE:
-            if self.current_level and self.player:
-                self.renderer.draw_level(self.current_level)
-                self.renderer.draw_player(self.player)
+            self._draw_frozen_frame()
             self.renderer.draw_game_over(won=True)
         
         elif self.state == GameState.GAME_OVER:
-            if self.current_level and self.player:
-                self.renderer.draw_level(self.current_level)
-                self.renderer.draw_player(self.player)
+            self._draw_frozen_frame()
             self.renderer.draw_game_over(won=False)
         
         self.renderer.present()
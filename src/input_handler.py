@@ -1,9 +1,55 @@
 """Input handling for keyboard controls."""
 
-from typing import Dict, Callable, Optional, Set
+from typing import Dict, Callable, FrozenSet, Optional, Set, Tuple
+from enum import IntFlag
 import pygame
 
 
+# Plain int bit for each action, for testing snapshot() results without
+# going through IntFlag's Python-level operators every frame
+MOVE_LEFT_BIT = 1 << 0
+MOVE_RIGHT_BIT = 1 << 1
+MOVE_UP_BIT = 1 << 2
+MOVE_DOWN_BIT = 1 << 3
+JUMP_BIT = 1 << 4
+TOGGLE_MAGNETIC_BIT = 1 << 5
+SPRINT_BIT = 1 << 6
+PAUSE_BIT = 1 << 7
+RESTART_BIT = 1 << 8
+
+
+class ActionFlag(IntFlag):
+    """Bit flags for actions, so several actions can be tested on one int."""
+    NONE = 0
+    MOVE_LEFT = MOVE_LEFT_BIT
+    MOVE_RIGHT = MOVE_RIGHT_BIT
+    MOVE_UP = MOVE_UP_BIT
+    MOVE_DOWN = MOVE_DOWN_BIT
+    JUMP = JUMP_BIT
+    TOGGLE_MAGNETIC = TOGGLE_MAGNETIC_BIT
+    SPRINT = SPRINT_BIT
+    PAUSE = PAUSE_BIT
+    RESTART = RESTART_BIT
+
+
+# Bit for each base action name; "<action>_alt" bindings share the bit
+ACTION_FLAGS: Dict[str, int] = {
+    'move_left': MOVE_LEFT_BIT,
+    'move_right': MOVE_RIGHT_BIT,
+    'move_up': MOVE_UP_BIT,
+    'move_down': MOVE_DOWN_BIT,
+    'jump': JUMP_BIT,
+    'toggle_magnetic': TOGGLE_MAGNETIC_BIT,
+    'sprint': SPRINT_BIT,
+    'pause': PAUSE_BIT,
+    'restart': RESTART_BIT,
+}
+
+
+# Resolved (key, alt_key) pair for an action with no binding
+_UNBOUND = (-1, -1)
+
+
 class InputHandler:
     """Handles keyboard input and key mappings."""
     
@@ -24,6 +70,12 @@ class InputHandler:
         'restart': pygame.K_r,
     }
     
+    # Event types the handler reacts to. Filter the queue to these with
+    # pygame.event.set_allowed rather than passing them to
+    # pygame.event.get, which returns events grouped by type instead of
+    # in the order they happened
+    KEY_EVENT_FILTER = (pygame.KEYDOWN, pygame.KEYUP)
+    
     def __init__(self, custom_bindings: Optional[Dict[str, int]] = None):
         """
         Initialize input handler with optional custom key bindings.
@@ -35,9 +87,50 @@ class InputHandler:
         if custom_bindings:
             self.bindings.update(custom_bindings)
         
+        # Key codes are sparse (SDL encodes non-character keys as scancode
+        # | 1 << 30), so key state is kept in sets rather than a dense table
         self.keys_pressed: Set[int] = set()
         self.keys_just_pressed: Set[int] = set()
         self.keys_just_released: Set[int] = set()
+        self._key_flags: Dict[int, int] = {}
+        self._resolved: Dict[str, Tuple[int, int]] = {}
+        self._move_keys: Tuple[int, ...] = ()
+        self._move_key_set: FrozenSet[int] = frozenset()
+        self._rebuild_resolved()
+    
+    def _rebuild_resolved(self) -> None:
+        """Rebuild the lookup tables derived from the bindings.
+        
+        Called whenever the bindings change. Each action is resolved to its
+        (key, alt_key) pair, with -1 for an unbound key, so the is_action_*
+        queries need a single dict lookup. The key-to-flag mapping lets
+        snapshot() translate pressed keys without going through the action
+        names.
+        """
+        bindings = self.bindings
+        resolved: Dict[str, Tuple[int, int]] = {}
+        key_flags: Dict[int, int] = {}
+        for action, key in bindings.items():
+            alt_key = bindings.get(f"{action}_alt")
+            resolved[action] = (key if key else -1, alt_key if alt_key else -1)
+            if action.endswith('_alt') and action[:-4] not in bindings:
+                # An alt key also answers for its unbound primary action
+                resolved[action[:-4]] = (-1, key if key else -1)
+            
+            if not key:
+                continue
+            if action.endswith('_alt'):
+                action = action[:-4]
+            flag = ACTION_FLAGS.get(action)
+            if flag:
+                key_flags[key] = key_flags.get(key, 0) | flag
+        self._resolved = resolved
+        self._key_flags = key_flags
+        self._move_keys = (
+            resolved.get('move_left', _UNBOUND) + resolved.get('move_right', _UNBOUND) +
+            resolved.get('move_up', _UNBOUND) + resolved.get('move_down', _UNBOUND)
+        )
+        self._move_key_set = frozenset(key for key in self._move_keys if key != -1)
     
     def update(self, events: list) -> None:
         """
@@ -46,16 +139,45 @@ class InputHandler:
         Args:
             events: List of pygame events
         """
+        self.begin_frame()
+        for event in events:
+            self.feed(event)
+    
+    def update_from_queue(self) -> None:
+        """Update input state directly from the pygame event queue.
+        
+        Every queued event is fetched, in the order it happened, so a key
+        released and pressed again within one frame ends up pressed.
+        Non-key events are ignored; block them at the SDL level with
+        ``pygame.event.set_allowed(KEY_EVENT_FILTER)`` so they are never
+        queued.
+        """
+        self.update(pygame.event.get())
+    
+    def begin_frame(self) -> None:
+        """Start a new frame of input.
+        
+        Clears the just-pressed and just-released keys. Call once per frame
+        before feeding that frame's events.
+        """
         self.keys_just_pressed.clear()
         self.keys_just_released.clear()
+    
+    def feed(self, event) -> None:
+        """Update input state from a single pygame event.
         
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                self.keys_pressed.add(event.key)
-                self.keys_just_pressed.add(event.key)
-            elif event.type == pygame.KEYUP:
-                self.keys_pressed.discard(event.key)
-                self.keys_just_released.add(event.key)
+        Lets the game loop dispatch events in one pass instead of handing
+        the whole list over for a second scan. Non-key events are ignored.
+        
+        Args:
+            event: A pygame event
+        """
+        if event.type == pygame.KEYDOWN:
+            self.keys_pressed.add(event.key)
+            self.keys_just_pressed.add(event.key)
+        elif event.type == pygame.KEYUP:
+            self.keys_pressed.discard(event.key)
+            self.keys_just_released.add(event.key)
     
     def is_action_pressed(self, action: str) -> bool:
         """Check if an action's key is currently pressed.
@@ -66,14 +188,9 @@ class InputHandler:
         Returns:
             True if the action's key (or alt key) is currently pressed.
         """
-        key = self.bindings.get(action)
-        alt_key = self.bindings.get(f"{action}_alt")
-        
-        if key and key in self.keys_pressed:
-            return True
-        if alt_key and alt_key in self.keys_pressed:
-            return True
-        return False
+        key, alt_key = self._resolved.get(action, _UNBOUND)
+        keys = self.keys_pressed
+        return key in keys or alt_key in keys
     
     def is_action_just_pressed(self, action: str) -> bool:
         """Check if an action's key was just pressed this frame.
@@ -84,14 +201,9 @@ class InputHandler:
         Returns:
             True if the action's key (or alt key) was just pressed this frame.
         """
-        key = self.bindings.get(action)
-        alt_key = self.bindings.get(f"{action}_alt")
-        
-        if key and key in self.keys_just_pressed:
-            return True
-        if alt_key and alt_key in self.keys_just_pressed:
-            return True
-        return False
+        key, alt_key = self._resolved.get(action, _UNBOUND)
+        keys = self.keys_just_pressed
+        return key in keys or alt_key in keys
     
     def is_action_just_released(self, action: str) -> bool:
         """Check if an action's key was just released this frame.
@@ -102,14 +214,29 @@ class InputHandler:
         Returns:
             True if the action's key (or alt key) was just released this frame.
         """
-        key = self.bindings.get(action)
-        alt_key = self.bindings.get(f"{action}_alt")
+        key, alt_key = self._resolved.get(action, _UNBOUND)
+        keys = self.keys_just_released
+        return key in keys or alt_key in keys
+    
+    def snapshot(self) -> int:
+        """Get all actions just pressed this frame as one set of bits.
+        
+        Callers that test several actions per frame can bit-test the
+        result against the ``*_BIT`` constants instead of calling
+        is_action_just_pressed for each one. The result is a plain int;
+        wrap it in ActionFlag only off the per-frame path. Bindings should
+        be changed through set_binding so the key-to-bit mapping stays
+        current.
         
-        if key and key in self.keys_just_released:
-            return True
-        if alt_key and alt_key in self.keys_just_released:
-            return True
-        return False
+        Returns:
+            The bits of every action whose key (or alt key) was just
+            pressed.
+        """
+        flags = 0
+        key_flags = self._key_flags
+        for key in self.keys_just_pressed:
+            flags |= key_flags.get(key, 0)
+        return flags
     
     def get_movement_vector(self) -> tuple:
         """
@@ -118,17 +245,14 @@ class InputHandler:
         Returns:
             Tuple of (horizontal, vertical) movement (-1, 0, or 1 each)
         """
-        horizontal = 0
-        vertical = 0
+        keys = self.keys_pressed
+        if keys.isdisjoint(self._move_key_set):
+            # Idle frame: no movement key held
+            return (0, 0)
         
-        if self.is_action_pressed('move_left'):
-            horizontal -= 1
-        if self.is_action_pressed('move_right'):
-            horizontal += 1
-        if self.is_action_pressed('move_up'):
-            vertical -= 1
-        if self.is_action_pressed('move_down'):
-            vertical += 1
+        left, left_alt, right, right_alt, up, up_alt, down, down_alt = self._move_keys
+        horizontal = (right in keys or right_alt in keys) - (left in keys or left_alt in keys)
+        vertical = (down in keys or down_alt in keys) - (up in keys or up_alt in keys)
         
         return (horizontal, vertical)
     
@@ -140,6 +264,7 @@ class InputHandler:
             key: The pygame key code to bind to the action.
         """
         self.bindings[action] = key
+        self._rebuild_resolved()
     
     def get_binding(self, action: str) -> Optional[int]:
         """Get the key code for an action.
@@ -172,6 +297,7 @@ class InputHandler:
         Restores all key bindings to their original DEFAULT_BINDINGS values.
         """
         self.bindings = self.DEFAULT_BINDINGS.copy()
+        self._rebuild_resolved()
 
 
 class InputAction:
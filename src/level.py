@@ -1,22 +1,76 @@
 """Level class for loading and managing game levels."""
 
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Sequence
 import json
+import math
 import os
 
-from .platforms import Platform, MovingPlatform
+from .platforms import Platform, MovingPlatform, PlatformArray
 from .magnets import Magnet
 from .enemies import Enemy, create_enemy_from_dict
+from .enemy_pool import EnemyPool
+from .spatial import SpatialGrid
+from .quadtree import QuadTree
 from .constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT,
+    SCREEN_WIDTH, SCREEN_HEIGHT, CULL_MARGIN,
     ORIENTATION_FLOOR, ORIENTATION_WALL_LEFT, ORIENTATION_WALL_RIGHT, ORIENTATION_CEILING,
     POLARITY_ATTRACT, POLARITY_REPEL
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Encode level data as indented JSON.
+
+    Uses orjson when it is installed and falls back to the standard
+    library otherwise; both produce the same two-space indented layout.
+
+    Args:
+        data: The level data to encode.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """Decode a JSON level document.
+
+    Args:
+        raw: The raw file contents.
+
+    Returns:
+        Dict[str, Any]: The decoded level data.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Precomputed magnet field: (x, y, range squared, inverse range, signed strength)
+MagnetField = Tuple[float, float, float, float, float]
+
 
 class Level:
     """Manages level data including platforms, magnets, enemies, and goals."""
     
+    __slots__ = (
+        'name', 'platforms', 'magnets', 'enemy_pool', 'player_start',
+        '_goal_position', '_goal_size', '_goal_rect',
+        'width', 'height', 'background_color',
+        '_platform_array', '_dynamic_tree', '_frame', '_dynamic_frame',
+        '_cull_view',
+        '_magnet_grid', '_magnet_count', '_magnet_version', '_magnet_cells',
+        '_magnet_cell_size'
+    )
+    
     def __init__(self, name: str = "Untitled"):
         """
         Initialize an empty level.
@@ -27,13 +81,38 @@ class Level:
         self.name = name
         self.platforms: List[Platform] = []
         self.magnets: List[Magnet] = []
-        self.enemies: List[Enemy] = []
+        self.enemy_pool = EnemyPool()
         self.player_start: Tuple[float, float] = (100, 100)
-        self.goal_position: Tuple[float, float] = (700, 500)
-        self.goal_size: Tuple[float, float] = (50, 50)
+        self._goal_position: Tuple[float, float] = (700, 500)
+        self._goal_size: Tuple[float, float] = (50, 50)
+        self._goal_rect: Optional[Tuple[float, float, float, float]] = None
         self.width = SCREEN_WIDTH
         self.height = SCREEN_HEIGHT
         self.background_color = (30, 30, 40)
+        self._platform_array: Optional[PlatformArray] = None
+        self._dynamic_tree: Optional[QuadTree] = None
+        # Frames advanced by update, and the frame the dynamic tree was
+        # last refreshed for; -1 forces a refresh on the next query
+        self._frame = 0
+        self._dynamic_frame = -1
+        # Culling rect passed to the last update, None for no culling
+        self._cull_view: Optional[Tuple[float, float, float, float]] = None
+        self._magnet_grid: Optional[SpatialGrid] = None
+        self._magnet_count = 0
+        self._magnet_version = -1
+        # Active magnet fields reaching each grid cell, as rows of
+        # (x, y, range squared, inverse range, signed strength)
+        self._magnet_cells: Dict[Tuple[int, int], Tuple[MagnetField, ...]] = {}
+        self._magnet_cell_size = 1
+    
+    @property
+    def enemies(self) -> List[Enemy]:
+        """Get the level's enemies.
+
+        Returns:
+            The list of enemies owned by the level's enemy pool.
+        """
+        return self.enemy_pool.enemies
     
     def add_platform(self, platform: Platform) -> None:
         """Add a platform to the level.
@@ -42,6 +121,8 @@ class Level:
             platform: The platform to add to the level's platform list.
         """
         self.platforms.append(platform)
+        self._platform_array = None
+        self._dynamic_frame = -1
     
     def add_magnet(self, magnet: Magnet) -> None:
         """Add a magnet to the level.
@@ -50,6 +131,7 @@ class Level:
             magnet: The magnet to add to the level's magnet list.
         """
         self.magnets.append(magnet)
+        self._magnet_grid = None
     
     def add_enemy(self, enemy: Enemy) -> None:
         """Add an enemy to the level.
@@ -57,7 +139,8 @@ class Level:
         Args:
             enemy: The enemy to add to the level's enemy list.
         """
-        self.enemies.append(enemy)
+        self.enemy_pool.add(enemy)
+        self._dynamic_frame = -1
     
     def set_player_start(self, x: float, y: float) -> None:
         """Set player starting position.
@@ -80,19 +163,270 @@ class Level:
         self.goal_position = (x, y)
         self.goal_size = (width, height)
     
+    @property
+    def goal_position(self) -> Tuple[float, float]:
+        """Get the goal position.
+
+        Returns:
+            The (x, y) coordinates of the goal area's top-left corner.
+        """
+        return self._goal_position
+    
+    @goal_position.setter
+    def goal_position(self, value: Tuple[float, float]) -> None:
+        """Set the goal position and invalidate the cached goal rect.
+
+        Args:
+            value: The new (x, y) coordinates of the goal area.
+        """
+        self._goal_position = value
+        self._goal_rect = None
+    
+    @property
+    def goal_size(self) -> Tuple[float, float]:
+        """Get the goal size.
+
+        Returns:
+            The (width, height) of the goal area.
+        """
+        return self._goal_size
+    
+    @goal_size.setter
+    def goal_size(self, value: Tuple[float, float]) -> None:
+        """Set the goal size and invalidate the cached goal rect.
+
+        Args:
+            value: The new (width, height) of the goal area.
+        """
+        self._goal_size = value
+        self._goal_rect = None
+    
     @property
     def goal_rect(self) -> Tuple[float, float, float, float]:
         """Get goal bounding rect.
 
+        The tuple is built once and reused until the goal moves or resizes.
+
         Returns:
             A tuple containing (x, y, width, height) of the goal area.
         """
-        return (
-            self.goal_position[0],
-            self.goal_position[1],
-            self.goal_size[0],
-            self.goal_size[1]
-        )
+        goal_rect = self._goal_rect
+        if goal_rect is None:
+            position = self._goal_position
+            size = self._goal_size
+            goal_rect = (position[0], position[1], size[0], size[1])
+            self._goal_rect = goal_rect
+        return goal_rect
+    
+    def refresh_platforms(self) -> None:
+        """Drop cached platform data so it is rebuilt on the next query.
+
+        Platforms added with ``add_platform`` and moving platforms advanced
+        by ``update`` are picked up automatically. Call this after moving or
+        resizing a static platform, or after editing ``platforms`` in place,
+        e.g. replacing one of its items.
+        """
+        self._platform_array = None
+    
+    def _get_platform_array(self) -> PlatformArray:
+        """Get the platform array, rebuilding it if stale.
+
+        The array buckets static platforms in a spatial grid once by their
+        bounds. Moving platforms change position every frame, so they are
+        kept out of the grid and returned by every query instead. The array
+        is rebuilt after ``add_platform`` or ``refresh_platforms``, or when
+        the platform count changes.
+
+        Returns:
+            The platform array, in level order.
+        """
+        platform_array = self._platform_array
+        if platform_array is None or len(platform_array) != len(self.platforms):
+            platform_array = PlatformArray(self.platforms)
+            self._platform_array = platform_array
+        return platform_array
+    
+    @property
+    def platform_array(self) -> PlatformArray:
+        """Get the level's platforms as parallel columns.
+
+        Moving platform rows are refreshed by ``update``.
+
+        Returns:
+            The platform array, in level order.
+        """
+        return self._get_platform_array()
+    
+    def platforms_near(self, rect: Tuple[float, float, float, float]) -> List[Platform]:
+        """Get platforms that may overlap a rect.
+
+        Args:
+            rect: The query rect as (x, y, width, height).
+
+        Returns:
+            Candidate platforms in level order. Every platform that overlaps
+            the rect is included; nearby non-overlapping ones may be too.
+        """
+        platforms = self.platforms
+        return [platforms[index] for index in self._get_platform_array().candidates_near(rect)]
+    
+    def platform_rects_near(
+        self,
+        rect: Tuple[float, float, float, float]
+    ) -> List[Tuple[float, float, float, float]]:
+        """Get the rects of platforms that may overlap a rect.
+
+        Args:
+            rect: The query rect as (x, y, width, height).
+
+        Returns:
+            Bounding rects of the candidate platforms, in level order.
+        """
+        return [platform.rect for platform in self.platforms_near(rect)]
+    
+    def update_dynamic_index(self) -> None:
+        """Refresh the quadtree of enemies and moving platforms.
+
+        Only living enemies that the last ``update`` advanced are indexed;
+        dead ones and walking enemies frozen outside its culling view are
+        left out. Moved objects are updated in place. If more than a
+        quarter of them moved since the last refresh, or the indexed set
+        changed, the tree is rebuilt from scratch instead, which is cheaper
+        than many individual moves.
+        """
+        platform_array = self._get_platform_array()
+        objects: List[Any] = self.enemy_pool.awake(self._cull_view)
+        objects.extend(platform_array[index] for index in platform_array.moving_indices)
+        self._dynamic_frame = self._frame
+        
+        tree = self._dynamic_tree
+        if tree is not None and len(tree) == len(objects):
+            moved = [obj for obj in objects if tree.rect_of(obj) != obj.rect]
+            # Same count and every moved object already stored means the
+            # indexed set is unchanged, since absent objects count as moved
+            if len(moved) * 4 <= len(objects) and all(obj in tree for obj in moved):
+                for obj in moved:
+                    tree.move(obj, obj.rect)
+                return
+        
+        tree = QuadTree((0, 0, self.width, self.height))
+        for obj in objects:
+            tree.insert(obj, obj.rect)
+        self._dynamic_tree = tree
+    
+    def dynamic_objects_near(self, rect: Tuple[float, float, float, float]) -> List[Any]:
+        """Get enemies and moving platforms overlapping a rect.
+
+        The index is refreshed at most once per ``update``, by the first
+        query after it, so frames that never query it pay nothing.
+
+        Args:
+            rect: The query rect as (x, y, width, height).
+
+        Returns:
+            The awake living enemies and moving platforms whose bounds
+            overlap the rect.
+        """
+        if self._dynamic_frame != self._frame:
+            self.update_dynamic_index()
+        return self._dynamic_tree.query(rect)
+    
+    def enemies_in_view(self, rect: Tuple[float, float, float, float]) -> List[Enemy]:
+        """Get the living enemies overlapping a view rect.
+
+        Args:
+            rect: The view rect as (x, y, width, height).
+
+        Returns:
+            The living enemies inside the view, in no particular order.
+        """
+        return [
+            obj for obj in self.dynamic_objects_near(rect)
+            if isinstance(obj, Enemy) and obj.alive
+        ]
+    
+    def magnets_in_view(self, rect: Tuple[float, float, float, float]) -> List[Magnet]:
+        """Get the active magnets whose drawing overlaps a view rect.
+
+        A magnet is drawn as its range circle around its core, so its
+        extent is the larger of the two, padded by a pixel for the
+        truncation to screen coordinates.
+
+        Args:
+            rect: The view rect as (x, y, width, height).
+
+        Returns:
+            The visible active magnets, in level order.
+        """
+        vx, vy, vw, vh = rect
+        right = vx + vw
+        bottom = vy + vh
+        visible = []
+        for magnet in self.magnets:
+            if not magnet.active:
+                continue
+            half_w = max(magnet.range, magnet.width / 2) + 1
+            half_h = max(magnet.range, magnet.height / 2) + 1
+            if (magnet.x - half_w < right and magnet.x + half_w > vx and
+                    magnet.y - half_h < bottom and magnet.y + half_h > vy):
+                visible.append(magnet)
+        return visible
+    
+    def refresh_magnets(self) -> None:
+        """Drop cached magnet data so it is rebuilt on the next query.
+
+        Adding magnets and changing a magnet's position, range, strength,
+        polarity or active state are picked up automatically. Call this
+        after editing ``magnets`` in place, e.g. replacing one of its items.
+        """
+        self._magnet_grid = None
+    
+    def _get_magnet_grid(self) -> SpatialGrid:
+        """Get the spatial grid of magnet fields, rebuilding it if stale.
+
+        Each active magnet is bucketed by the square bounding its field,
+        using a cell size equal to the largest magnet range, so a point
+        query only returns the few magnets whose field may reach it. Each
+        cell's magnets are also flattened into a tuple of field rows holding
+        position, squared range, inverse range and strength, with repelling
+        magnets given a negative strength, so the force loop unpacks plain
+        floats and needs no per-magnet division by the range. The grid is
+        rebuilt when the magnet count or ``Magnet.field_version`` changes.
+
+        Returns:
+            The grid mapping cells to magnet field rows.
+        """
+        grid = self._magnet_grid
+        if (grid is None or self._magnet_count != len(self.magnets) or
+                self._magnet_version != Magnet.field_version):
+            cell_size = max(max((magnet.range for magnet in self.magnets), default=0), 1)
+            grid = SpatialGrid(cell_size)
+            for magnet in self.magnets:
+                if not magnet.active:
+                    continue
+                field_range = magnet.range
+                grid.insert((
+                    magnet.x,
+                    magnet.y,
+                    magnet.range_squared,
+                    1 / field_range if field_range else 0.0,
+                    magnet.signed_strength
+                ), (
+                    magnet.x - field_range,
+                    magnet.y - field_range,
+                    field_range * 2,
+                    field_range * 2
+                ))
+            fields = grid.items
+            self._magnet_cells = {
+                key: tuple(fields[field_id] for field_id in bucket)
+                for key, bucket in grid.cells.items()
+            }
+            self._magnet_cell_size = cell_size
+            self._magnet_grid = grid
+            self._magnet_count = len(self.magnets)
+            self._magnet_version = Magnet.field_version
+        return grid
     
     def get_total_magnetic_force(self, position: Tuple[float, float]) -> Tuple[float, float]:
         """Calculate total magnetic force at a position from all magnets.
@@ -103,33 +437,79 @@ class Level:
         Returns:
             A tuple (fx, fy) representing the total magnetic force vector.
         """
-        total_fx, total_fy = 0.0, 0.0
-        
-        for magnet in self.magnets:
-            force = magnet.get_force_on_object(position)
-            total_fx += force[0]
-            total_fy += force[1]
+        return self.get_magnetic_forces((position,))[0]
+    
+    def get_magnetic_forces(
+        self,
+        positions: Sequence[Tuple[float, float]]
+    ) -> List[Tuple[float, float]]:
+        """Calculate total magnetic force at many positions in one pass.
+
+        The magnet grid is looked up once for the whole batch. For each
+        position only the field rows of its grid cell are considered, and
+        their force is computed directly from the rows using the same
+        falloff as ``calculate_magnetic_force``.
+
+        Args:
+            positions: The (x, y) positions to calculate force at.
+
+        Returns:
+            The total (fx, fy) force at each position, in the same order.
+        """
+        self._get_magnet_grid()
+        cells_get = self._magnet_cells.get
+        size = self._magnet_cell_size
+        sqrt = math.sqrt
         
-        return (total_fx, total_fy)
+        forces = []
+        for px, py in positions:
+            total_fx, total_fy = 0.0, 0.0
+            for mx, my, range_sq, inv_range, strength in cells_get(
+                    (int(px // size), int(py // size)), ()):
+                dx = mx - px
+                dy = my - py
+                distance_sq = dx * dx + dy * dy
+                if distance_sq > range_sq or distance_sq == 0:
+                    continue
+                distance = sqrt(distance_sq)
+                falloff = 1 - distance * inv_range
+                # Fold the direction normalization into the magnitude
+                scale = strength * falloff * falloff / distance
+                total_fx += dx * scale
+                total_fy += dy * scale
+            forces.append((total_fx, total_fy))
+        return forces
     
-    def update(self) -> None:
+    def update(self, view: Optional[Tuple[float, float, float, float]] = None) -> None:
         """Update all level elements.
 
         Updates moving platforms and enemies, applying magnetic forces to
         magnetic enemies.
+
+        Args:
+            view: Optional camera rect as (x, y, width, height). When given,
+                walking enemies farther than CULL_MARGIN outside it are not
+                updated.
         """
-        # Update moving platforms
-        for platform in self.platforms:
-            if isinstance(platform, MovingPlatform):
-                platform.update()
+        # Update moving platforms in one batch; the static ones are skipped
+        # without a type check each
+        self._get_platform_array().update_moving()
+        
+        if view is not None:
+            x, y, w, h = view
+            view = (x - CULL_MARGIN, y - CULL_MARGIN, w + 2 * CULL_MARGIN, h + 2 * CULL_MARGIN)
+        
+        # Apply magnetic forces and update enemies in one batched pass
+        self.enemy_pool.update_all(
+            self.platform_rects_near,
+            view,
+            self.get_magnetic_forces
+        )
         
-        # Update enemies
-        for enemy in self.enemies:
-            # Apply magnetic forces to enemies
-            if enemy.is_magnetic:
-                force = self.get_total_magnetic_force(enemy.position)
-                enemy.apply_magnetic_force(force)
-            enemy.update(self.platforms)
+        # The broad-phase index of moving objects is now stale; it is
+        # refreshed by the next dynamic_objects_near query
+        self._cull_view = view
+        self._frame += 1
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize level to dictionary.
@@ -156,8 +536,8 @@ class Level:
         Args:
             filepath: The path to the file where the level will be saved.
         """
-        with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(_dumps(self.to_dict()))
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Level':
@@ -205,8 +585,8 @@ class Level:
         Returns:
             A new Level instance populated with data from the file.
         """
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            data = _loads(f.read())
         return cls.from_dict(data)
 
 
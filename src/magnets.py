@@ -1,6 +1,6 @@
 """Magnet class for magnetic zones that attract or repel objects."""
 
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 import pygame
 
 from .constants import (
@@ -8,12 +8,25 @@ from .constants import (
     POLARITY_ATTRACT, POLARITY_REPEL,
     COLOR_MAGNETIC_BLUE, COLOR_MAGNETIC_RED
 )
-from .physics import calculate_magnetic_force
+from .physics import calculate_distance_sq, magnetic_force_xy
 
 
 class Magnet:
     """A magnetic zone that can attract or repel objects."""
     
+    __slots__ = (
+        'width', 'height', '_x', '_y', '_strength', '_active',
+        '_polarity', '_sign', '_range', '_range_sq'
+    )
+    
+    # Bumped whenever any magnet's position, range, strength, polarity or
+    # active state changes, so cached field data can tell it is stale
+    field_version = 0
+    
+    # Range indicator surfaces shared by all magnets, keyed by
+    # (range, color, polarity) and rendered on first use
+    _range_surface_cache: Dict[Tuple[float, Tuple[int, int, int], str], pygame.Surface] = {}
+    
     def __init__(
         self,
         x: float,
@@ -54,6 +67,142 @@ class Magnet:
         """
         return (self.x, self.y)
     
+    @property
+    def x(self) -> float:
+        """Get the X position of the magnet center.
+
+        Returns:
+            float: The center X coordinate.
+        """
+        return self._x
+    
+    @x.setter
+    def x(self, value: float) -> None:
+        """Set the center X position.
+
+        Args:
+            value: The new center X coordinate.
+        """
+        self._x = value
+        Magnet.field_version += 1
+    
+    @property
+    def y(self) -> float:
+        """Get the Y position of the magnet center.
+
+        Returns:
+            float: The center Y coordinate.
+        """
+        return self._y
+    
+    @y.setter
+    def y(self, value: float) -> None:
+        """Set the center Y position.
+
+        Args:
+            value: The new center Y coordinate.
+        """
+        self._y = value
+        Magnet.field_version += 1
+    
+    @property
+    def strength(self) -> float:
+        """Get the force multiplier.
+
+        Returns:
+            float: The unsigned field strength.
+        """
+        return self._strength
+    
+    @strength.setter
+    def strength(self, value: float) -> None:
+        """Set the force multiplier.
+
+        Args:
+            value: The new unsigned field strength.
+        """
+        self._strength = value
+        Magnet.field_version += 1
+    
+    @property
+    def active(self) -> bool:
+        """Get whether the magnet is switched on.
+
+        Returns:
+            bool: True if the field is active.
+        """
+        return self._active
+    
+    @active.setter
+    def active(self, value: bool) -> None:
+        """Switch the magnet on or off.
+
+        Args:
+            value: True to activate the field.
+        """
+        self._active = value
+        Magnet.field_version += 1
+    
+    @property
+    def polarity(self) -> str:
+        """Get the magnet polarity.
+
+        Returns:
+            str: POLARITY_ATTRACT or POLARITY_REPEL.
+        """
+        return self._polarity
+    
+    @polarity.setter
+    def polarity(self, value: str) -> None:
+        """Set the polarity, keeping the strength sign in step.
+
+        Args:
+            value: The new polarity.
+        """
+        self._polarity = value
+        # +1.0 to attract, -1.0 to repel
+        self._sign = -1.0 if value == POLARITY_REPEL else 1.0
+        Magnet.field_version += 1
+    
+    @property
+    def range(self) -> float:
+        """Get the effective range of the magnetic field.
+
+        Returns:
+            float: The field radius.
+        """
+        return self._range
+    
+    @range.setter
+    def range(self, value: float) -> None:
+        """Set the field range, keeping its square in step.
+
+        Args:
+            value: The new field radius.
+        """
+        self._range = value
+        self._range_sq = value * value
+        Magnet.field_version += 1
+    
+    @property
+    def range_squared(self) -> float:
+        """Get the square of the field range.
+
+        Returns:
+            float: The field radius squared, for comparing against squared
+                distances.
+        """
+        return self._range_sq
+    
+    @property
+    def signed_strength(self) -> float:
+        """Get strength with polarity folded into its sign.
+
+        Returns:
+            float: The strength, negated if the magnet repels.
+        """
+        return self.strength * self._sign
+    
     @property
     def rect(self) -> Tuple[float, float, float, float]:
         """Get magnet bounding rect.
@@ -77,17 +226,28 @@ class Magnet:
 
         Returns:
             Tuple[float, float]: The (x, y) force vector applied to the object.
-                Returns (0.0, 0.0) if the magnet is inactive.
+                Returns (0.0, 0.0) if the magnet is inactive or the object is
+                out of range.
         """
         if not self.active:
             return (0.0, 0.0)
         
-        return calculate_magnetic_force(
-            object_pos,
-            self.position,
-            self.range,
-            self.strength,
-            self.polarity
+        # Reject objects outside the field's bounding square with plain
+        # comparisons; magnetic_force_xy does the exact circle test
+        field_range = self._range
+        object_x, object_y = object_pos
+        magnet_x = self._x
+        magnet_y = self._y
+        dx = object_x - magnet_x
+        dy = object_y - magnet_y
+        if dx > field_range or dx < -field_range or dy > field_range or dy < -field_range:
+            return (0.0, 0.0)
+        
+        return magnetic_force_xy(
+            object_x, object_y,
+            magnet_x, magnet_y,
+            field_range,
+            self._strength * self._sign
         )
     
     def is_in_range(self, object_pos: Tuple[float, float]) -> bool:
@@ -100,8 +260,7 @@ class Magnet:
             bool: True if the object is within the magnet's effective range,
                 False otherwise.
         """
-        from .physics import calculate_distance
-        return calculate_distance(object_pos, self.position) <= self.range
+        return calculate_distance_sq((self._x, self._y), object_pos) <= self._range_sq
     
     def toggle(self) -> None:
         """Toggle magnet on/off.
@@ -132,6 +291,36 @@ class Magnet:
             return COLOR_MAGNETIC_BLUE
         return COLOR_MAGNETIC_RED
     
+    def _get_range_surface(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Get the semi-transparent range indicator surface for this magnet.
+
+        The surface depends only on range, color and polarity, so it is
+        rendered once and shared by every magnet with the same values.
+
+        Args:
+            color: The RGB color of the indicator.
+
+        Returns:
+            pygame.Surface: A per-pixel alpha surface with the range circle.
+        """
+        key = (self.range, color, self.polarity)
+        range_surface = Magnet._range_surface_cache.get(key)
+        if range_surface is None:
+            range_surface = pygame.Surface((self.range * 2, self.range * 2), pygame.SRCALPHA)
+            pygame.draw.circle(
+                range_surface,
+                (*color, 50),
+                (self.range, self.range),
+                int(self.range)
+            )
+            try:
+                range_surface = range_surface.convert_alpha()
+            except pygame.error:
+                # No display mode set yet; the unconverted surface still works
+                pass
+            Magnet._range_surface_cache[key] = range_surface
+        return range_surface
+    
     def draw(self, surface: pygame.Surface, camera_offset: Tuple[float, float] = (0, 0)) -> None:
         """Draw the magnet.
 
@@ -148,14 +337,8 @@ class Magnet:
             return
         
         # Draw range indicator (semi-transparent)
-        range_surface = pygame.Surface((self.range * 2, self.range * 2), pygame.SRCALPHA)
         color = self.get_color()
-        pygame.draw.circle(
-            range_surface,
-            (*color, 50),
-            (self.range, self.range),
-            int(self.range)
-        )
+        range_surface = self._get_range_surface(color)
         
         screen_x = int(self.x - self.range - camera_offset[0])
         screen_y = int(self.y - self.range - camera_offset[1])
@@ -1,12 +1,13 @@
 """Physics engine for magnetic interactions, gravity, and collisions."""
 
 import math
-from typing import Tuple, List, Optional, TYPE_CHECKING
+from typing import Tuple, TYPE_CHECKING
 
 from .constants import (
     GRAVITY, MAX_FALL_SPEED, FRICTION, AIR_RESISTANCE,
     MAGNETIC_STATE_STICKING, POLARITY_ATTRACT, POLARITY_REPEL,
-    ORIENTATION_FLOOR, ORIENTATION_CEILING, ORIENTATION_WALL_LEFT, ORIENTATION_WALL_RIGHT
+    ORIENTATION_FLOOR, ORIENTATION_CEILING, ORIENTATION_WALL_LEFT, ORIENTATION_WALL_RIGHT,
+    ORIENTATION_NONE
 )
 
 if TYPE_CHECKING:
@@ -30,6 +31,24 @@ def calculate_distance(pos1: Tuple[float, float], pos2: Tuple[float, float]) ->
     return math.sqrt(dx * dx + dy * dy)
 
 
+def calculate_distance_sq(pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
+    """Calculate squared Euclidean distance between two points.
+
+    Cheaper than ``calculate_distance`` because it skips the sqrt; compare
+    it against a squared threshold for range checks.
+
+    Args:
+        pos1: First point as (x, y) coordinates.
+        pos2: Second point as (x, y) coordinates.
+
+    Returns:
+        The squared Euclidean distance between the two points.
+    """
+    dx = pos2[0] - pos1[0]
+    dy = pos2[1] - pos1[1]
+    return dx * dx + dy * dy
+
+
 def calculate_direction(from_pos: Tuple[float, float], to_pos: Tuple[float, float]) -> Tuple[float, float]:
     """Calculate normalized direction vector from one point to another.
 
@@ -39,25 +58,40 @@ def calculate_direction(from_pos: Tuple[float, float], to_pos: Tuple[float, floa
 
     Returns:
         A normalized direction vector (dx, dy) pointing from from_pos to to_pos.
-        Returns (0.0, 0.0) if the points are identical.
+        Returns (0.0, 0.0) if the points are identical or so close that
+        the squared distance underflows to zero.
     """
     dx = to_pos[0] - from_pos[0]
     dy = to_pos[1] - from_pos[1]
-    distance = calculate_distance(from_pos, to_pos)
-    
+    distance = math.sqrt(dx * dx + dy * dy)
     if distance == 0:
         return (0.0, 0.0)
     
     return (dx / distance, dy / distance)
 
 
-def apply_gravity(velocity_y: float, magnetic_state: str, surface_orientation: Optional[str] = None) -> float:
+def apply_gravity_free(velocity_y: float) -> float:
+    """Apply gravity to the vertical velocity of a free-falling object.
+
+    Callers that already know the object is not sticking use this to skip
+    the magnetic state check in ``apply_gravity``.
+
+    Args:
+        velocity_y: Current vertical velocity.
+
+    Returns:
+        The updated vertical velocity, capped at MAX_FALL_SPEED.
+    """
+    new_velocity = velocity_y + GRAVITY
+    return new_velocity if new_velocity < MAX_FALL_SPEED else MAX_FALL_SPEED
+
+
+def apply_gravity(velocity_y: float, magnetic_state: int) -> float:
     """Apply gravity to vertical velocity based on magnetic state.
 
     Args:
         velocity_y: Current vertical velocity.
         magnetic_state: The player's magnetic state (e.g., MAGNETIC_STATE_STICKING).
-        surface_orientation: Optional orientation of the surface the player is on.
 
     Returns:
         The updated vertical velocity after applying gravity, capped at MAX_FALL_SPEED.
@@ -65,9 +99,7 @@ def apply_gravity(velocity_y: float, magnetic_state: str, surface_orientation: O
     """
     if magnetic_state == MAGNETIC_STATE_STICKING:
         return 0.0
-    
-    new_velocity = velocity_y + GRAVITY
-    return min(new_velocity, MAX_FALL_SPEED)
+    return apply_gravity_free(velocity_y)
 
 
 def apply_friction(velocity_x: float, on_ground: bool) -> float:
@@ -86,6 +118,80 @@ def apply_friction(velocity_x: float, on_ground: bool) -> float:
     return velocity_x * AIR_RESISTANCE
 
 
+def integrate_velocity(
+    velocity_x: float,
+    velocity_y: float,
+    on_ground: bool,
+    magnetic_state: int
+) -> Tuple[float, float]:
+    """Apply gravity and friction to a velocity in one step.
+
+    Gravity and friction are fused so a frame's velocity update costs one
+    call. Gravity is skipped entirely while sticking, leaving the vertical
+    velocity for surface movement as it is.
+
+    Args:
+        velocity_x: Current horizontal velocity.
+        velocity_y: Current vertical velocity.
+        on_ground: Whether the object is on the ground.
+        magnetic_state: The object's magnetic state.
+
+    Returns:
+        The updated velocity (vx, vy), with the vertical component capped
+        at MAX_FALL_SPEED when gravity is applied.
+    """
+    if magnetic_state != MAGNETIC_STATE_STICKING:
+        velocity_y += GRAVITY
+        if velocity_y > MAX_FALL_SPEED:
+            velocity_y = MAX_FALL_SPEED
+    if on_ground:
+        return velocity_x * FRICTION, velocity_y
+    return velocity_x * AIR_RESISTANCE, velocity_y
+
+
+def magnetic_force_xy(
+    object_x: float,
+    object_y: float,
+    magnet_x: float,
+    magnet_y: float,
+    magnet_range: float,
+    signed_strength: float
+) -> Tuple[float, float]:
+    """Calculate magnetic force from scalar coordinates.
+
+    Same result as ``calculate_magnetic_force``, but takes positions as
+    separate floats so hot callers need not pack them into tuples, and
+    folds polarity into the sign of the strength so no branch is needed.
+
+    Args:
+        object_x: X position of the affected object.
+        object_y: Y position of the affected object.
+        magnet_x: X position of the magnet.
+        magnet_y: Y position of the magnet.
+        magnet_range: Maximum effective range of the magnet.
+        signed_strength: Base strength of the magnetic force, negated for
+            a repelling magnet.
+
+    Returns:
+        A force vector (fx, fy) representing the magnetic force. Returns
+        (0.0, 0.0) if the object is out of range or at the magnet's position.
+    """
+    dx = magnet_x - object_x
+    dy = magnet_y - object_y
+    distance_sq = dx * dx + dy * dy
+    
+    # Reject on squared distance so out-of-range objects skip the sqrt
+    if distance_sq > magnet_range * magnet_range or distance_sq == 0:
+        return (0.0, 0.0)
+    
+    distance = math.sqrt(distance_sq)
+    # Force decreases with distance squared (inverse square law)
+    falloff = 1 - (distance / magnet_range)
+    scale = signed_strength * falloff * falloff / distance
+    
+    return (dx * scale, dy * scale)
+
+
 def calculate_magnetic_force(
     object_pos: Tuple[float, float],
     magnet_pos: Tuple[float, float],
@@ -109,21 +215,14 @@ def calculate_magnetic_force(
         A force vector (fx, fy) representing the magnetic force. Returns
         (0.0, 0.0) if the object is out of range or at the magnet's position.
     """
-    distance = calculate_distance(object_pos, magnet_pos)
-    
-    if distance > magnet_range or distance == 0:
-        return (0.0, 0.0)
-    
-    # Force decreases with distance squared (inverse square law)
-    force_magnitude = magnet_strength * (1 - (distance / magnet_range)) ** 2
-    
-    direction = calculate_direction(object_pos, magnet_pos)
-    
     # Reverse direction for repel
     if polarity == POLARITY_REPEL:
-        direction = (-direction[0], -direction[1])
-    
-    return (direction[0] * force_magnitude, direction[1] * force_magnitude)
+        magnet_strength = -magnet_strength
+    return magnetic_force_xy(
+        object_pos[0], object_pos[1],
+        magnet_pos[0], magnet_pos[1],
+        magnet_range, magnet_strength
+    )
 
 
 def check_rect_collision(
@@ -148,11 +247,69 @@ def check_rect_collision(
             y1 + h1 > y2)
 
 
+def resolve_collision_xy(
+    px: float,
+    py: float,
+    pw: float,
+    ph: float,
+    vx: float,
+    vy: float,
+    left: float,
+    top: float,
+    right: float,
+    bottom: float
+) -> Tuple[float, float, float, float, int]:
+    """Resolve a player/platform collision from scalar values.
+
+    Same result as ``resolve_collision``, but takes the player rect and
+    velocity as floats and the platform as its four edges, and returns a
+    flat tuple, so callers holding precomputed edge columns build no
+    intermediate tuples.
+
+    Args:
+        px: Player X position.
+        py: Player Y position.
+        pw: Player width.
+        ph: Player height.
+        vx: Player horizontal velocity.
+        vy: Player vertical velocity.
+        left: Platform left edge.
+        top: Platform top edge.
+        right: Platform right edge.
+        bottom: Platform bottom edge.
+
+    Returns:
+        The resolved (x, y, vx, vy, collision_side), where collision_side is
+        an orientation constant or ORIENTATION_NONE if no resolution.
+    """
+    # Calculate overlap on each axis
+    overlap_left = (px + pw) - left
+    overlap_right = right - px
+    overlap_top = (py + ph) - top
+    overlap_bottom = bottom - py
+    
+    # Resolve along the side of least penetration, trying sides in a fixed
+    # priority order so ties and velocity guards behave predictably; each
+    # side returns its result directly instead of patching temporaries
+    min_overlap = min(overlap_left, overlap_right, overlap_top, overlap_bottom)
+    
+    if min_overlap == overlap_top and vy >= 0:
+        return (px, top - ph, vx, 0, ORIENTATION_FLOOR)
+    if min_overlap == overlap_bottom and vy <= 0:
+        return (px, bottom, vx, 0, ORIENTATION_CEILING)
+    if min_overlap == overlap_left and vx >= 0:
+        return (left - pw, py, 0, vy, ORIENTATION_WALL_RIGHT)
+    if min_overlap == overlap_right and vx <= 0:
+        return (right, py, 0, vy, ORIENTATION_WALL_LEFT)
+    
+    return (px, py, vx, vy, ORIENTATION_NONE)
+
+
 def resolve_collision(
     player_rect: Tuple[float, float, float, float],
     platform_rect: Tuple[float, float, float, float],
     velocity: Tuple[float, float]
-) -> Tuple[Tuple[float, float], Tuple[float, float], str]:
+) -> Tuple[Tuple[float, float], Tuple[float, float], int]:
     """Resolve collision between player and platform.
 
     Determines the collision side based on minimum overlap and adjusts the
@@ -169,46 +326,31 @@ def resolve_collision(
             - new_velocity: Updated player velocity as (vx, vy).
             - collision_side: The side of collision (ORIENTATION_FLOOR,
               ORIENTATION_CEILING, ORIENTATION_WALL_LEFT, or
-              ORIENTATION_WALL_RIGHT), or empty string if no resolution.
+              ORIENTATION_WALL_RIGHT), or ORIENTATION_NONE if no resolution.
     """
     px, py, pw, ph = player_rect
     plat_x, plat_y, plat_w, plat_h = platform_rect
-    vx, vy = velocity
-    
-    # Calculate overlap on each axis
-    overlap_left = (px + pw) - plat_x
-    overlap_right = (plat_x + plat_w) - px
-    overlap_top = (py + ph) - plat_y
-    overlap_bottom = (plat_y + plat_h) - py
-    
-    # Find minimum overlap
-    min_overlap = min(overlap_left, overlap_right, overlap_top, overlap_bottom)
-    
-    new_x, new_y = px, py
-    new_vx, new_vy = vx, vy
-    collision_side = ""
-    
-    if min_overlap == overlap_top and vy >= 0:
-        new_y = plat_y - ph
-        new_vy = 0
-        collision_side = ORIENTATION_FLOOR
-    elif min_overlap == overlap_bottom and vy <= 0:
-        new_y = plat_y + plat_h
-        new_vy = 0
-        collision_side = ORIENTATION_CEILING
-    elif min_overlap == overlap_left and vx >= 0:
-        new_x = plat_x - pw
-        new_vx = 0
-        collision_side = ORIENTATION_WALL_RIGHT
-    elif min_overlap == overlap_right and vx <= 0:
-        new_x = plat_x + plat_w
-        new_vx = 0
-        collision_side = ORIENTATION_WALL_LEFT
-    
-    return ((new_x, new_y), (new_vx, new_vy), collision_side)
-
-
-def get_surface_normal(orientation: str) -> Tuple[float, float]:
+    x, y, vx, vy, side = resolve_collision_xy(
+        px, py, pw, ph, velocity[0], velocity[1],
+        plat_x, plat_y, plat_x + plat_w, plat_y + plat_h
+    )
+    return ((x, y), (vx, vy), side)
+
+
+# Shared surface normals, returned as-is so lookups build no new tuples
+_FLOOR_NORMAL = (0, -1)
+_CEILING_NORMAL = (0, 1)
+_WALL_LEFT_NORMAL = (1, 0)
+_WALL_RIGHT_NORMAL = (-1, 0)
+_SURFACE_NORMALS = {
+    ORIENTATION_FLOOR: _FLOOR_NORMAL,
+    ORIENTATION_CEILING: _CEILING_NORMAL,
+    ORIENTATION_WALL_LEFT: _WALL_LEFT_NORMAL,
+    ORIENTATION_WALL_RIGHT: _WALL_RIGHT_NORMAL,
+}
+
+
+def get_surface_normal(orientation: int) -> Tuple[float, float]:
     """Get the normal vector for a surface orientation.
 
     Args:
@@ -219,18 +361,45 @@ def get_surface_normal(orientation: str) -> Tuple[float, float]:
         A unit normal vector (nx, ny) pointing away from the surface.
         Defaults to (0, -1) for unknown orientations.
     """
-    normals = {
-        ORIENTATION_FLOOR: (0, -1),
-        ORIENTATION_CEILING: (0, 1),
-        ORIENTATION_WALL_LEFT: (1, 0),
-        ORIENTATION_WALL_RIGHT: (-1, 0)
-    }
-    return normals.get(orientation, (0, -1))
+    return _SURFACE_NORMALS.get(orientation, _FLOOR_NORMAL)
+
+
+def apply_surface_gravity_xy(
+    vx: float,
+    vy: float,
+    orientation: int
+) -> Tuple[float, float]:
+    """Apply surface-relative gravity to scalar velocity components.
+
+    Same result as ``apply_surface_gravity``, but takes the velocity as
+    separate floats so callers holding them in locals need not pack a
+    tuple first, and only the affected component is clamped.
+
+    Args:
+        vx: Current horizontal velocity.
+        vy: Current vertical velocity.
+        orientation: The surface orientation the player is attached to.
+
+    Returns:
+        Updated velocity (vx, vy) with gravity applied relative to the surface,
+        capped at MAX_FALL_SPEED in the appropriate direction.
+    """
+    if orientation == ORIENTATION_CEILING:
+        vy -= GRAVITY
+        return vx, (vy if vy > -MAX_FALL_SPEED else -MAX_FALL_SPEED)
+    if orientation == ORIENTATION_WALL_LEFT:
+        vx -= GRAVITY
+        return (vx if vx > -MAX_FALL_SPEED else -MAX_FALL_SPEED), vy
+    if orientation == ORIENTATION_WALL_RIGHT:
+        vx += GRAVITY
+        return (vx if vx < MAX_FALL_SPEED else MAX_FALL_SPEED), vy
+    vy += GRAVITY
+    return vx, (vy if vy < MAX_FALL_SPEED else MAX_FALL_SPEED)
 
 
 def apply_surface_gravity(
     velocity: Tuple[float, float],
-    orientation: str
+    orientation: int
 ) -> Tuple[float, float]:
     """Apply gravity relative to the surface the player is stuck to.
 
@@ -245,18 +414,7 @@ def apply_surface_gravity(
         Updated velocity (vx, vy) with gravity applied relative to the surface,
         capped at MAX_FALL_SPEED in the appropriate direction.
     """
-    vx, vy = velocity
-    
-    if orientation == ORIENTATION_FLOOR:
-        return (vx, min(vy + GRAVITY, MAX_FALL_SPEED))
-    elif orientation == ORIENTATION_CEILING:
-        return (vx, max(vy - GRAVITY, -MAX_FALL_SPEED))
-    elif orientation == ORIENTATION_WALL_LEFT:
-        return (max(vx - GRAVITY, -MAX_FALL_SPEED), vy)
-    elif orientation == ORIENTATION_WALL_RIGHT:
-        return (min(vx + GRAVITY, MAX_FALL_SPEED), vy)
-    
-    return (vx, min(vy + GRAVITY, MAX_FALL_SPEED))
+    return apply_surface_gravity_xy(velocity[0], velocity[1], orientation)
 
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
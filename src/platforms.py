@@ -1,17 +1,36 @@
 """Platform classes for floor, wall, and ceiling surfaces."""
 
-from typing import Tuple, Optional
+import math
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional, Union
 import pygame
 
+from .spatial import SpatialGrid
 from .constants import (
     ORIENTATION_FLOOR, ORIENTATION_WALL_LEFT, ORIENTATION_WALL_RIGHT, ORIENTATION_CEILING,
-    COLOR_PLATFORM, COLOR_MAGNETIC_PLATFORM
+    ORIENTATION_BY_NAME, ORIENTATION_NAMES, COLOR_PLATFORM, COLOR_MAGNETIC_PLATFORM,
+    STATIC_LAYER_MAX_AREA
 )
 
+# Transparent color of the pre-rendered static platform layer
+_LAYER_COLORKEY = (255, 0, 255)
+
+# Per-orientation (x fraction, y fraction, side) of the surface anchor point
+_SURFACE_ANCHORS = {
+    ORIENTATION_FLOOR: (0.5, 0.0, "top"),
+    ORIENTATION_CEILING: (0.5, 1.0, "bottom"),
+    ORIENTATION_WALL_LEFT: (1.0, 0.5, "right"),
+    ORIENTATION_WALL_RIGHT: (0.0, 0.5, "left"),
+}
+
 
 class Platform:
     """A platform that can be magnetic or normal."""
     
+    __slots__ = (
+        'x', 'y', 'width', 'height', 'is_magnetic', 'orientation',
+        '_rect', '_draw_rect'
+    )
+    
     def __init__(
         self,
         x: float,
@@ -19,7 +38,7 @@ class Platform:
         width: float,
         height: float,
         is_magnetic: bool = False,
-        orientation: str = ORIENTATION_FLOOR
+        orientation: Union[int, str] = ORIENTATION_FLOOR
     ):
         """
         Initialize a platform.
@@ -30,14 +49,25 @@ class Platform:
             width: Platform width
             height: Platform height
             is_magnetic: Whether player can stick to this surface
-            orientation: Surface orientation for gravity/movement
+            orientation: Surface orientation for gravity/movement; string
+                names such as "wall_left" are also accepted
+        
+        Raises:
+            ValueError: If orientation is a string that names no orientation.
         """
         self.x = x
         self.y = y
         self.width = width
         self.height = height
         self.is_magnetic = is_magnetic
+        if isinstance(orientation, str):
+            if orientation not in ORIENTATION_BY_NAME:
+                raise ValueError(f"Unknown platform orientation: {orientation!r}")
+            orientation = ORIENTATION_BY_NAME[orientation]
         self.orientation = orientation
+        # pygame.Rect truncates float coordinates itself, like int()
+        self._rect = pygame.Rect(x, y, width, height)
+        self._draw_rect = pygame.Rect(0, 0, width, height)
     
     @property
     def rect(self) -> Tuple[float, float, float, float]:
@@ -52,10 +82,14 @@ class Platform:
     def pygame_rect(self) -> pygame.Rect:
         """Get platform as pygame Rect.
 
+        The same Rect object is reused and refreshed on every access, so
+        callers should copy it if they need to keep or modify it.
+
         Returns:
             A pygame.Rect object representing the platform bounds.
         """
-        return pygame.Rect(int(self.x), int(self.y), int(self.width), int(self.height))
+        self._rect.update(self.x, self.y, self.width, self.height)
+        return self._rect
     
     @property
     def center(self) -> Tuple[float, float]:
@@ -73,15 +107,10 @@ class Platform:
             Tuple containing (x, y, side) where side is one of
             "top", "bottom", "left", or "right".
         """
-        if self.orientation == ORIENTATION_FLOOR:
-            return (self.x + self.width / 2, self.y, "top")
-        elif self.orientation == ORIENTATION_CEILING:
-            return (self.x + self.width / 2, self.y + self.height, "bottom")
-        elif self.orientation == ORIENTATION_WALL_LEFT:
-            return (self.x + self.width, self.y + self.height / 2, "right")
-        elif self.orientation == ORIENTATION_WALL_RIGHT:
-            return (self.x, self.y + self.height / 2, "left")
-        return (self.x + self.width / 2, self.y, "top")
+        fraction_x, fraction_y, side = _SURFACE_ANCHORS.get(
+            self.orientation, _SURFACE_ANCHORS[ORIENTATION_FLOOR]
+        )
+        return (self.x + self.width * fraction_x, self.y + self.height * fraction_y, side)
     
     def is_player_on_surface(
         self,
@@ -140,11 +169,12 @@ class Platform:
             surface: The pygame surface to draw on.
             camera_offset: Tuple (x, y) offset for camera scrolling.
         """
-        rect = pygame.Rect(
-            int(self.x - camera_offset[0]),
-            int(self.y - camera_offset[1]),
-            int(self.width),
-            int(self.height)
+        rect = self._draw_rect
+        rect.update(
+            self.x - camera_offset[0],
+            self.y - camera_offset[1],
+            self.width,
+            self.height
         )
         pygame.draw.rect(surface, self.get_color(), rect)
         
@@ -164,7 +194,7 @@ class Platform:
             'width': self.width,
             'height': self.height,
             'is_magnetic': self.is_magnetic,
-            'orientation': self.orientation
+            'orientation': ORIENTATION_NAMES[self.orientation]
         }
     
     @classmethod
@@ -190,6 +220,12 @@ class Platform:
 class MovingPlatform(Platform):
     """A platform that moves between two points."""
     
+    __slots__ = (
+        'direction', 'progress', '_start_x', '_start_y', '_end_x', '_end_y',
+        '_speed', '_span_x', '_span_y', '_step', '_velocity_forward',
+        '_velocity_backward'
+    )
+    
     def __init__(
         self,
         x: float,
@@ -200,7 +236,7 @@ class MovingPlatform(Platform):
         end_y: float,
         speed: float = 2.0,
         is_magnetic: bool = False,
-        orientation: str = ORIENTATION_FLOOR
+        orientation: Union[int, str] = ORIENTATION_FLOOR
     ):
         """Initialize a moving platform.
 
@@ -216,13 +252,122 @@ class MovingPlatform(Platform):
             orientation: Surface orientation for gravity/movement.
         """
         super().__init__(x, y, width, height, is_magnetic, orientation)
-        self.start_x = x
-        self.start_y = y
-        self.end_x = end_x
-        self.end_y = end_y
-        self.speed = speed
+        self._start_x = x
+        self._start_y = y
+        self._end_x = end_x
+        self._end_y = end_y
+        self._speed = speed
         self.direction = 1  # 1 = towards end, -1 = towards start
         self.progress = 0.0  # 0 to 1
+        self._update_path()
+    
+    def _update_path(self) -> None:
+        """Recompute the cached path terms.
+
+        Precomputes the span, the per-frame progress step and the velocity
+        for each direction so updates avoid redoing them every frame. Runs
+        whenever an endpoint or the speed changes.
+        """
+        self._span_x = self._end_x - self._start_x
+        self._span_y = self._end_y - self._start_y
+        self._step = self._speed * 0.01
+        self._velocity_forward = (self._span_x * self._step, self._span_y * self._step)
+        self._velocity_backward = (-self._velocity_forward[0], -self._velocity_forward[1])
+    
+    @property
+    def start_x(self) -> float:
+        """Get the X position of the path start.
+
+        Returns:
+            The start X coordinate (top-left).
+        """
+        return self._start_x
+    
+    @start_x.setter
+    def start_x(self, value: float) -> None:
+        """Set the path start X position.
+
+        Args:
+            value: The new start X coordinate.
+        """
+        self._start_x = value
+        self._update_path()
+    
+    @property
+    def start_y(self) -> float:
+        """Get the Y position of the path start.
+
+        Returns:
+            The start Y coordinate (top-left).
+        """
+        return self._start_y
+    
+    @start_y.setter
+    def start_y(self, value: float) -> None:
+        """Set the path start Y position.
+
+        Args:
+            value: The new start Y coordinate.
+        """
+        self._start_y = value
+        self._update_path()
+    
+    @property
+    def end_x(self) -> float:
+        """Get the X position of the path end.
+
+        Returns:
+            The destination X coordinate (top-left).
+        """
+        return self._end_x
+    
+    @end_x.setter
+    def end_x(self, value: float) -> None:
+        """Set the path end X position.
+
+        Args:
+            value: The new destination X coordinate.
+        """
+        self._end_x = value
+        self._update_path()
+    
+    @property
+    def end_y(self) -> float:
+        """Get the Y position of the path end.
+
+        Returns:
+            The destination Y coordinate (top-left).
+        """
+        return self._end_y
+    
+    @end_y.setter
+    def end_y(self, value: float) -> None:
+        """Set the path end Y position.
+
+        Args:
+            value: The new destination Y coordinate.
+        """
+        self._end_y = value
+        self._update_path()
+    
+    @property
+    def speed(self) -> float:
+        """Get the movement speed multiplier.
+
+        Returns:
+            The speed multiplier; each frame advances progress by speed / 100.
+        """
+        return self._speed
+    
+    @speed.setter
+    def speed(self, value: float) -> None:
+        """Set the movement speed multiplier.
+
+        Args:
+            value: The new speed multiplier.
+        """
+        self._speed = value
+        self._update_path()
     
     def update(self) -> None:
         """Update platform position.
@@ -230,17 +375,33 @@ class MovingPlatform(Platform):
         Moves the platform along its path between start and end points.
         Reverses direction when reaching either endpoint.
         """
-        self.progress += self.speed * self.direction * 0.01
-        
-        if self.progress >= 1.0:
-            self.progress = 1.0
-            self.direction = -1
-        elif self.progress <= 0.0:
-            self.progress = 0.0
-            self.direction = 1
-        
-        self.x = self.start_x + (self.end_x - self.start_x) * self.progress
-        self.y = self.start_y + (self.end_y - self.start_y) * self.progress
+        MovingPlatform.update_batch((self,))
+    
+    @staticmethod
+    def update_batch(platforms: Iterable['MovingPlatform']) -> None:
+        """Advance many moving platforms in a single loop.
+
+        Progress, endpoint clamping and interpolation run together with the
+        intermediate values held in locals, so each platform's fields are
+        read and written once per frame.
+
+        Args:
+            platforms: The moving platforms to update.
+        """
+        for platform in platforms:
+            direction = platform.direction
+            progress = platform.progress + platform._step * direction
+            
+            if progress >= 1.0:
+                progress = 1.0
+                platform.direction = -1
+            elif progress <= 0.0:
+                progress = 0.0
+                platform.direction = 1
+            
+            platform.progress = progress
+            platform.x = platform._start_x + platform._span_x * progress
+            platform.y = platform._start_y + platform._span_y * progress
     
     def get_velocity(self) -> Tuple[float, float]:
         """Get current platform velocity.
@@ -248,9 +409,9 @@ class MovingPlatform(Platform):
         Returns:
             Tuple containing (dx, dy) velocity components.
         """
-        dx = (self.end_x - self.start_x) * self.speed * 0.01 * self.direction
-        dy = (self.end_y - self.start_y) * self.speed * 0.01 * self.direction
-        return (dx, dy)
+        if self.direction > 0:
+            return self._velocity_forward
+        return self._velocity_backward
     
     def to_dict(self) -> dict:
         """Serialize moving platform to dictionary.
@@ -289,3 +450,400 @@ class MovingPlatform(Platform):
             is_magnetic=data.get('is_magnetic', False),
             orientation=data.get('orientation', ORIENTATION_FLOOR)
         )
+
+
+class PlatformArray:
+    """Platform geometry stored as parallel columns.
+
+    Keeps each platform's position, size, magnetism and orientation in its
+    own list so hot loops can walk plain floats instead of going through
+    attribute lookups and rect properties on every platform object. The
+    platform objects are kept alongside and indexing returns them, so the
+    array can stand in for a list of platforms.
+
+    Each platform's right and bottom edges are kept as columns too, so
+    overlap tests compare against them instead of adding the size to the
+    position on every query.
+
+    Columns are a snapshot: call ``sync`` after a platform moves.
+    
+    Each row also has a pygame Rect covering the platform's float bounds,
+    rounded outwards, so ``colliding`` can find hits with one C-level
+    ``collidelistall`` call and run the exact test only on those.
+    
+    Static platforms are also bucketed in a spatial grid, built on first
+    query, so area queries only test the platforms near them. Moving
+    platforms stay out of the grid and are tested by every query.
+    """
+    
+    def __init__(self, platforms: Iterable[Platform] = ()):
+        """Initialize the array from platforms.
+
+        Args:
+            platforms: Platforms to store, in order.
+        """
+        self.platforms: List[Platform] = []
+        self.xs: List[float] = []
+        self.ys: List[float] = []
+        self.ws: List[float] = []
+        self.hs: List[float] = []
+        self.rights: List[float] = []
+        self.bottoms: List[float] = []
+        self.magnetic: List[bool] = []
+        self.orientations: List[int] = []
+        self.rects: List[pygame.Rect] = []
+        self.moving_indices: List[int] = []
+        # Bumped whenever a static platform is added or moved
+        self.static_version = 0
+        self._grid: Optional[SpatialGrid] = None
+        self._query_rect = pygame.Rect(0, 0, 0, 0)
+        self._tiles: Dict[Tuple[type, int, int, bool], pygame.Surface] = {}
+        self._row_tiles: List[pygame.Surface] = []
+        self._static_layer: Optional[pygame.Surface] = None
+        self._static_origin = (0, 0)
+        self._static_ready = False
+        for platform in platforms:
+            self.append(platform)
+    
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict]) -> 'PlatformArray':
+        """Create an array from serialized platforms.
+
+        Args:
+            items: Platform dictionaries as produced by ``to_dict``.
+
+        Returns:
+            A new PlatformArray holding the deserialized platforms.
+        """
+        return cls(
+            MovingPlatform.from_dict(data) if data.get('moving', False)
+            else Platform.from_dict(data)
+            for data in items
+        )
+    
+    def __len__(self) -> int:
+        """Get the number of platforms.
+
+        Returns:
+            The number of stored platforms.
+        """
+        return len(self.platforms)
+    
+    def __getitem__(self, index: int) -> Platform:
+        """Get a platform by index.
+
+        Args:
+            index: Position of the platform.
+
+        Returns:
+            The platform object at that position.
+        """
+        return self.platforms[index]
+    
+    def __iter__(self) -> Iterator[Platform]:
+        """Iterate over the platform objects.
+
+        Returns:
+            An iterator over the platforms in order.
+        """
+        return iter(self.platforms)
+    
+    def append(self, platform: Platform) -> None:
+        """Add a platform to the end of the array.
+
+        Args:
+            platform: The platform to add.
+        """
+        self.platforms.append(platform)
+        self.xs.append(platform.x)
+        self.ys.append(platform.y)
+        self.ws.append(platform.width)
+        self.hs.append(platform.height)
+        self.rights.append(platform.x + platform.width)
+        self.bottoms.append(platform.y + platform.height)
+        self.magnetic.append(platform.is_magnetic)
+        self.orientations.append(platform.orientation)
+        rect = pygame.Rect(0, 0, 0, 0)
+        self._cover(rect, platform.x, platform.y, platform.width, platform.height)
+        self.rects.append(rect)
+        if isinstance(platform, MovingPlatform):
+            self.moving_indices.append(len(self.platforms) - 1)
+        self._grid = None
+        self._row_tiles = []
+        self._static_ready = False
+        self.static_version += 1
+    
+    def update_moving(self) -> None:
+        """Advance every moving platform one frame and sync its row."""
+        platforms = self.platforms
+        moving_indices = self.moving_indices
+        MovingPlatform.update_batch([platforms[index] for index in moving_indices])
+        xs = self.xs
+        ys = self.ys
+        ws = self.ws
+        hs = self.hs
+        rights = self.rights
+        bottoms = self.bottoms
+        rects = self.rects
+        cover = self._cover
+        for index in moving_indices:
+            platform = platforms[index]
+            x = xs[index] = platform.x
+            y = ys[index] = platform.y
+            width = ws[index]
+            height = hs[index]
+            rights[index] = x + width
+            bottoms[index] = y + height
+            cover(rects[index], x, y, width, height)
+    
+    def sync(self, index: int) -> None:
+        """Copy a platform's current position back into the columns.
+
+        Args:
+            index: Position of the platform that moved.
+        """
+        platform = self.platforms[index]
+        self.xs[index] = platform.x
+        self.ys[index] = platform.y
+        self.rights[index] = platform.x + self.ws[index]
+        self.bottoms[index] = platform.y + self.hs[index]
+        self._cover(self.rects[index], platform.x, platform.y, platform.width, platform.height)
+        if index not in self.moving_indices:
+            self._static_ready = False
+            self.static_version += 1
+    
+    @staticmethod
+    def _cover(rect: pygame.Rect, x: float, y: float, width: float, height: float) -> None:
+        """Set a pygame Rect to the smallest integer rect covering a float rect.
+
+        The rect is at least one pixel in each direction, so it collides
+        with every rect the float rect overlaps.
+
+        Args:
+            rect: The Rect to update in place.
+            x: Float rect X position.
+            y: Float rect Y position.
+            width: Float rect width.
+            height: Float rect height.
+        """
+        left = math.floor(x)
+        top = math.floor(y)
+        rect.update(
+            left,
+            top,
+            max(math.ceil(x + width) - left, 1),
+            max(math.ceil(y + height) - top, 1)
+        )
+    
+    def _get_grid(self) -> SpatialGrid:
+        """Get the spatial grid of static platforms, building it if needed.
+
+        Returns:
+            The grid mapping cells to indices of static platforms.
+        """
+        grid = self._grid
+        if grid is None:
+            grid = SpatialGrid()
+            moving = set(self.moving_indices)
+            for index, row in enumerate(zip(self.xs, self.ys, self.ws, self.hs)):
+                if index not in moving:
+                    grid.insert(index, row)
+            self._grid = grid
+        return grid
+    
+    def candidates_near(self, rect: Tuple[float, float, float, float]) -> List[int]:
+        """Get indices of platforms that may overlap a rect.
+
+        Args:
+            rect: The query rect as (x, y, width, height).
+
+        Returns:
+            Candidate indices in ascending order. Every platform that
+            overlaps the rect is included; nearby ones may be too.
+        """
+        indices = self._get_grid().query(rect)
+        if self.moving_indices:
+            indices = sorted(indices + self.moving_indices)
+        return indices
+    
+    def overlapping(
+        self,
+        px: float,
+        py: float,
+        pw: float,
+        ph: float,
+        start: int = 0
+    ) -> List[int]:
+        """Get indices of platforms that overlap a rect.
+
+        Uses the same strict overlap test as ``check_rect_collision``, but
+        only on the grid candidates near the rect.
+
+        Args:
+            px: Query rect X position.
+            py: Query rect Y position.
+            pw: Query rect width.
+            ph: Query rect height.
+            start: Index of the first platform to consider; earlier ones
+                are skipped.
+
+        Returns:
+            Indices of the overlapping platforms, in ascending order.
+        """
+        xs, ys, rights, bottoms = self.xs, self.ys, self.rights, self.bottoms
+        right = px + pw
+        bottom = py + ph
+        return [
+            index for index in self.candidates_near((px, py, pw, ph))
+            if index >= start and xs[index] < right and ys[index] < bottom and
+            px < rights[index] and py < bottoms[index]
+        ]
+    
+    def colliding(
+        self,
+        px: float,
+        py: float,
+        pw: float,
+        ph: float,
+        start: int = 0
+    ) -> List[int]:
+        """Get indices of platforms that overlap a rect.
+
+        Uses the same strict overlap test as ``check_rect_collision``, but
+        the sweep is a single ``collidelistall`` call on the covering Rects;
+        only its hits are checked with the exact float test.
+
+        Args:
+            px: Query rect X position.
+            py: Query rect Y position.
+            pw: Query rect width.
+            ph: Query rect height.
+            start: Index of the first platform to consider; earlier ones
+                are skipped.
+
+        Returns:
+            Indices of the overlapping platforms, in ascending order.
+        """
+        query = self._query_rect
+        self._cover(query, px, py, pw, ph)
+        xs, ys, rights, bottoms = self.xs, self.ys, self.rights, self.bottoms
+        right = px + pw
+        bottom = py + ph
+        return [
+            index for index in query.collidelistall(self.rects)
+            if index >= start and xs[index] < right and ys[index] < bottom and
+            px < rights[index] and py < bottoms[index]
+        ]
+    
+    def overlapping_moving(self, px: float, py: float, pw: float, ph: float) -> List[int]:
+        """Get indices of moving platforms that overlap a rect.
+
+        Args:
+            px: Query rect X position.
+            py: Query rect Y position.
+            pw: Query rect width.
+            ph: Query rect height.
+
+        Returns:
+            Indices of the overlapping moving platforms, in ascending order.
+        """
+        xs, ys, rights, bottoms = self.xs, self.ys, self.rights, self.bottoms
+        right = px + pw
+        bottom = py + ph
+        return [
+            index for index in self.moving_indices
+            if xs[index] < right and ys[index] < bottom and
+            px < rights[index] and py < bottoms[index]
+        ]
+    
+    def _get_tile(self, platform: Platform) -> pygame.Surface:
+        """Get a pre-rendered image of a platform, drawing it if needed.
+
+        Tiles are shared between platforms of the same type, size and
+        magnetism, since those are all a platform's look depends on.
+
+        Args:
+            platform: The platform to get the image for.
+
+        Returns:
+            A surface holding the platform drawn at its own origin.
+        """
+        width = int(platform.width)
+        height = int(platform.height)
+        key = (type(platform), width, height, platform.is_magnetic)
+        tile = self._tiles.get(key)
+        if tile is None:
+            tile = pygame.Surface((max(width, 0), max(height, 0)))
+            platform.draw(tile, (platform.x, platform.y))
+            self._tiles[key] = tile
+        return tile
+    
+    def _build_static_layer(self, tiles: List[pygame.Surface]) -> None:
+        """Pre-render the static platforms onto one colorkeyed surface.
+
+        The layer covers the bounding box of the static platforms. It is
+        skipped when there are none, or when the box exceeds
+        STATIC_LAYER_MAX_AREA, in which case they are drawn from tiles.
+
+        Args:
+            tiles: The tile for each row, in platform order.
+        """
+        self._static_ready = True
+        self._static_layer = None
+        moving = set(self.moving_indices)
+        static = [index for index in range(len(self.platforms)) if index not in moving]
+        if not static:
+            return
+        xs, ys = self.xs, self.ys
+        left = math.floor(min(xs[index] for index in static))
+        top = math.floor(min(ys[index] for index in static))
+        width = math.ceil(max(self.rights[index] for index in static)) - left
+        height = math.ceil(max(self.bottoms[index] for index in static)) - top
+        if width * height > STATIC_LAYER_MAX_AREA:
+            return
+        layer = pygame.Surface((width, height))
+        layer.fill(_LAYER_COLORKEY)
+        layer.blits(
+            [(tiles[index], (int(xs[index] - left), int(ys[index] - top))) for index in static],
+            doreturn=0
+        )
+        layer.set_colorkey(_LAYER_COLORKEY, pygame.RLEACCEL)
+        self._static_layer = layer
+        self._static_origin = (left, top)
+    
+    def draw(self, surface: pygame.Surface, camera_offset: Tuple[float, float] = (0, 0)) -> None:
+        """Draw every platform with at most two blit calls.
+
+        Static platforms are pre-rendered onto one layer that is blitted
+        whole; moving platforms are drawn from cached tiles with a single
+        ``Surface.blits`` call. Without a layer, every platform is drawn
+        from its tile.
+
+        Args:
+            surface: The pygame surface to draw on.
+            camera_offset: Tuple (x, y) offset for camera scrolling.
+        """
+        tiles = self._row_tiles
+        if len(tiles) != len(self.platforms):
+            tiles = [self._get_tile(platform) for platform in self.platforms]
+            self._row_tiles = tiles
+        if not self._static_ready:
+            self._build_static_layer(tiles)
+        offset_x, offset_y = camera_offset
+        rows: Iterable[int] = range(len(tiles))
+        layer = self._static_layer
+        if layer is not None:
+            left, top = self._static_origin
+            # Floor rather than truncate: the layer origin is often off
+            # screen, and flooring keeps on-screen platforms on the same
+            # pixels int() gives them when drawn one by one
+            surface.blit(layer, (math.floor(left - offset_x), math.floor(top - offset_y)))
+            rows = self.moving_indices
+        xs, ys = self.xs, self.ys
+        surface.blits(
+            [
+                (tiles[index], (int(xs[index] - offset_x), int(ys[index] - offset_y)))
+                for index in rows
+            ],
+            doreturn=0
+        )
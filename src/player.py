@@ -1,24 +1,36 @@
 """Player class with magnetic boots capability."""
 
-from typing import Tuple, Optional, List
+from typing import Dict, Tuple, Optional, Sequence, Union
 import pygame
 
 from .constants import (
     PLAYER_WIDTH, PLAYER_HEIGHT, PLAYER_SPEED, PLAYER_JUMP_STRENGTH,
     MAGNETIC_STATE_NORMAL, MAGNETIC_STATE_STICKING,
     COLOR_PLAYER, SCREEN_WIDTH, SCREEN_HEIGHT,
-    ORIENTATION_FLOOR, ORIENTATION_CEILING, ORIENTATION_WALL_LEFT, ORIENTATION_WALL_RIGHT
+    ORIENTATION_FLOOR, ORIENTATION_CEILING, ORIENTATION_WALL_LEFT, ORIENTATION_WALL_RIGHT,
+    ORIENTATION_NONE, GRID_MIN_PLATFORMS
 )
 from .physics import (
-    apply_gravity, apply_friction, check_rect_collision, resolve_collision,
+    apply_gravity_free, apply_friction, integrate_velocity, resolve_collision_xy,
     get_surface_normal, clamp
 )
-from .platforms import Platform
+from .platforms import Platform, PlatformArray
 
 
 class Player:
     """Player character with magnetic boots."""
     
+    __slots__ = (
+        'x', 'y', 'width', 'height', 'velocity_x', 'velocity_y',
+        'magnetic_state', 'current_surface', 'current_orientation',
+        'on_ground', 'facing_right', 'boots_active', 'jump_count', 'max_jumps',
+        '_rect', '_rest_key'
+    )
+    
+    # Sprites shared by all players, keyed by (width, height, sticking,
+    # boots_active, facing_right) and rendered on first use
+    _sprite_cache: Dict[Tuple[int, int, bool, bool, bool], pygame.Surface] = {}
+    
     def __init__(self, x: float, y: float):
         """
         Initialize player.
@@ -41,6 +53,11 @@ class Player:
         self.boots_active = True
         self.jump_count = 0
         self.max_jumps = 2
+        # Rect reused by pygame_rect instead of allocated per access
+        self._rect = pygame.Rect(0, 0, self.width, self.height)
+        # Where the player last stood clear of every platform, as
+        # (x, y, width, height, platforms, static_version)
+        self._rest_key: Optional[tuple] = None
     
     @property
     def position(self) -> Tuple[float, float]:
@@ -64,10 +81,14 @@ class Player:
     def pygame_rect(self) -> pygame.Rect:
         """Get player as pygame Rect.
 
+        The same Rect object is reused and refreshed on every access, so
+        callers should copy it if they need to keep or modify it.
+
         Returns:
             pygame.Rect: The player's bounding box as a pygame Rect object.
         """
-        return pygame.Rect(int(self.x), int(self.y), int(self.width), int(self.height))
+        self._rect.update(self.x, self.y, self.width, self.height)
+        return self._rect
     
     @property
     def velocity(self) -> Tuple[float, float]:
@@ -109,9 +130,9 @@ class Player:
         if self.magnetic_state == MAGNETIC_STATE_STICKING:
             # Jump off surface
             self.detach_from_surface()
-            normal = get_surface_normal(self.current_orientation)
-            self.velocity_x += normal[0] * PLAYER_JUMP_STRENGTH
-            self.velocity_y += normal[1] * PLAYER_JUMP_STRENGTH
+            normal_x, normal_y = get_surface_normal(self.current_orientation)
+            self.velocity_x += normal_x * PLAYER_JUMP_STRENGTH
+            self.velocity_y += normal_y * PLAYER_JUMP_STRENGTH
             self.jump_count = 1
             return True
         
@@ -140,7 +161,7 @@ class Player:
         Gravity is only applied when the player is not sticking to a surface.
         """
         if self.magnetic_state != MAGNETIC_STATE_STICKING:
-            self.velocity_y = apply_gravity(self.velocity_y, self.magnetic_state)
+            self.velocity_y = apply_gravity_free(self.velocity_y)
     
     def apply_friction(self) -> None:
         """Apply friction to player movement.
@@ -150,7 +171,7 @@ class Player:
         """
         self.velocity_x = apply_friction(self.velocity_x, self.on_ground)
     
-    def stick_to_surface(self, platform: Platform, collision_side: str) -> None:
+    def stick_to_surface(self, platform: Platform, collision_side: int) -> None:
         """
         Attach to a magnetic surface.
         
@@ -191,16 +212,18 @@ class Player:
             self.velocity_x += force[0]
             self.velocity_y += force[1]
     
-    def update(self, platforms: List[Platform]) -> None:
+    def update(self, platforms: Union[PlatformArray, Sequence[Platform]]) -> None:
         """
         Update player physics and handle collisions.
         
         Args:
-            platforms: List of platforms to check collision against
+            platforms: Platforms to check collision against, ideally as a
+                PlatformArray; a plain sequence is wrapped in one
         """
-        # Apply physics
-        self.apply_gravity()
-        self.apply_friction()
+        # Apply gravity and friction in one fused step
+        self.velocity_x, self.velocity_y = integrate_velocity(
+            self.velocity_x, self.velocity_y, self.on_ground, self.magnetic_state
+        )
         
         # Store old position for collision resolution
         old_x, old_y = self.x, self.y
@@ -214,29 +237,103 @@ class Player:
         if self.magnetic_state != MAGNETIC_STATE_STICKING:
             self.on_ground = False
         
-        # Handle collisions
-        for platform in platforms:
-            if check_rect_collision(self.rect, platform.rect):
-                (new_pos, new_vel, collision_side) = resolve_collision(
-                    self.rect,
-                    platform.rect,
-                    self.velocity
-                )
-                self.x, self.y = new_pos
-                self.velocity_x, self.velocity_y = new_vel
-                
-                # Check for magnetic sticking
-                if collision_side and platform.is_magnetic and self.boots_active:
-                    self.stick_to_surface(platform, collision_side)
-                elif collision_side == ORIENTATION_FLOOR:
-                    self.on_ground = True
-                    self.jump_count = 0
+        # Handle collisions in platform order, each against the current
+        # position. Overlaps are found with the platform grid in large
+        # levels and one collidelistall sweep over the rects in small ones;
+        # a resolution that moves the player re-queries the platforms after
+        # the one just resolved. Position and velocity live in locals for
+        # the scan and are written back once at the end.
+        if not isinstance(platforms, PlatformArray):
+            platforms = PlatformArray(platforms)
+        x = self.x
+        y = self.y
+        velocity_x = self.velocity_x
+        velocity_y = self.velocity_y
+        width = self.width
+        height = self.height
+        xs, ys = platforms.xs, platforms.ys
+        rights, bottoms = platforms.rights, platforms.bottoms
+        magnetic = platforms.magnetic
+        if len(platforms) >= GRID_MIN_PLATFORMS:
+            colliding = platforms.overlapping
+        else:
+            colliding = platforms.colliding
+        # A player resting where it was already clear of the static
+        # platforms (typically stuck to a surface) can only be hit by
+        # moving ones, so the full sweep is skipped
+        rest_key = (x, y, width, height, platforms, platforms.static_version)
+        if rest_key == self._rest_key:
+            hits = platforms.overlapping_moving(x, y, width, height)
+        else:
+            hits = colliding(x, y, width, height)
+        self._rest_key = None if hits else rest_key
+        next_hit = 0
+        while next_hit < len(hits):
+            index = hits[next_hit]
+            next_hit += 1
+            new_x, new_y, velocity_x, velocity_y, collision_side = resolve_collision_xy(
+                x, y, width, height, velocity_x, velocity_y,
+                xs[index], ys[index], rights[index], bottoms[index]
+            )
+            
+            # Check for magnetic sticking
+            if (collision_side != ORIENTATION_NONE and magnetic[index] and
+                    self.boots_active):
+                self.stick_to_surface(platforms[index], collision_side)
+                velocity_x = self.velocity_x
+                velocity_y = self.velocity_y
+            elif collision_side == ORIENTATION_FLOOR:
+                self.on_ground = True
+                self.jump_count = 0
+            
+            if new_x != x or new_y != y:
+                x = new_x
+                y = new_y
+                hits = colliding(x, y, width, height, index + 1)
+                next_hit = 0
+        self.x = x
+        self.y = y
+        self.velocity_x = velocity_x
+        self.velocity_y = velocity_y
         
         # Check if still on current surface when sticking
         if self.magnetic_state == MAGNETIC_STATE_STICKING and self.current_surface:
             if not self.current_surface.is_player_on_surface(self.rect, tolerance=10):
                 self.detach_from_surface()
     
+    def _get_sprite(self) -> pygame.Surface:
+        """Get the pre-rendered sprite for the player's current look.
+
+        The body, boots and eye depend only on size, sticking state, boots
+        state and facing, so each combination is drawn once and shared by
+        every player.
+
+        Returns:
+            pygame.Surface: The player drawn at its own origin.
+        """
+        width = int(self.width)
+        height = int(self.height)
+        sticking = self.magnetic_state == MAGNETIC_STATE_STICKING
+        key = (width, height, sticking, self.boots_active, self.facing_right)
+        sprite = Player._sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((width, height))
+            
+            # Draw body, glowing blue when sticking
+            color = (100, 200, 255) if sticking else COLOR_PLAYER
+            pygame.draw.rect(sprite, color, (0, 0, width, height))
+            
+            # Draw boots indicator
+            boot_color = (0, 100, 255) if self.boots_active else (100, 100, 100)
+            pygame.draw.rect(sprite, boot_color, (0, height - 8, width, 8))
+            
+            # Draw facing direction indicator
+            eye_x = width * 0.7 if self.facing_right else width * 0.3
+            pygame.draw.circle(sprite, (255, 255, 255), (int(eye_x), 10), 4)
+            
+            Player._sprite_cache[key] = sprite
+        return sprite
+    
     def draw(self, surface: pygame.Surface, camera_offset: Tuple[float, float] = (0, 0)) -> None:
         """Draw the player.
 
@@ -244,33 +341,10 @@ class Player:
             surface: The pygame surface to draw on.
             camera_offset: The (x, y) offset for camera positioning. Defaults to (0, 0).
         """
-        rect = pygame.Rect(
-            int(self.x - camera_offset[0]),
-            int(self.y - camera_offset[1]),
-            int(self.width),
-            int(self.height)
+        surface.blit(
+            self._get_sprite(),
+            (int(self.x - camera_offset[0]), int(self.y - camera_offset[1]))
         )
-        
-        # Draw body
-        color = COLOR_PLAYER
-        if self.magnetic_state == MAGNETIC_STATE_STICKING:
-            color = (100, 200, 255)  # Glowing blue when sticking
-        
-        pygame.draw.rect(surface, color, rect)
-        
-        # Draw boots indicator
-        boot_color = (0, 100, 255) if self.boots_active else (100, 100, 100)
-        boot_rect = pygame.Rect(
-            rect.x,
-            rect.y + rect.height - 8,
-            rect.width,
-            8
-        )
-        pygame.draw.rect(surface, boot_color, boot_rect)
-        
-        # Draw facing direction indicator
-        eye_x = rect.x + (rect.width * 0.7 if self.facing_right else rect.width * 0.3)
-        pygame.draw.circle(surface, (255, 255, 255), (int(eye_x), rect.y + 10), 4)
     
     def reset(self, x: float, y: float) -> None:
         """Reset player to specified position.
@@ -0,0 +1,229 @@
+"""Region quadtree for broad-phase queries over moving objects."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+Rect = Tuple[float, float, float, float]
+
+
+def _overlaps(a: Rect, b: Rect) -> bool:
+    """Check whether two rects overlap.
+
+    Args:
+        a: First rect as (x, y, width, height).
+        b: Second rect as (x, y, width, height).
+
+    Returns:
+        bool: True if the rects overlap (touching edges do not count).
+    """
+    return (a[0] < b[0] + b[2] and
+            a[0] + a[2] > b[0] and
+            a[1] < b[1] + b[3] and
+            a[1] + a[3] > b[1])
+
+
+def _contains(outer: Rect, inner: Rect) -> bool:
+    """Check whether one rect fully contains another.
+
+    Args:
+        outer: Containing rect as (x, y, width, height).
+        inner: Contained rect as (x, y, width, height).
+
+    Returns:
+        bool: True if inner lies entirely within outer.
+    """
+    return (inner[0] >= outer[0] and
+            inner[1] >= outer[1] and
+            inner[0] + inner[2] <= outer[0] + outer[2] and
+            inner[1] + inner[3] <= outer[1] + outer[3])
+
+
+class _QuadNode:
+    """A single node of a QuadTree."""
+
+    def __init__(self, bounds: Rect, depth: int):
+        """
+        Initialize a leaf node.
+
+        Args:
+            bounds: Region covered by the node as (x, y, width, height)
+            depth: Depth of the node, zero for the root
+        """
+        self.bounds = bounds
+        self.depth = depth
+        self.entries: List[Tuple[Any, Rect]] = []
+        self.children: Optional[List['_QuadNode']] = None
+
+    def child_for(self, rect: Rect) -> Optional['_QuadNode']:
+        """Find the child that fully contains a rect.
+
+        Args:
+            rect: The rect to place.
+
+        Returns:
+            Optional[_QuadNode]: The containing child, or None if the rect
+                straddles a split line or the node is a leaf.
+        """
+        if self.children is None:
+            return None
+        for child in self.children:
+            if _contains(child.bounds, rect):
+                return child
+        return None
+
+    def split(self) -> None:
+        """Create four children and push down entries that fit in one."""
+        x, y, w, h = self.bounds
+        half_w = w / 2
+        half_h = h / 2
+        depth = self.depth + 1
+        self.children = [
+            _QuadNode((x, y, half_w, half_h), depth),
+            _QuadNode((x + half_w, y, half_w, half_h), depth),
+            _QuadNode((x, y + half_h, half_w, half_h), depth),
+            _QuadNode((x + half_w, y + half_h, half_w, half_h), depth),
+        ]
+
+
+class QuadTree:
+    """Region quadtree storing items by bounding rect.
+
+    Items that straddle a split line stay in the smallest node that fully
+    contains them, and items outside the root bounds are kept at the root,
+    so every stored item is always reachable by a query.
+    """
+
+    def __init__(self, bounds: Rect, max_items: int = 8, max_depth: int = 8):
+        """
+        Initialize an empty quadtree.
+
+        Args:
+            bounds: Region covered by the root as (x, y, width, height)
+            max_items: Entries a leaf may hold before it splits
+            max_depth: Maximum depth of the tree
+        """
+        self.bounds = bounds
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self._root = _QuadNode(bounds, 0)
+        self._nodes: Dict[int, _QuadNode] = {}
+        self._rects: Dict[int, Rect] = {}
+
+    def __len__(self) -> int:
+        """Get the number of items in the tree.
+
+        Returns:
+            int: The number of stored items.
+        """
+        return len(self._rects)
+
+    def __contains__(self, item: Any) -> bool:
+        """Check whether an item is stored in the tree.
+
+        Args:
+            item: The item to look up.
+
+        Returns:
+            bool: True if the item has been inserted and not removed.
+        """
+        return id(item) in self._rects
+
+    def rect_of(self, item: Any) -> Optional[Rect]:
+        """Get the rect an item was last stored with.
+
+        Args:
+            item: The item to look up.
+
+        Returns:
+            Optional[Rect]: The stored rect, or None if the item is absent.
+        """
+        return self._rects.get(id(item))
+
+    def insert(self, item: Any, rect: Rect) -> None:
+        """Insert an item.
+
+        Args:
+            item: The item to store.
+            rect: The item's bounding rect as (x, y, width, height).
+        """
+        node = self._root
+        child = node.child_for(rect)
+        while child is not None:
+            node = child
+            child = node.child_for(rect)
+
+        node.entries.append((item, rect))
+        self._nodes[id(item)] = node
+        self._rects[id(item)] = rect
+
+        if (node.children is None and
+                len(node.entries) > self.max_items and
+                node.depth < self.max_depth):
+            self._split(node)
+
+    def _split(self, node: _QuadNode) -> None:
+        """Split a leaf and redistribute its entries.
+
+        Args:
+            node: The leaf node to split.
+        """
+        node.split()
+        entries = node.entries
+        node.entries = []
+        for item, rect in entries:
+            target = node.child_for(rect) or node
+            target.entries.append((item, rect))
+            self._nodes[id(item)] = target
+
+    def remove(self, item: Any) -> bool:
+        """Remove an item.
+
+        Args:
+            item: The item to remove.
+
+        Returns:
+            bool: True if the item was present and removed.
+        """
+        node = self._nodes.pop(id(item), None)
+        if node is None:
+            return False
+        del self._rects[id(item)]
+        node.entries = [entry for entry in node.entries if entry[0] is not item]
+        return True
+
+    def move(self, item: Any, rect: Rect) -> None:
+        """Update the rect of a stored item in place.
+
+        Args:
+            item: The item to move. It is inserted if not already present.
+            rect: The item's new bounding rect.
+        """
+        self.remove(item)
+        self.insert(item, rect)
+
+    def query(self, rect: Rect) -> List[Any]:
+        """Get all items whose rects overlap a query rect.
+
+        Args:
+            rect: Query rect as (x, y, width, height).
+
+        Returns:
+            List[Any]: The overlapping items in no particular order.
+        """
+        found: List[Any] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            for item, item_rect in node.entries:
+                if _overlaps(item_rect, rect):
+                    found.append(item)
+            if node.children is not None:
+                for child in node.children:
+                    if _overlaps(child.bounds, rect):
+                        stack.append(child)
+        return found
+
+    def clear(self) -> None:
+        """Remove all items from the tree."""
+        self._root = _QuadNode(self.bounds, 0)
+        self._nodes.clear()
+        self._rects.clear()
@@ -1,11 +1,14 @@
 """Rendering system for drawing game objects."""
 
-from typing import Tuple, Optional, List
+import math
+from collections import OrderedDict
+from typing import Dict, Tuple, Optional, List
 import pygame
 
 from .constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_BLACK, COLOR_WHITE,
-    COLOR_GOAL, COLOR_MAGNETIC_BLUE
+    COLOR_GOAL, COLOR_MAGNETIC_BLUE, MAGNETIC_STATE_STICKING, TEXT_CACHE_SIZE,
+    CAMERA_SNAP_DISTANCE, DIRTY_RECT_MAX, COLOR_HUD_OFF
 )
 from .player import Player
 from .platforms import Platform
@@ -13,6 +16,31 @@ from .magnets import Magnet
 from .enemies import Enemy
 from .level import Level
 
+# Transparent color for the pre-rendered goal image
+_GOAL_COLORKEY = (255, 0, 255)
+
+# Cache key for rendered text: (font, text, color)
+TextKey = Tuple[pygame.font.Font, str, Tuple[int, int, int]]
+
+
+def _to_display_format(surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """Convert a cached surface to the display's pixel format.
+
+    Converted surfaces blit without a per-blit format conversion.
+
+    Args:
+        surface: The surface to convert.
+        alpha: Whether to keep per-pixel alpha.
+
+    Returns:
+        The converted surface, or the original if no display mode is set.
+    """
+    try:
+        return surface.convert_alpha() if alpha else surface.convert()
+    except pygame.error:
+        # No display mode set yet; the unconverted surface still works
+        return surface
+
 
 class Camera:
     """Camera for following the player and scrolling the view."""
@@ -30,37 +58,96 @@ class Camera:
         self.width = width
         self.height = height
         self.smoothing = 0.1
+        # (x, y) offset for rendering, and the same truncated to whole
+        # pixels; both are refreshed whenever the camera moves
+        self.offset: Tuple[float, float] = (0.0, 0.0)
+        self.offset_int: Tuple[int, int] = (0, 0)
+        # Largest camera position inside the bound level; unbounded until
+        # a level is bound
+        self._max_x = math.inf
+        self._max_y = math.inf
     
     @property
-    def offset(self) -> Tuple[float, float]:
-        """Get camera offset for rendering.
+    def rect(self) -> Tuple[float, float, float, float]:
+        """Get the area of the level currently in view.
         
         Returns:
-            Tuple containing the x and y offset values.
+            Tuple containing (x, y, width, height) of the viewport.
+        """
+        return (self.x, self.y, self.width, self.height)
+    
+    def bind_level(self, level_width: int, level_height: int) -> None:
+        """Set the level bounds the camera is kept inside.
+        
+        Args:
+            level_width: Total level width
+            level_height: Total level height
         """
-        return (self.x, self.y)
+        self._max_x = level_width - self.width
+        self._max_y = level_height - self.height
     
-    def follow(self, target_x: float, target_y: float, level_width: int, level_height: int) -> None:
+    def follow(
+        self,
+        target_x: float,
+        target_y: float,
+        level_width: Optional[int] = None,
+        level_height: Optional[int] = None
+    ) -> None:
         """
         Smoothly follow a target position.
         
+        Once the camera is within CAMERA_SNAP_DISTANCE of the target it
+        snaps onto it, so an idle view settles on a fixed offset instead of
+        creeping toward the target by ever smaller fractions of a pixel.
+        
         Args:
             target_x: Target X position (usually player center)
             target_y: Target Y position (usually player center)
-            level_width: Total level width for bounds
+            level_width: Total level width for bounds; when given with
+                level_height the camera is rebound first, otherwise the
+                bounds from the last ``bind_level`` are used
             level_height: Total level height for bounds
+        
+        Raises:
+            ValueError: If only one of level_width and level_height is given.
         """
+        if level_width is not None or level_height is not None:
+            if level_width is None or level_height is None:
+                raise ValueError("level_width and level_height must be given together")
+            self.bind_level(level_width, level_height)
+        
         # Calculate desired camera position (centered on target)
         desired_x = target_x - self.width / 2
         desired_y = target_y - self.height / 2
         
-        # Smooth interpolation
-        self.x += (desired_x - self.x) * self.smoothing
-        self.y += (desired_y - self.y) * self.smoothing
-        
-        # Clamp to level bounds
-        self.x = max(0, min(self.x, level_width - self.width))
-        self.y = max(0, min(self.y, level_height - self.height))
+        # Smooth interpolation, snapping once converged
+        dx = desired_x - self.x
+        dy = desired_y - self.y
+        if dx * dx + dy * dy < CAMERA_SNAP_DISTANCE * CAMERA_SNAP_DISTANCE:
+            self.x = desired_x
+            self.y = desired_y
+        else:
+            self.x += dx * self.smoothing
+            self.y += dy * self.smoothing
+        
+        # Clamp to level bounds with plain comparisons rather than min/max
+        # calls; the lower bound wins for levels smaller than the view
+        x = self.x
+        y = self.y
+        max_x = self._max_x
+        max_y = self._max_y
+        if x > max_x:
+            x = max_x
+        if x < 0:
+            x = 0
+        if y > max_y:
+            y = max_y
+        if y < 0:
+            y = 0
+        self.x = x
+        self.y = y
+        self.offset = (x, y)
+        self.offset_int = (int(x), int(y))
     
     def reset(self, x: float = 0, y: float = 0) -> None:
         """Reset camera position.
@@ -71,11 +158,21 @@ class Camera:
         """
         self.x = x
         self.y = y
+        self.offset = (x, y)
+        self.offset_int = (int(x), int(y))
 
 
 class Renderer:
     """Handles all rendering operations."""
     
+    # HUD boots label and color for each (boots_active, sticking) state
+    _HUD_STATES = {
+        (True, False): ("MAGNETIC BOOTS: ON", COLOR_MAGNETIC_BLUE),
+        (True, True): ("MAGNETIC BOOTS: ON (STICKING)", COLOR_MAGNETIC_BLUE),
+        (False, False): ("MAGNETIC BOOTS: OFF", COLOR_HUD_OFF),
+        (False, True): ("MAGNETIC BOOTS: OFF (STICKING)", COLOR_HUD_OFF),
+    }
+    
     def __init__(self, screen: pygame.Surface):
         """
         Initialize renderer.
@@ -85,23 +182,96 @@ class Renderer:
         """
         self.screen = screen
         self.camera = Camera(screen.get_width(), screen.get_height())
+        # Level whose bounds the camera is currently bound to
+        self._camera_level: Optional[Level] = None
         self.font: Optional[pygame.font.Font] = None
         self.small_font: Optional[pygame.font.Font] = None
+        self.title_font: Optional[pygame.font.Font] = None
+        # Rendered boots labels keyed like _HUD_STATES, kept out of the
+        # LRU so other text can never evict them
+        self._hud_state_surfaces: Dict[Tuple[bool, bool], pygame.Surface] = {}
+        # Rendered text, least recently used first
+        self._text_cache: 'OrderedDict[TextKey, pygame.Surface]' = OrderedDict()
+        # Full-screen overlays, rendered on first use and reused every frame
+        # until the screen size changes
+        self._overlays: Dict[str, pygame.Surface] = {}
+        self._overlay_size = screen.get_size()
+        # Pre-rendered goal images keyed by (width, height), each with the
+        # offset of its top-left corner from the goal rect's
+        self._goal_sprites: Dict[Tuple[int, int], Tuple[pygame.Surface, int, int]] = {}
+        # Screen areas drawn by moving things this frame and last frame.
+        # While the view key (level, camera position and what is drawn
+        # statically) repeats, only those areas are sent to the display.
+        self._dirty: List[pygame.Rect] = []
+        self._last_dirty: List[pygame.Rect] = []
+        self._view_key: Optional[tuple] = None
+        self._full_redraw = True
         self._init_fonts()
     
     def _init_fonts(self) -> None:
         """Initialize fonts.
         
-        Initializes the main font and small font for text rendering.
+        Initializes the main, small and title fonts for text rendering.
         Silently handles pygame errors if font initialization fails.
         """
         try:
             pygame.font.init()
             self.font = pygame.font.Font(None, 36)
             self.small_font = pygame.font.Font(None, 24)
+            self.title_font = pygame.font.Font(None, 72)
         except pygame.error:
             pass
     
+    def _render_text(
+        self,
+        text: str,
+        color: Tuple[int, int, int],
+        font: pygame.font.Font
+    ) -> pygame.Surface:
+        """Render text, reusing the surface from an earlier identical call.
+        
+        The cache holds at most TEXT_CACHE_SIZE surfaces and evicts the
+        least recently used one when full.
+        
+        Args:
+            text: The text string to render.
+            color: RGB tuple for the text color.
+            font: Font to render with.
+        
+        Returns:
+            The antialiased text surface.
+        """
+        cache = self._text_cache
+        key = (font, text, color)
+        surface = cache.get(key)
+        if surface is None:
+            surface = _to_display_format(font.render(text, True, color))
+            cache[key] = surface
+            if len(cache) > TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return surface
+    
+    def _invalidate(self) -> None:
+        """Mark the whole screen as changed for the next present."""
+        self._full_redraw = True
+        self._view_key = None
+    
+    def _mark_dirty(self, x: float, y: float, width: float, height: float) -> None:
+        """Record a screen area drawn by something that may move.
+        
+        The area is padded by a pixel on each side to cover truncation of
+        fractional positions.
+        
+        Args:
+            x: Screen X position of the area.
+            y: Screen Y position of the area.
+            width: Width of the area.
+            height: Height of the area.
+        """
+        self._dirty.append(pygame.Rect(int(x) - 1, int(y) - 1, int(width) + 3, int(height) + 3))
+    
     def clear(self, color: Tuple[int, int, int] = COLOR_BLACK) -> None:
         """Clear the screen with a color.
         
@@ -109,32 +279,58 @@ class Renderer:
             color: RGB tuple for the fill color. Defaults to COLOR_BLACK.
         """
         self.screen.fill(color)
+        self._invalidate()
     
     def draw_level(self, level: Level) -> None:
         """Draw entire level.
         
         Renders all level components including background, magnets, platforms,
-        goal, and enemies.
+        goal, and enemies. Everything is drawn at the camera's whole-pixel
+        offset. When nothing drawn statically has changed since the
+        previous frame, only moving platforms and enemies are recorded as
+        changed areas for ``present``.
         
         Args:
             level: The Level object to render.
         """
+        camera = self.camera
+        offset_x, offset_y = offset = camera.offset_int
+        magnets = level.magnets_in_view(camera.rect)
+        platform_array = level.platform_array
+        # The array object itself is part of the key since a rebuilt array
+        # restarts its static_version count
+        view_key = (
+            level, offset_x, offset_y, self.screen.get_size(), level.background_color,
+            platform_array, platform_array.static_version, level.goal_rect,
+            tuple(
+                (magnet, magnet.x, magnet.y, magnet.range, magnet.polarity,
+                 magnet.active, magnet.width, magnet.height)
+                for magnet in magnets
+            )
+        )
+        unchanged = view_key == self._view_key
         self.clear(level.background_color)
+        self._full_redraw = not unchanged
+        self._view_key = view_key
         
-        # Draw magnets (with range indicators)
-        for magnet in level.magnets:
-            magnet.draw(self.screen, self.camera.offset)
+        # Draw magnets (with range indicators) that are on screen
+        for magnet in magnets:
+            magnet.draw(self.screen, offset)
         
         # Draw platforms
-        for platform in level.platforms:
-            platform.draw(self.screen, self.camera.offset)
+        platform_array.draw(self.screen, offset)
+        xs, ys = platform_array.xs, platform_array.ys
+        ws, hs = platform_array.ws, platform_array.hs
+        for index in platform_array.moving_indices:
+            self._mark_dirty(xs[index] - offset_x, ys[index] - offset_y, ws[index], hs[index])
         
         # Draw goal
-        self.draw_goal(level.goal_rect)
+        self._draw_goal_at(level.goal_rect, offset)
         
-        # Draw enemies
-        for enemy in level.enemies:
-            enemy.draw(self.screen, self.camera.offset)
+        # Draw enemies that are on screen
+        for enemy in level.enemies_in_view(camera.rect):
+            enemy.draw(self.screen, offset)
+            self._mark_dirty(enemy.x - offset_x, enemy.y - offset_y, enemy.width, enemy.height)
     
     def draw_player(self, player: Player) -> None:
         """Draw the player.
@@ -142,7 +338,9 @@ class Renderer:
         Args:
             player: The Player object to render.
         """
-        player.draw(self.screen, self.camera.offset)
+        offset_x, offset_y = offset = self.camera.offset_int
+        player.draw(self.screen, offset)
+        self._mark_dirty(player.x - offset_x, player.y - offset_y, player.width, player.height)
     
     def draw_goal(self, goal_rect: Tuple[float, float, float, float]) -> None:
         """Draw the level goal.
@@ -152,25 +350,67 @@ class Renderer:
         Args:
             goal_rect: Tuple of (x, y, width, height) defining the goal area.
         """
+        self._draw_goal_at(goal_rect, self.camera.offset_int)
+    
+    def _draw_goal_at(
+        self,
+        goal_rect: Tuple[float, float, float, float],
+        offset: Tuple[int, int]
+    ) -> None:
+        """Draw the level goal at a whole-pixel camera offset.
+        
+        Args:
+            goal_rect: Tuple of (x, y, width, height) defining the goal area.
+            offset: The (x, y) camera offset in whole pixels.
+        """
         x, y, w, h = goal_rect
-        rect = pygame.Rect(
-            int(x - self.camera.offset[0]),
-            int(y - self.camera.offset[1]),
-            int(w),
-            int(h)
-        )
-        pygame.draw.rect(self.screen, COLOR_GOAL, rect)
-        pygame.draw.rect(self.screen, COLOR_WHITE, rect, 2)
+        sprite, left, top = self._get_goal_sprite(int(w), int(h))
+        self.screen.blit(sprite, (int(x - offset[0]) + left, int(y - offset[1]) + top))
+    
+    def _get_goal_sprite(self, width: int, height: int) -> Tuple[pygame.Surface, int, int]:
+        """Get the pre-rendered goal image for a size, drawing it if needed.
+        
+        The image is the goal rectangle, its outline and the centered star
+        indicator. The indicator can overhang a small goal, so the image
+        covers both and is transparent outside them.
         
-        # Draw star shape or indicator
-        center_x = rect.x + rect.width // 2
-        center_y = rect.y + rect.height // 2
-        pygame.draw.circle(self.screen, COLOR_WHITE, (center_x, center_y), 10)
+        Args:
+            width: Goal width in pixels.
+            height: Goal height in pixels.
+        
+        Returns:
+            The image and the (x, y) offset of its top-left corner from
+            the goal rect's.
+        """
+        key = (width, height)
+        entry = self._goal_sprites.get(key)
+        if entry is None:
+            radius = 10
+            center_x = width // 2
+            center_y = height // 2
+            left = min(0, center_x - radius)
+            top = min(0, center_y - radius)
+            right = max(width, center_x + radius + 1)
+            bottom = max(height, center_y + radius + 1)
+            sprite = pygame.Surface((right - left, bottom - top))
+            sprite.fill(_GOAL_COLORKEY)
+            rect = pygame.Rect(-left, -top, width, height)
+            pygame.draw.rect(sprite, COLOR_GOAL, rect)
+            pygame.draw.rect(sprite, COLOR_WHITE, rect, 2)
+            
+            # Draw star shape or indicator
+            pygame.draw.circle(sprite, COLOR_WHITE, (center_x - left, center_y - top), radius)
+            sprite = _to_display_format(sprite, alpha=False)
+            sprite.set_colorkey(_GOAL_COLORKEY, pygame.RLEACCEL)
+            entry = (sprite, left, top)
+            self._goal_sprites[key] = entry
+        return entry
     
     def draw_hud(self, player: Player, level_name: str = "") -> None:
         """Draw heads-up display.
         
         Renders the HUD including level name and magnetic boots state indicator.
+        Both lines are drawn with a single ``Surface.blits`` call.
         
         Args:
             player: The Player object to display status for.
@@ -179,20 +419,26 @@ class Renderer:
         if not self.font:
             return
         
+        draws = []
+        
         # Draw level name
         if level_name:
-            text = self.font.render(level_name, True, COLOR_WHITE)
-            self.screen.blit(text, (10, 10))
+            text = self._render_text(level_name, COLOR_WHITE, self.font)
+            draws.append((text, (10, 10)))
+            self._mark_dirty(10, 10, text.get_width(), text.get_height())
         
         # Draw magnetic state
-        state_text = "MAGNETIC BOOTS: "
-        state_text += "ON" if player.boots_active else "OFF"
-        if player.magnetic_state == "sticking":
-            state_text += " (STICKING)"
-        
-        color = COLOR_MAGNETIC_BLUE if player.boots_active else (150, 150, 150)
-        text = self.small_font.render(state_text, True, color)
-        self.screen.blit(text, (10, self.screen.get_height() - 30))
+        state = (player.boots_active, player.magnetic_state == MAGNETIC_STATE_STICKING)
+        text = self._hud_state_surfaces.get(state)
+        if text is None:
+            state_text, color = self._HUD_STATES[state]
+            text = _to_display_format(self.small_font.render(state_text, True, color))
+            self._hud_state_surfaces[state] = text
+        y = self.screen.get_height() - 30
+        draws.append((text, (10, y)))
+        self._mark_dirty(10, y, text.get_width(), text.get_height())
+        
+        self.screen.blits(draws, doreturn=0)
     
     def draw_text(
         self,
@@ -216,8 +462,9 @@ class Renderer:
         if font is None:
             return
         
-        surface = font.render(text, True, color)
+        surface = self._render_text(text, color, font)
         self.screen.blit(surface, (x, y))
+        self._mark_dirty(x, y, surface.get_width(), surface.get_height())
     
     def draw_centered_text(
         self,
@@ -239,14 +486,16 @@ class Renderer:
         if font is None:
             return
         
-        surface = font.render(text, True, color)
+        surface = self._render_text(text, color, font)
         x = (self.screen.get_width() - surface.get_width()) // 2
         self.screen.blit(surface, (x, y))
+        self._mark_dirty(x, y, surface.get_width(), surface.get_height())
     
     def draw_menu(self, title: str, options: List[str], selected: int) -> None:
         """Draw a menu screen.
         
-        Renders a menu with a title and selectable options.
+        Renders a menu with a title and selectable options, all horizontally
+        centered and drawn with a single ``Surface.blits`` call.
         
         Args:
             title: The menu title to display.
@@ -254,78 +503,134 @@ class Renderer:
             selected: Index of the currently selected option.
         """
         self.clear((20, 20, 30))
+        screen_width = self.screen.get_width()
+        draws = []
         
         # Draw title
-        if self.font:
-            title_font = pygame.font.Font(None, 72)
-            self.draw_centered_text(title, 100, COLOR_MAGNETIC_BLUE, title_font)
+        if self.title_font:
+            surface = self._render_text(title, COLOR_MAGNETIC_BLUE, self.title_font)
+            draws.append((surface, ((screen_width - surface.get_width()) // 2, 100)))
         
         # Draw options
-        for i, option in enumerate(options):
-            color = COLOR_GOAL if i == selected else COLOR_WHITE
-            y = 250 + i * 50
-            self.draw_centered_text(option, y, color)
+        if self.font:
+            for i, option in enumerate(options):
+                color = COLOR_GOAL if i == selected else COLOR_WHITE
+                surface = self._render_text(option, color, self.font)
+                draws.append((surface, ((screen_width - surface.get_width()) // 2, 250 + i * 50)))
+        
+        self.screen.blits(draws, doreturn=0)
+    
+    def _build_overlay(
+        self,
+        alpha: int,
+        lines: List[Tuple[str, int, Tuple[int, int, int], Optional[pygame.font.Font]]]
+    ) -> pygame.Surface:
+        """Render a translucent full-screen overlay with centered text.
+        
+        Args:
+            alpha: Opacity of the black backdrop (0-255).
+            lines: Text lines as (text, y, color, font) tuples. Lines whose
+                font is unavailable are skipped.
+        
+        Returns:
+            A per-pixel alpha surface the size of the screen, in the
+            display's pixel format when a display mode is set.
+        """
+        width, height = self.screen.get_size()
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, alpha))
+        for text, y, color, font in lines:
+            if font is None:
+                continue
+            surface = font.render(text, True, color)
+            overlay.blit(surface, ((width - surface.get_width()) // 2, y))
+        return _to_display_format(overlay)
+    
+    def _get_overlay(self, key: str) -> pygame.Surface:
+        """Get a cached overlay, rendering it on first use.
+        
+        All cached overlays are dropped when the screen has been resized
+        since they were rendered.
+        
+        Args:
+            key: One of "paused", "won" or "lost".
+        
+        Returns:
+            The overlay surface for the key.
+        """
+        size = self.screen.get_size()
+        if size != self._overlay_size:
+            self._overlays.clear()
+            self._overlay_size = size
+        overlay = self._overlays.get(key)
+        if overlay is None:
+            middle = self.screen.get_height() // 2
+            if key == "paused":
+                overlay = self._build_overlay(150, [
+                    ("PAUSED", middle - 50, COLOR_WHITE, self.font),
+                    ("Press ESC to resume or R to restart", middle + 20, COLOR_WHITE, self.small_font),
+                ])
+            else:
+                title, color = (("LEVEL COMPLETE!", COLOR_GOAL) if key == "won"
+                                else ("GAME OVER", (255, 100, 100)))
+                overlay = self._build_overlay(180, [
+                    (title, middle - 50, color, self.font),
+                    ("Press R to restart or ESC for menu", middle + 20, COLOR_WHITE, self.small_font),
+                ])
+            self._overlays[key] = overlay
+        return overlay
     
     def draw_pause_overlay(self) -> None:
         """Draw pause screen overlay.
         
         Renders a semi-transparent overlay with pause text and control hints.
+        The overlay is rendered once and then blitted as a single surface.
         """
-        # Semi-transparent overlay
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Pause text
-        self.draw_centered_text("PAUSED", self.screen.get_height() // 2 - 50)
-        if self.small_font:
-            self.draw_centered_text(
-                "Press ESC to resume or R to restart",
-                self.screen.get_height() // 2 + 20,
-                font=self.small_font
-            )
+        self.screen.blit(self._get_overlay("paused"), (0, 0))
+        self._invalidate()
     
     def draw_game_over(self, won: bool) -> None:
         """Draw game over screen.
         
         Renders a game over overlay showing win or lose state with restart hints.
+        The overlay is rendered once and then blitted as a single surface.
         
         Args:
             won: True if the player won, False if the player lost.
         """
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
-        
-        if won:
-            self.draw_centered_text("LEVEL COMPLETE!", self.screen.get_height() // 2 - 50, COLOR_GOAL)
-        else:
-            self.draw_centered_text("GAME OVER", self.screen.get_height() // 2 - 50, (255, 100, 100))
-        
-        if self.small_font:
-            self.draw_centered_text(
-                "Press R to restart or ESC for menu",
-                self.screen.get_height() // 2 + 20,
-                font=self.small_font
-            )
+        self.screen.blit(self._get_overlay("won" if won else "lost"), (0, 0))
+        self._invalidate()
     
     def update_camera(self, player: Player, level: Level) -> None:
         """Update camera to follow player.
         
+        The camera is bound to a level's size the first time it follows a
+        player through that level.
+        
         Args:
             player: The Player object for the camera to follow.
             level: The Level object for boundary constraints.
         """
-        self.camera.follow(
-            player.x + player.width / 2,
-            player.y + player.height / 2,
-            level.width,
-            level.height
-        )
+        camera = self.camera
+        if level is not self._camera_level:
+            camera.bind_level(level.width, level.height)
+            self._camera_level = level
+        camera.follow(player.x + player.width / 2, player.y + player.height / 2)
     
     def present(self) -> None:
         """Present the rendered frame.
         
-        Flips the display buffer to show the rendered content.
+        When the frame only differs from the previous one where moving
+        things were drawn, just those areas (from both frames) are updated.
+        Otherwise, or when there are more than DIRTY_RECT_MAX of them, the
+        whole display buffer is flipped.
         """
-        pygame.display.flip()
+        dirty = self._dirty
+        last_dirty = self._last_dirty
+        if self._full_redraw or len(dirty) + len(last_dirty) > DIRTY_RECT_MAX:
+            pygame.display.flip()
+        else:
+            pygame.display.update(last_dirty + dirty)
+        self._last_dirty = dirty
+        self._dirty = []
+        self._full_redraw = True
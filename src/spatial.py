@@ -0,0 +1,93 @@
+"""Spatial indexing helpers for broad-phase collision queries."""
+
+from typing import Any, Dict, Iterator, List, Tuple
+
+from .constants import SPATIAL_CELL_SIZE
+
+
+class SpatialGrid:
+    """Uniform grid that buckets items by the cells their rects overlap.
+
+    Queries return every item whose rect shares at least one cell with the
+    query rect, so any item that actually overlaps the query is guaranteed
+    to be returned. Results are deduplicated and kept in insertion order so
+    callers that resolve collisions in order behave the same as a plain
+    list scan.
+    """
+
+    def __init__(self, cell_size: float = SPATIAL_CELL_SIZE):
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_size: Width and height of each grid cell in pixels
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        self.items: List[Any] = []
+
+    def __len__(self) -> int:
+        """Get the number of items in the grid.
+
+        Returns:
+            int: The number of inserted items.
+        """
+        return len(self.items)
+
+    def _cell_range(
+        self,
+        rect: Tuple[float, float, float, float]
+    ) -> Iterator[Tuple[int, int]]:
+        """Iterate over the cells covered by a rect.
+
+        Args:
+            rect: Bounding rect as (x, y, width, height).
+
+        Returns:
+            Iterator[Tuple[int, int]]: The (column, row) keys of every
+                covered cell.
+        """
+        x, y, w, h = rect
+        size = self.cell_size
+        min_cx = int(x // size)
+        max_cx = int((x + w) // size)
+        min_cy = int(y // size)
+        max_cy = int((y + h) // size)
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                yield (cx, cy)
+
+    def insert(self, item: Any, rect: Tuple[float, float, float, float]) -> None:
+        """Insert an item into every cell its rect overlaps.
+
+        Args:
+            item: The item to store.
+            rect: The item's bounding rect as (x, y, width, height).
+        """
+        item_id = len(self.items)
+        self.items.append(item)
+        for key in self._cell_range(rect):
+            self.cells.setdefault(key, []).append(item_id)
+
+    def query(self, rect: Tuple[float, float, float, float]) -> List[Any]:
+        """Get candidate items near a rect.
+
+        Args:
+            rect: Query rect as (x, y, width, height).
+
+        Returns:
+            List[Any]: Items sharing a cell with the rect, in insertion order.
+        """
+        cells = self.cells
+        found = set()
+        for key in self._cell_range(rect):
+            bucket = cells.get(key)
+            if bucket:
+                found.update(bucket)
+        items = self.items
+        return [items[item_id] for item_id in sorted(found)]
+
+    def clear(self) -> None:
+        """Remove all items from the grid."""
+        self.cells.clear()
+        self.items.clear()
@@ -1,6 +1,7 @@
 """Tests for enemies module."""
 
 import pytest
+import math
 
 from src.enemies import Enemy, PatrolEnemy, FlyingEnemy, create_enemy_from_dict
 from src.platforms import Platform
@@ -58,6 +59,39 @@ class TestEnemyProperties:
         """
         enemy = Enemy(100, 200, width=32, height=32)
         assert enemy.rect == (100, 200, 32, 32)
+    
+    def test_pygame_rect_property(self):
+        """Test pygame_rect property.
+
+        Verifies that pygame_rect returns integer coordinates truncated
+        from the current float position.
+        """
+        enemy = Enemy(100.5, 200.5, width=32, height=32)
+        rect = enemy.pygame_rect
+        assert (rect.x, rect.y, rect.width, rect.height) == (100, 200, 32, 32)
+    
+    def test_pygame_rect_negative_position(self):
+        """Test pygame_rect truncates negative positions toward zero.
+
+        Verifies that the Rect matches int() truncation for enemies that
+        have moved above or left of the level origin.
+        """
+        enemy = Enemy(-10.7, -0.5)
+        rect = enemy.pygame_rect
+        assert (rect.x, rect.y) == (int(-10.7), int(-0.5))
+    
+    def test_pygame_rect_reused_and_refreshed(self):
+        """Test pygame_rect reuses one Rect that follows the enemy.
+
+        Verifies that the same Rect object is returned after the enemy
+        moves, and that it reflects the new position.
+        """
+        enemy = Enemy(100, 200)
+        first = enemy.pygame_rect
+        enemy.x = 150
+        second = enemy.pygame_rect
+        assert first is second
+        assert second.x == 150
 
 
 class TestEnemyMagneticForce:
@@ -113,6 +147,30 @@ class TestEnemyUpdate:
         initial_y = enemy.y
         enemy.update([])
         assert enemy.y == initial_y
+    
+    def test_update_lands_on_platform(self):
+        """Test a falling enemy lands on a platform.
+
+        Drops an enemy onto a platform and verifies it is snapped to the
+        platform top with its fall stopped.
+        """
+        enemy = Enemy(100, 265)
+        platform = Platform(0, 300, 400, 20)
+        for _ in range(10):
+            enemy.update([platform])
+        assert enemy.y == 300 - enemy.height
+        assert enemy.velocity_y == 0
+    
+    def test_update_touching_platform_edge_no_collision(self):
+        """Test touching a platform side is not a collision.
+
+        Verifies that an enemy whose right edge exactly meets a platform's
+        left edge keeps falling.
+        """
+        enemy = Enemy(68, 280, speed=0.0)
+        platform = Platform(100, 300, 100, 20)
+        enemy.update([platform])
+        assert enemy.y > 280
 
 
 class TestEnemyCollision:
@@ -298,6 +356,39 @@ class TestFlyingEnemy:
         assert max(positions) > 200  # Goes above start
         assert min(positions) < 200  # Goes below start
     
+    def test_matches_math_sin(self):
+        """Test table-driven movement tracks math.sin.
+
+        Updates a FlyingEnemy for several frames and verifies its height
+        stays within a fraction of a pixel of the exact sine curve.
+        """
+        enemy = FlyingEnemy(100, 200, amplitude=50, frequency=0.05)
+        for _ in range(200):
+            enemy.update([])
+            expected = 200 + 50 * math.sin(enemy.time * 0.05)
+            assert enemy.y == pytest.approx(expected, abs=0.2)
+    
+    def test_step_batch(self):
+        """Test batch stepping flying enemies.
+
+        Verifies that step_batch advances every living enemy the same
+        way as individual updates and leaves dead enemies untouched.
+        """
+        batched = [FlyingEnemy(100, 200), FlyingEnemy(300, 150, frequency=0.1)]
+        single = [FlyingEnemy(100, 200), FlyingEnemy(300, 150, frequency=0.1)]
+        dead = FlyingEnemy(500, 100)
+        dead.kill()
+        
+        for _ in range(10):
+            FlyingEnemy.step_batch(batched + [dead])
+            for enemy in single:
+                enemy.update([])
+        
+        for a, b in zip(batched, single):
+            assert a.x == b.x
+            assert a.y == b.y
+        assert dead.x == 500 and dead.y == 100
+    
     def test_to_dict(self):
         """Test flying enemy serialization.
 
@@ -356,3 +447,19 @@ class TestCreateEnemyFromDict:
         data = {'type': 'unknown', 'x': 100, 'y': 200}
         enemy = create_enemy_from_dict(data)
         assert isinstance(enemy, Enemy)
+    
+    def test_optional_keys_passed_through(self):
+        """Test optional keys reach the constructor.
+
+        Verifies that type-specific and base keys are applied, and that
+        keys belonging to other enemy types are ignored.
+        """
+        data = {
+            'type': 'flying', 'x': 100, 'y': 200, 'amplitude': 30,
+            'speed': 4.0, 'is_magnetic': False, 'patrol_distance': 80
+        }
+        enemy = create_enemy_from_dict(data)
+        assert enemy.amplitude == 30
+        assert enemy.speed == 4.0
+        assert enemy.is_magnetic is False
+        assert not hasattr(enemy, 'patrol_distance')
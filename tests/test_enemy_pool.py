@@ -0,0 +1,176 @@
+"""Tests for enemy_pool module."""
+
+import pytest
+
+from src.enemy_pool import EnemyPool
+from src.enemies import Enemy, PatrolEnemy, FlyingEnemy
+from src.platforms import Platform
+
+
+class TestEnemyPoolInit:
+    """Tests for EnemyPool initialization."""
+
+    def test_empty_pool(self):
+        """Test a new pool is empty.
+
+        Verifies that a freshly created pool has no enemies and iterates
+        over nothing.
+        """
+        pool = EnemyPool()
+        assert len(pool) == 0
+        assert list(pool) == []
+
+    def test_add_enemy(self):
+        """Test adding an enemy.
+
+        Verifies that added enemies are stored in insertion order and are
+        visible through both the enemies list and iteration.
+        """
+        pool = EnemyPool()
+        first = Enemy(0, 0)
+        second = Enemy(50, 0)
+        pool.add(first)
+        pool.add(second)
+        assert len(pool) == 2
+        assert pool.enemies == [first, second]
+        assert list(pool) == [first, second]
+
+
+class TestEnemyPoolUpdate:
+    """Tests for update_all method."""
+
+    def test_update_all_matches_individual_update(self):
+        """Test batched update matches per-enemy update.
+
+        Steps one set of enemies through the pool and an identical set
+        through Enemy.update, then verifies both end in the same state.
+        """
+        platforms = [Platform(0, 300, 800, 50)]
+        platform_rects = [platform.rect for platform in platforms]
+        pooled = [Enemy(100, 250), PatrolEnemy(200, 250), FlyingEnemy(300, 100)]
+        single = [Enemy(100, 250), PatrolEnemy(200, 250), FlyingEnemy(300, 100)]
+
+        pool = EnemyPool()
+        for enemy in pooled:
+            pool.add(enemy)
+
+        for _ in range(30):
+            pool.update_all(lambda rect: platform_rects)
+            for enemy in single:
+                enemy.update(platforms)
+
+        for a, b in zip(pooled, single):
+            assert a.x == pytest.approx(b.x)
+            assert a.y == pytest.approx(b.y)
+            assert a.velocity_y == pytest.approx(b.velocity_y)
+
+    def test_update_all_skips_dead_enemies(self):
+        """Test dead enemies are not updated.
+
+        Verifies that a killed enemy keeps its position when the pool
+        is updated.
+        """
+        pool = EnemyPool()
+        enemy = Enemy(100, 200)
+        enemy.kill()
+        pool.add(enemy)
+
+        pool.update_all(lambda rect: [])
+
+        assert enemy.x == 100
+        assert enemy.y == 200
+
+    def test_update_all_culls_walking_enemies(self):
+        """Test walking enemies outside the view are frozen.
+
+        Verifies that only the walking enemy inside the view moves, while
+        a flying enemy outside it is still advanced.
+        """
+        pool = EnemyPool()
+        inside = Enemy(100, 100)
+        outside = Enemy(1000, 100)
+        flyer = FlyingEnemy(1000, 300)
+        for enemy in (inside, outside, flyer):
+            pool.add(enemy)
+        
+        pool.update_all(lambda rect: [], view=(0, 0, 400, 400))
+        
+        assert inside.y != 100
+        assert outside.y == 100
+        assert flyer.time == 1
+    
+    def test_awake_matches_update_all(self):
+        """Test awake lists the living enemies update_all advances.
+
+        Verifies that walking enemies outside the view and dead enemies
+        are left out, while flying enemies are always included.
+        """
+        pool = EnemyPool()
+        inside = Enemy(100, 100)
+        outside = Enemy(1000, 100)
+        dead = Enemy(150, 100)
+        dead.kill()
+        flyer = FlyingEnemy(1000, 300)
+        for enemy in (inside, outside, dead, flyer):
+            pool.add(enemy)
+        
+        assert pool.awake((0, 0, 400, 400)) == [inside, flyer]
+        assert pool.awake() == [inside, outside, flyer]
+    
+    def test_update_all_applies_magnetic_force(self):
+        """Test magnetic forces are applied before moving.
+
+        Verifies that magnetic enemies receive the queried force and
+        non-magnetic enemies do not.
+        """
+        pool = EnemyPool()
+        magnetic = Enemy(100, 100, speed=0.0)
+        inert = Enemy(200, 100, speed=0.0, is_magnetic=False)
+        pool.add(magnetic)
+        pool.add(inert)
+        
+        pool.update_all(
+            lambda rect: [],
+            magnetic_forces=lambda positions: [(1.0, 0.0)] * len(positions)
+        )
+        
+        assert magnetic.x == 101
+        assert inert.x == 200
+    
+    def test_force_query_skips_inert_enemies(self):
+        """Test the force pass only visits magnetic enemies.
+
+        Verifies that the magnetic force query is made once for the whole
+        batch, with one position per magnetic enemy and none for
+        non-magnetic ones.
+        """
+        pool = EnemyPool()
+        pool.add(Enemy(100, 100))
+        pool.add(Enemy(200, 100, is_magnetic=False))
+        pool.add(FlyingEnemy(300, 100, is_magnetic=False))
+        pool.add(FlyingEnemy(400, 100))
+        queries = []
+        
+        def forces_at(positions):
+            queries.append(list(positions))
+            return [(0.0, 0.0)] * len(positions)
+        
+        pool.update_all(lambda rect: [], magnetic_forces=forces_at)
+        
+        assert len(queries) == 1
+        assert len(queries[0]) == 2
+    
+    def test_revive_all(self):
+        """Test reviving all enemies.
+
+        Verifies that revive_all marks every enemy in the pool as alive.
+        """
+        pool = EnemyPool()
+        enemies = [Enemy(0, 0), Enemy(50, 0)]
+        for enemy in enemies:
+            enemy.kill()
+            pool.add(enemy)
+
+        pool.revive_all()
+
+        assert all(enemy.alive for enemy in enemies)
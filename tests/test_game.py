@@ -235,6 +235,85 @@ class TestGameHandleEvents:
         game.handle_events()
         
         assert game.running is False
+    
+    @patch('src.game.pygame')
+    def test_key_events_reach_input_handler(self, mock_pygame):
+        """Test key events are fed to the input handler.
+
+        Verifies that handle_events passes non-quit events to the input
+        handler in the same pass and keeps the game running.
+
+        Args:
+            mock_pygame: Mocked pygame module to simulate a key event.
+        """
+        mock_pygame.display.set_mode.return_value = MagicMock()
+        mock_pygame.QUIT = 256
+        
+        from src.game import Game
+        from src import input_handler
+        
+        game = Game()
+        key_event = MagicMock()
+        key_event.type = input_handler.pygame.KEYDOWN
+        key_event.key = game.input_handler.bindings['jump']
+        mock_pygame.event.get.return_value = [key_event]
+        
+        game.handle_events()
+        
+        assert game.running is True
+        assert game.input_handler.is_action_just_pressed('jump')
+    
+    @patch('src.game.pygame')
+    def test_event_queue_filtered(self, mock_pygame):
+        """Test only quit and key events are let into the queue.
+
+        Verifies that the game restricts the SDL queue to quit and key
+        events once at startup and then reads it unfiltered, which keeps
+        events in order.
+
+        Args:
+            mock_pygame: Mocked pygame module to inspect queue calls.
+        """
+        mock_pygame.display.set_mode.return_value = MagicMock()
+        mock_pygame.QUIT = 256
+        mock_pygame.event.get.return_value = []
+        
+        from src.game import Game
+        from src.input_handler import InputHandler
+        
+        game = Game()
+        game.handle_events()
+        
+        mock_pygame.event.set_blocked.assert_called_once_with(None)
+        mock_pygame.event.set_allowed.assert_called_once_with((256,) + InputHandler.KEY_EVENT_FILTER)
+        mock_pygame.event.get.assert_called_once_with()
+    
+    @patch('src.game.pygame')
+    def test_release_then_press_keeps_key_held(self, mock_pygame):
+        """Test a key released and pressed again in one frame stays held.
+
+        Verifies that a KEYUP followed by a KEYDOWN of the same key within
+        one frame leaves the key pressed.
+
+        Args:
+            mock_pygame: Mocked pygame module to simulate key events.
+        """
+        mock_pygame.display.set_mode.return_value = MagicMock()
+        mock_pygame.QUIT = 256
+        
+        from src.game import Game
+        from src import input_handler
+        
+        game = Game()
+        key = game.input_handler.bindings['move_right']
+        game.input_handler.keys_pressed.add(key)
+        keyup_event = MagicMock(type=input_handler.pygame.KEYUP, key=key)
+        keydown_event = MagicMock(type=input_handler.pygame.KEYDOWN, key=key)
+        mock_pygame.event.get.return_value = [keyup_event, keydown_event]
+        
+        game.handle_events()
+        
+        assert game.input_handler.is_action_pressed('move_right')
 
 
 class TestGameUpdateMenu:
@@ -325,7 +404,7 @@ class TestGameUpdatePlaying:
         
         game = Game()
         game._start_level(0)
-        game.input_handler.is_action_just_pressed = lambda a: a == 'pause'
+        game.input_handler.keys_just_pressed.add(game.input_handler.bindings['pause'])
         
         game.update_playing()
         
@@ -484,3 +563,60 @@ class TestGameUpdateGameOver:
         game.update_game_over()
         
         assert game.state == GameState.MENU
+
+
+class TestGameRenderFrozen:
+    """Tests for reusing the last frame in frozen states."""
+    
+    @patch('src.game.pygame')
+    def test_paused_scene_drawn_once(self, mock_pygame):
+        """Test the paused scene is drawn only on the first frame.
+
+        Verifies that later paused frames blit the captured frame instead
+        of redrawing the level, while the overlay is drawn every frame.
+
+        Args:
+            mock_pygame: Mocked pygame module to avoid display initialization.
+        """
+        mock_pygame.display.set_mode.return_value = MagicMock()
+        
+        from src.game import Game, GameState
+        
+        game = Game()
+        game._start_level(0)
+        game.state = GameState.PAUSED
+        game.renderer = MagicMock()
+        
+        game.render()
+        game.render()
+        game.render()
+        
+        assert game.renderer.draw_level.call_count == 1
+        assert game.renderer.draw_pause_overlay.call_count == 3
+        game.screen.blit.assert_called_with(game.screen.copy.return_value, (0, 0))
+    
+    @patch('src.game.pygame')
+    def test_frame_recaptured_after_resume(self, mock_pygame):
+        """Test the frozen frame is dropped when play resumes.
+
+        Verifies that pausing again after playing draws the scene afresh.
+
+        Args:
+            mock_pygame: Mocked pygame module to avoid display initialization.
+        """
+        mock_pygame.display.set_mode.return_value = MagicMock()
+        
+        from src.game import Game, GameState
+        
+        game = Game()
+        game._start_level(0)
+        game.renderer = MagicMock()
+        
+        game.state = GameState.PAUSED
+        game.render()
+        game.state = GameState.PLAYING
+        game.render()
+        game.state = GameState.GAME_OVER
+        game.render()
+        
+        assert game.renderer.draw_level.call_count == 3
@@ -4,7 +4,10 @@ import pytest
 from unittest.mock import MagicMock, patch
 import pygame
 
-from src.input_handler import InputHandler, InputAction, create_game_input_handler
+from src.input_handler import (
+    InputHandler, InputAction, ActionFlag, create_game_input_handler,
+    JUMP_BIT, MOVE_LEFT_BIT
+)
 
 
 class TestInputHandlerInit:
@@ -85,6 +88,43 @@ class TestInputHandlerUpdate:
         handler.update([])
         
         assert pygame.K_SPACE not in handler.keys_just_pressed
+    
+    def test_feed_single_event(self):
+        """Test feeding events one at a time.
+
+        Verifies that begin_frame clears per-frame state and feed applies
+        a KEYDOWN event the same way update does.
+        """
+        handler = InputHandler()
+        handler.keys_just_released.add(pygame.K_a)
+        
+        keydown_event = MagicMock()
+        keydown_event.type = pygame.KEYDOWN
+        keydown_event.key = pygame.K_SPACE
+        
+        handler.begin_frame()
+        handler.feed(keydown_event)
+        
+        assert len(handler.keys_just_released) == 0
+        assert pygame.K_SPACE in handler.keys_pressed
+        assert pygame.K_SPACE in handler.keys_just_pressed
+    
+    def test_update_from_queue_reads_in_order(self):
+        """Test update_from_queue reads the queue unfiltered.
+
+        Verifies that the queue is read without a type filter, which would
+        regroup events by type, and the returned events are applied.
+        """
+        handler = InputHandler()
+        keydown_event = MagicMock()
+        keydown_event.type = pygame.KEYDOWN
+        keydown_event.key = pygame.K_SPACE
+        
+        with patch('src.input_handler.pygame.event.get', return_value=[keydown_event]) as get:
+            handler.update_from_queue()
+        
+        get.assert_called_once_with()
+        assert pygame.K_SPACE in handler.keys_just_pressed
 
 
 class TestInputHandlerActionChecks:
@@ -145,6 +185,29 @@ class TestInputHandlerActionChecks:
         """
         handler = InputHandler()
         assert handler.is_action_pressed('unknown_action') is False
+    
+    def test_action_follows_set_binding(self):
+        """Test action checks use keys rebound with set_binding.
+
+        Verifies that after rebinding jump, only the new key triggers it.
+        """
+        handler = InputHandler()
+        handler.set_binding('jump', pygame.K_w)
+        handler.keys_pressed.add(pygame.K_SPACE)
+        assert handler.is_action_pressed('jump') is False
+        
+        handler.keys_pressed.add(pygame.K_w)
+        assert handler.is_action_pressed('jump') is True
+    
+    def test_alt_only_binding(self):
+        """Test an action bound only through its alt key.
+
+        Verifies that an action with no primary binding is still
+        triggered by its alt key.
+        """
+        handler = InputHandler(custom_bindings={'dash_alt': pygame.K_s})
+        handler.keys_pressed.add(pygame.K_s)
+        assert handler.is_action_pressed('dash') is True
 
 
 class TestInputHandlerMovementVector:
@@ -216,6 +279,95 @@ class TestInputHandlerMovementVector:
         handler.keys_pressed.add(pygame.K_LEFT)
         handler.keys_pressed.add(pygame.K_RIGHT)
         assert handler.get_movement_vector()[0] == 0
+    
+    def test_movement_follows_set_binding(self):
+        """Test movement uses keys rebound with set_binding.
+
+        Verifies that a rebound move_left key produces leftward movement.
+        """
+        handler = InputHandler()
+        handler.set_binding('move_left', pygame.K_m)
+        handler.keys_pressed.add(pygame.K_m)
+        assert handler.get_movement_vector() == (-1, 0)
+    
+    def test_non_movement_keys_give_no_movement(self):
+        """Test keys unrelated to movement are ignored.
+
+        Verifies that holding only non-movement keys, including a key that
+        was unbound from movement, yields (0, 0).
+        """
+        handler = InputHandler()
+        handler.set_binding('move_left', pygame.K_m)
+        handler.keys_pressed.update({pygame.K_SPACE, pygame.K_ESCAPE, pygame.K_LEFT})
+        assert handler.get_movement_vector() == (0, 0)
+
+
+class TestInputHandlerSnapshot:
+    """Tests for snapshot method."""
+    
+    def test_no_keys(self):
+        """Test snapshot with nothing pressed.
+
+        Verifies that an idle handler reports no action flags.
+        """
+        handler = InputHandler()
+        assert handler.snapshot() == 0
+    
+    def test_returns_plain_int(self):
+        """Test snapshot returns a plain int rather than an ActionFlag.
+
+        Verifies the per-frame result avoids IntFlag's Python-level
+        operators while keeping the same bit values.
+        """
+        handler = InputHandler()
+        handler.keys_just_pressed.add(pygame.K_SPACE)
+        flags = handler.snapshot()
+        assert type(flags) is int
+        assert JUMP_BIT == ActionFlag.JUMP
+    
+    def test_primary_and_alt_keys(self):
+        """Test snapshot packs several actions into one value.
+
+        Presses the jump key and the alt move-left key and verifies both
+        flags are set and no others.
+        """
+        handler = InputHandler()
+        handler.keys_just_pressed.add(pygame.K_SPACE)
+        handler.keys_just_pressed.add(pygame.K_a)
+        
+        flags = handler.snapshot()
+        
+        assert flags == JUMP_BIT | MOVE_LEFT_BIT
+    
+    def test_matches_is_action_just_pressed(self):
+        """Test snapshot agrees with per-action checks.
+
+        Verifies that each flag is set exactly when is_action_just_pressed
+        reports the action.
+        """
+        handler = InputHandler()
+        handler.keys_just_pressed.update([pygame.K_ESCAPE, pygame.K_m, pygame.K_DOWN])
+        flags = handler.snapshot()
+        
+        for action in ['move_left', 'move_right', 'move_up', 'move_down',
+                       'jump', 'toggle_magnetic', 'sprint', 'pause', 'restart']:
+            flag = getattr(ActionFlag, action.upper())
+            assert bool(flags & flag) == handler.is_action_just_pressed(action)
+    
+    def test_follows_set_binding(self):
+        """Test snapshot uses rebound keys.
+
+        Verifies that after rebinding jump, the new key sets the flag and
+        the old key no longer does.
+        """
+        handler = InputHandler()
+        handler.set_binding('jump', pygame.K_w)
+        
+        handler.keys_just_pressed.add(pygame.K_SPACE)
+        assert not handler.snapshot() & JUMP_BIT
+        
+        handler.keys_just_pressed.add(pygame.K_w)
+        assert handler.snapshot() & JUMP_BIT
 
 
 class TestInputHandlerBindings:
@@ -4,14 +4,15 @@ import pytest
 import json
 import tempfile
 import os
+from unittest.mock import patch
 
 from src.level import Level, create_demo_level, create_tutorial_level
 from src.platforms import Platform, MovingPlatform
 from src.magnets import Magnet
-from src.enemies import Enemy, PatrolEnemy
+from src.enemies import Enemy, PatrolEnemy, FlyingEnemy
 from src.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
-    ORIENTATION_FLOOR, POLARITY_ATTRACT
+    ORIENTATION_FLOOR, POLARITY_ATTRACT, POLARITY_REPEL
 )
 
 
@@ -121,6 +122,166 @@ class TestLevelGoalRect:
         level = Level()
         level.set_goal(100, 200, 50, 75)
         assert level.goal_rect == (100, 200, 50, 75)
+    
+    def test_goal_rect_cached_until_goal_changes(self):
+        """Test goal rect caching.
+
+        Verifies that repeated reads return the same tuple and that
+        assigning goal_position or goal_size refreshes it.
+        """
+        level = Level()
+        level.set_goal(100, 200, 50, 75)
+        assert level.goal_rect is level.goal_rect
+        
+        level.goal_position = (300, 400)
+        assert level.goal_rect == (300, 400, 50, 75)
+        level.goal_size = (10, 20)
+        assert level.goal_rect == (300, 400, 10, 20)
+
+
+class TestLevelPlatformsNear:
+    """Tests for platforms_near method."""
+    
+    def test_finds_overlapping_platform(self):
+        """Test an overlapping platform is returned.
+
+        Verifies that a platform under the query rect is a candidate.
+        """
+        level = Level()
+        platform = Platform(0, 550, 800, 50)
+        level.add_platform(platform)
+        assert level.platforms_near((100, 520, 32, 48)) == [platform]
+    
+    def test_skips_distant_platform(self):
+        """Test a distant static platform is culled.
+
+        Verifies that a platform far away from the query rect is not
+        returned by the spatial grid.
+        """
+        level = Level()
+        level.add_platform(Platform(2000, 2000, 100, 30))
+        assert level.platforms_near((100, 100, 32, 48)) == []
+    
+    def test_moving_platforms_always_included(self):
+        """Test moving platforms are always candidates.
+
+        Verifies that moving platforms are returned regardless of distance,
+        and that results keep the level's platform order.
+        """
+        level = Level()
+        moving = MovingPlatform(2000, 2000, 50, 20, end_x=2100, end_y=2000)
+        ground = Platform(0, 550, 800, 50)
+        level.add_platform(moving)
+        level.add_platform(ground)
+        assert level.platforms_near((100, 520, 32, 48)) == [moving, ground]
+    
+    def test_grid_rebuilt_after_add(self):
+        """Test the grid picks up newly added platforms.
+
+        Queries once to build the grid, adds a platform, then verifies
+        the new platform is found.
+        """
+        level = Level()
+        level.platforms_near((0, 0, 10, 10))
+        platform = Platform(0, 0, 100, 30)
+        level.add_platform(platform)
+        assert level.platforms_near((0, 0, 10, 10)) == [platform]
+    
+    def test_refresh_after_static_platform_change(self):
+        """Test refresh_platforms picks up a moved static platform.
+
+        Moves a static platform after the grid is built and verifies it
+        is found at its new position once refresh_platforms is called.
+        """
+        level = Level()
+        platform = Platform(0, 0, 100, 30)
+        level.add_platform(platform)
+        assert level.platforms_near((500, 500, 10, 10)) == []
+        
+        platform.x = 480
+        platform.y = 480
+        level.refresh_platforms()
+        
+        assert level.platforms_near((500, 500, 10, 10)) == [platform]
+
+
+class TestLevelDynamicObjectsNear:
+    """Tests for dynamic_objects_near method."""
+    
+    def test_finds_enemy(self):
+        """Test an overlapping enemy is returned.
+
+        Verifies that the quadtree reports an enemy under the query rect
+        and skips one elsewhere.
+        """
+        level = Level()
+        near = Enemy(100, 100)
+        far = Enemy(600, 400)
+        level.add_enemy(near)
+        level.add_enemy(far)
+        assert level.dynamic_objects_near((90, 90, 32, 48)) == [near]
+    
+    def test_index_follows_update(self):
+        """Test the index tracks moved enemies.
+
+        Verifies that after Level.update the enemy is found at its new
+        position.
+        """
+        level = Level()
+        enemy = Enemy(100, 100)
+        level.add_enemy(enemy)
+        level.update()
+        assert level.dynamic_objects_near(enemy.rect) == [enemy]
+    
+    def test_includes_moving_platforms(self):
+        """Test moving platforms are indexed.
+
+        Verifies that a moving platform is returned while static
+        platforms are not part of the dynamic index.
+        """
+        level = Level()
+        moving = MovingPlatform(100, 100, 50, 20, end_x=200, end_y=100)
+        level.add_platform(moving)
+        level.add_platform(Platform(100, 100, 50, 20))
+        assert level.dynamic_objects_near((90, 90, 40, 40)) == [moving]
+    
+    def test_refreshed_only_when_queried(self):
+        """Test update leaves the index alone until it is queried.
+
+        Verifies that Level.update does not refresh the index itself and
+        that the next query refreshes it once.
+        """
+        level = Level()
+        enemy = Enemy(100, 100)
+        level.add_enemy(enemy)
+        
+        with patch.object(Level, 'update_dynamic_index', autospec=True,
+                          side_effect=Level.update_dynamic_index) as refresh:
+            level.update()
+            level.update()
+            assert refresh.call_count == 0
+            
+            level.dynamic_objects_near(enemy.rect)
+            level.dynamic_objects_near(enemy.rect)
+            assert refresh.call_count == 1
+    
+    def test_skips_dead_and_frozen_enemies(self):
+        """Test dead enemies and enemies frozen by culling are not indexed.
+
+        Updates with a view covering only one enemy and verifies that a
+        culled enemy and a dead one are left out of the index.
+        """
+        level = Level()
+        awake = Enemy(100, 100)
+        frozen = Enemy(700, 100)
+        dead = Enemy(150, 100)
+        dead.kill()
+        for enemy in (awake, frozen, dead):
+            level.add_enemy(enemy)
+        
+        level.update((0, 0, 300, 300))
+        
+        assert level.dynamic_objects_near((0, 0, 800, 600)) == [awake]
 
 
 class TestLevelMagneticForce:
@@ -164,6 +325,104 @@ class TestLevelMagneticForce:
         # Force at midpoint should be near zero (balanced)
         force = level.get_total_magnetic_force((100, 100))
         assert abs(force[0]) < 0.1
+    
+    def test_matches_sum_over_all_magnets(self):
+        """Test the grid lookup matches summing every magnet.
+
+        Scatters magnets across a wide level and verifies the total force
+        at several positions equals the brute-force sum.
+        """
+        level = Level()
+        for i in range(10):
+            level.add_magnet(Magnet(i * 90, 100 + (i % 3) * 60, range_=60 + i * 10))
+        
+        for position in [(0, 100), (250, 150), (475, 220), (900, 100), (2000, 2000)]:
+            expected_x = sum(m.get_force_on_object(position)[0] for m in level.magnets)
+            expected_y = sum(m.get_force_on_object(position)[1] for m in level.magnets)
+            force = level.get_total_magnetic_force(position)
+            assert force[0] == pytest.approx(expected_x)
+            assert force[1] == pytest.approx(expected_y)
+    
+    def test_grid_rebuilt_after_add(self):
+        """Test magnets added after a query are picked up.
+
+        Verifies that adding a magnet invalidates the cached grid.
+        """
+        level = Level()
+        assert level.get_total_magnetic_force((100, 100)) == (0.0, 0.0)
+        level.add_magnet(Magnet(150, 100, POLARITY_ATTRACT, range_=100))
+        assert level.get_total_magnetic_force((100, 100))[0] > 0
+    
+    def test_mixed_polarity_and_inactive_magnets(self):
+        """Test repelling and inactive magnets match the per-magnet API.
+
+        Verifies the total equals the sum of Magnet.get_force_on_object,
+        including repelling magnets and skipping inactive ones.
+        """
+        level = Level()
+        level.add_magnet(Magnet(150, 100, POLARITY_ATTRACT, range_=120, strength=0.6))
+        level.add_magnet(Magnet(60, 140, POLARITY_REPEL, range_=100, strength=0.8))
+        inactive = Magnet(100, 60, POLARITY_ATTRACT, range_=150)
+        inactive.active = False
+        level.add_magnet(inactive)
+        
+        position = (100, 100)
+        force = level.get_total_magnetic_force(position)
+        expected_x = sum(m.get_force_on_object(position)[0] for m in level.magnets)
+        expected_y = sum(m.get_force_on_object(position)[1] for m in level.magnets)
+        assert force[0] == pytest.approx(expected_x)
+        assert force[1] == pytest.approx(expected_y)
+    
+    def test_magnet_changes_invalidate_cache(self):
+        """Test changes to existing magnets are picked up automatically.
+
+        Verifies that toggling, flipping polarity and moving a magnet all
+        take effect on the next query without calling refresh_magnets.
+        """
+        level = Level()
+        magnet = Magnet(150, 100, POLARITY_ATTRACT, range_=100)
+        level.add_magnet(magnet)
+        assert level.get_total_magnetic_force((100, 100))[0] > 0
+        
+        magnet.toggle()
+        assert level.get_total_magnetic_force((100, 100)) == (0.0, 0.0)
+        
+        magnet.toggle()
+        magnet.polarity = POLARITY_REPEL
+        assert level.get_total_magnetic_force((100, 100))[0] < 0
+        
+        magnet.x = 500
+        assert level.get_total_magnetic_force((100, 100)) == (0.0, 0.0)
+    
+    def test_refresh_after_in_place_edit(self):
+        """Test refresh_magnets picks up in-place edits of the magnet list.
+
+        Verifies that replacing a magnet in the list takes effect after
+        calling refresh_magnets.
+        """
+        level = Level()
+        level.add_magnet(Magnet(150, 100, POLARITY_ATTRACT, range_=100))
+        assert level.get_total_magnetic_force((100, 100))[0] > 0
+        
+        level.magnets[0] = Magnet(500, 100, POLARITY_ATTRACT, range_=100)
+        level.refresh_magnets()
+        
+        assert level.get_total_magnetic_force((100, 100)) == (0.0, 0.0)
+    
+    def test_batched_forces_match_single_queries(self):
+        """Test get_magnetic_forces matches per-position queries.
+
+        Verifies each batched result equals get_total_magnetic_force at
+        the same position, in order.
+        """
+        level = Level()
+        level.add_magnet(Magnet(150, 100, POLARITY_ATTRACT, range_=120))
+        level.add_magnet(Magnet(300, 200, POLARITY_REPEL, range_=90))
+        positions = [(100, 100), (280, 180), (1000, 1000)]
+        
+        forces = level.get_magnetic_forces(positions)
+        
+        assert forces == [level.get_total_magnetic_force(p) for p in positions]
 
 
 class TestLevelUpdate:
@@ -183,6 +442,43 @@ class TestLevelUpdate:
         level.update()
         assert platform.x != initial_x
     
+    def test_update_picks_up_new_moving_platforms(self):
+        """Test moving platforms added later are updated.
+
+        Verifies that the static/moving split is refreshed when a moving
+        platform is added after the level has already been updated, and
+        that static platforms are left in place.
+        """
+        level = Level()
+        static = Platform(0, 500, 800, 50)
+        level.add_platform(static)
+        level.update()
+        
+        platform = MovingPlatform(100, 200, 50, 20, end_x=200, end_y=200, speed=5.0)
+        level.add_platform(platform)
+        level.update()
+        
+        assert platform.x != 100
+        assert static.x == 0
+    
+    def test_update_syncs_platform_array(self):
+        """Test moving platform rows in the platform array follow updates.
+
+        Verifies that after update the array columns match the moving
+        platform's new position.
+        """
+        level = Level()
+        platform = MovingPlatform(100, 200, 50, 20, end_x=200, end_y=200, speed=5.0)
+        level.add_platform(Platform(0, 500, 800, 50))
+        level.add_platform(platform)
+        
+        level.update()
+        
+        platform_array = level.platform_array
+        assert len(platform_array) == 2
+        assert platform_array.xs[1] == platform.x
+        assert platform_array.ys[1] == platform.y
+    
     def test_update_enemies(self):
         """Test enemies are updated.
 
@@ -196,6 +492,95 @@ class TestLevelUpdate:
         initial_y = enemy.y
         level.update()
         assert enemy.y != initial_y  # Gravity applied
+    
+    def test_update_culls_distant_enemies(self):
+        """Test walking enemies far outside the view are not updated.
+
+        Verifies that an enemy beyond the cull margin keeps its position
+        while an enemy inside the view falls under gravity.
+        """
+        level = Level()
+        level.width = 4000
+        visible = Enemy(100, 200)
+        distant = Enemy(3000, 200)
+        level.add_enemy(visible)
+        level.add_enemy(distant)
+        
+        level.update((0, 0, 800, 600))
+        assert visible.y != 200
+        assert distant.y == 200
+    
+    def test_update_keeps_flying_enemies_in_phase(self):
+        """Test flying enemies advance even when off screen.
+
+        Verifies that a distant flying enemy still ticks so it does not
+        fall out of phase while culled.
+        """
+        level = Level()
+        level.width = 4000
+        flyer = FlyingEnemy(3000, 200)
+        level.add_enemy(flyer)
+        
+        level.update((0, 0, 800, 600))
+        assert flyer.time == 1
+
+
+class TestLevelEnemiesInView:
+    """Tests for enemies_in_view method."""
+    
+    def test_filters_by_view(self):
+        """Test only enemies overlapping the view are returned.
+
+        Verifies that an on-screen enemy is returned and an off-screen
+        one is not.
+        """
+        level = Level()
+        level.width = 2000
+        on_screen = Enemy(100, 100)
+        level.add_enemy(on_screen)
+        level.add_enemy(Enemy(1500, 100))
+        assert level.enemies_in_view((0, 0, 800, 600)) == [on_screen]
+    
+    def test_skips_dead_enemies(self):
+        """Test dead enemies are not returned.
+
+        Verifies that a killed enemy inside the view is excluded.
+        """
+        level = Level()
+        enemy = Enemy(100, 100)
+        enemy.kill()
+        level.add_enemy(enemy)
+        assert level.enemies_in_view((0, 0, 800, 600)) == []
+
+
+class TestLevelMagnetsInView:
+    """Tests for magnets_in_view method."""
+    
+    def test_filters_by_view(self):
+        """Test only magnets whose range reaches the view are returned.
+
+        Verifies that a magnet centered off screen is still returned while
+        its range circle reaches into the view, and a distant one is not.
+        """
+        level = Level()
+        on_screen = Magnet(100, 100)
+        edge = Magnet(850, 100, range_=100)
+        level.add_magnet(on_screen)
+        level.add_magnet(edge)
+        level.add_magnet(Magnet(1500, 100, range_=100))
+        assert level.magnets_in_view((0, 0, 800, 600)) == [on_screen, edge]
+    
+    def test_skips_inactive_magnets(self):
+        """Test inactive magnets are not returned.
+
+        Verifies that a deactivated magnet inside the view is excluded,
+        since it draws nothing.
+        """
+        level = Level()
+        magnet = Magnet(100, 100)
+        magnet.active = False
+        level.add_magnet(magnet)
+        assert level.magnets_in_view((0, 0, 800, 600)) == []
 
 
 class TestLevelSerialization:
@@ -333,6 +718,27 @@ class TestLevelSaveLoad:
             assert len(loaded.platforms) == 1
         finally:
             os.unlink(filepath)
+    
+    def test_saved_file_is_indented_json(self):
+        """Test the saved file layout.
+
+        Verifies that the file is two-space indented JSON readable by the
+        standard library, whichever encoder wrote it.
+        """
+        level = Level(name="Layout Test")
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            filepath = f.name
+        
+        try:
+            level.save(filepath)
+            with open(filepath, 'r') as f:
+                text = f.read()
+            
+            assert json.loads(text) == json.loads(json.dumps(level.to_dict()))
+            assert '\n  "name": "Layout Test"' in text
+        finally:
+            os.unlink(filepath)
 
 
 class TestDemoLevel:
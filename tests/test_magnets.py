@@ -67,6 +67,30 @@ class TestMagnetProperties:
         magnet = Magnet(100, 200, width=32, height=32)
         expected = (100 - 16, 200 - 16, 32, 32)
         assert magnet.rect == expected
+    
+    def test_range_squared_follows_range(self):
+        """Test the squared range is kept in step with range.
+        
+        Verifies that range_squared is set on construction and updated
+        when range is reassigned, and that is_in_range uses the new value.
+        """
+        magnet = Magnet(0, 0, range_=10)
+        assert magnet.range_squared == 100
+        
+        magnet.range = 20
+        assert magnet.range == 20
+        assert magnet.range_squared == 400
+        assert magnet.is_in_range((15, 0))
+    
+    def test_force_in_bounding_square_but_out_of_range(self):
+        """Test objects in the field's corner region get no force.
+
+        Verifies that a point inside the bounding square but outside the
+        circular range is rejected.
+        """
+        magnet = Magnet(100, 100, range_=100)
+        force = magnet.get_force_on_object((180, 180))
+        assert force == (0.0, 0.0)
 
 
 class TestMagnetForce:
@@ -205,6 +229,29 @@ class TestMagnetSetPolarity:
         magnet = Magnet(100, 100, POLARITY_ATTRACT)
         magnet.set_polarity("invalid")
         assert magnet.polarity == POLARITY_ATTRACT
+    
+    def test_signed_strength_follows_polarity(self):
+        """Test signed strength tracks polarity changes.
+        
+        Verifies that signed_strength is positive for attract, negative
+        for repel, and flips when set_polarity is called.
+        """
+        magnet = Magnet(100, 100, POLARITY_ATTRACT, strength=0.5)
+        assert magnet.signed_strength == 0.5
+        magnet.set_polarity(POLARITY_REPEL)
+        assert magnet.signed_strength == -0.5
+    
+    def test_polarity_assignment_updates_sign(self):
+        """Test assigning polarity directly keeps the sign in step.
+        
+        Verifies that setting the polarity attribute flips signed_strength
+        just like set_polarity does.
+        """
+        magnet = Magnet(100, 100, POLARITY_ATTRACT, strength=0.5)
+        magnet.polarity = POLARITY_REPEL
+        assert magnet.signed_strength == -0.5
+        magnet.polarity = POLARITY_ATTRACT
+        assert magnet.signed_strength == 0.5
 
 
 class TestMagnetGetColor:
@@ -229,6 +276,32 @@ class TestMagnetGetColor:
         assert magnet.get_color() == COLOR_MAGNETIC_RED
 
 
+class TestMagnetRangeSurface:
+    """Tests for the cached range indicator surface."""
+    
+    def test_surface_shared_between_matching_magnets(self):
+        """Test magnets with the same range and polarity share a surface.
+
+        Verifies the range surface is rendered once and reused by another
+        magnet with identical range and polarity.
+        """
+        first = Magnet(100, 100, range_=77)
+        second = Magnet(400, 300, range_=77)
+        assert first._get_range_surface(first.get_color()) is \
+            second._get_range_surface(second.get_color())
+    
+    def test_surface_differs_by_polarity(self):
+        """Test polarity selects a different surface.
+
+        Verifies that switching polarity yields the surface for the new
+        color rather than the cached one for the old polarity.
+        """
+        magnet = Magnet(100, 100, range_=78)
+        attract_surface = magnet._get_range_surface(magnet.get_color())
+        magnet.set_polarity(POLARITY_REPEL)
+        assert magnet._get_range_surface(magnet.get_color()) is not attract_surface
+
+
 class TestMagnetSerialization:
     """Tests for serialization methods."""
     
@@ -5,21 +5,28 @@ import math
 
 from src.physics import (
     calculate_distance,
+    calculate_distance_sq,
     calculate_direction,
     apply_gravity,
+    apply_gravity_free,
     apply_friction,
+    integrate_velocity,
     calculate_magnetic_force,
+    magnetic_force_xy,
     check_rect_collision,
     resolve_collision,
+    resolve_collision_xy,
     get_surface_normal,
     apply_surface_gravity,
+    apply_surface_gravity_xy,
     clamp
 )
 from src.constants import (
     GRAVITY, MAX_FALL_SPEED, FRICTION, AIR_RESISTANCE,
     MAGNETIC_STATE_NORMAL, MAGNETIC_STATE_STICKING,
     POLARITY_ATTRACT, POLARITY_REPEL,
-    ORIENTATION_FLOOR, ORIENTATION_CEILING, ORIENTATION_WALL_LEFT, ORIENTATION_WALL_RIGHT
+    ORIENTATION_FLOOR, ORIENTATION_CEILING, ORIENTATION_WALL_LEFT, ORIENTATION_WALL_RIGHT,
+    ORIENTATION_NONE
 )
 
 
@@ -66,6 +73,25 @@ class TestCalculateDistance:
         assert calculate_distance((-5, -5), (0, 0)) == pytest.approx(math.sqrt(50))
 
 
+class TestCalculateDistanceSq:
+    """Tests for calculate_distance_sq function."""
+    
+    def test_same_point(self):
+        """Test squared distance between identical points is zero.
+
+        Verifies that the squared distance from a point to itself is 0.
+        """
+        assert calculate_distance_sq((3, 7), (3, 7)) == 0
+    
+    def test_matches_squared_distance(self):
+        """Test squared distance matches calculate_distance squared.
+
+        Verifies the result for a 3-4-5 triangle and negative coordinates.
+        """
+        assert calculate_distance_sq((0, 0), (3, 4)) == 25
+        assert calculate_distance_sq((-5, -5), (0, 0)) == 50
+
+
 class TestCalculateDirection:
     """Tests for calculate_direction function."""
     
@@ -76,6 +102,14 @@ class TestCalculateDirection:
         """
         assert calculate_direction((0, 0), (0, 0)) == (0.0, 0.0)
     
+    def test_underflowing_distance(self):
+        """Test direction when the squared distance underflows.
+
+        Verifies that points too close for the squared distance to be
+        represented return (0, 0) instead of dividing by zero.
+        """
+        assert calculate_direction((0, 0), (1e-200, 0)) == (0.0, 0.0)
+    
     def test_right_direction(self):
         """Test direction to the right.
 
@@ -140,6 +174,15 @@ class TestApplyGravity:
         for _ in range(5):
             velocity = apply_gravity(velocity, MAGNETIC_STATE_NORMAL)
         assert velocity == 5 * GRAVITY
+    
+    def test_free_form_matches(self):
+        """Test the free-fall form matches apply_gravity when not sticking.
+
+        Verifies that apply_gravity_free gives the same velocity as
+        apply_gravity in the normal state, including at the fall cap.
+        """
+        for velocity in (0.0, -5.0, MAX_FALL_SPEED - GRAVITY / 2, MAX_FALL_SPEED):
+            assert apply_gravity_free(velocity) == apply_gravity(velocity, MAGNETIC_STATE_NORMAL)
 
 
 class TestApplyFriction:
@@ -170,6 +213,31 @@ class TestApplyFriction:
         assert apply_friction(0, on_ground=False) == 0
 
 
+class TestIntegrateVelocity:
+    """Tests for integrate_velocity function."""
+    
+    def test_matches_separate_steps(self):
+        """Test the fused step matches gravity then friction.
+
+        Verifies that, when not sticking, the result equals apply_gravity
+        on the vertical component and apply_friction on the horizontal one.
+        """
+        for velocity_y in (0.0, -7.5, MAX_FALL_SPEED - 0.1, MAX_FALL_SPEED):
+            for on_ground in (True, False):
+                assert integrate_velocity(4.0, velocity_y, on_ground, MAGNETIC_STATE_NORMAL) == (
+                    apply_friction(4.0, on_ground),
+                    apply_gravity(velocity_y, MAGNETIC_STATE_NORMAL)
+                )
+    
+    def test_sticking_keeps_vertical_velocity(self):
+        """Test no gravity is applied while sticking.
+
+        Verifies that a sticking object's vertical velocity, used for
+        climbing walls, is left unchanged while friction still applies.
+        """
+        assert integrate_velocity(2.0, -3.0, True, MAGNETIC_STATE_STICKING) == (2.0 * FRICTION, -3.0)
+
+
 class TestCalculateMagneticForce:
     """Tests for calculate_magnetic_force function."""
     
@@ -215,6 +283,19 @@ class TestCalculateMagneticForce:
         """
         force = calculate_magnetic_force((50, 50), (50, 50), 100, 1.0, POLARITY_ATTRACT)
         assert force == (0.0, 0.0)
+    
+    def test_scalar_form_matches(self):
+        """Test the scalar-argument form gives the same force.
+
+        Verifies that magnetic_force_xy agrees with calculate_magnetic_force
+        for an off-axis object, with repel given as a negative strength.
+        """
+        for polarity in (POLARITY_ATTRACT, POLARITY_REPEL):
+            expected = calculate_magnetic_force((10, 20), (50, 60), 100, 1.5, polarity)
+            signed = -1.5 if polarity == POLARITY_REPEL else 1.5
+            force = magnetic_force_xy(10, 20, 50, 60, 100, signed)
+            assert force[0] == pytest.approx(expected[0])
+            assert force[1] == pytest.approx(expected[1])
 
 
 class TestCheckRectCollision:
@@ -279,6 +360,58 @@ class TestResolveCollision:
         new_pos, new_vel, side = resolve_collision(player_rect, platform_rect, velocity)
         assert side == ORIENTATION_CEILING
         assert new_vel[1] == 0
+    
+    def test_resolve_side_collision(self):
+        """Test collision from the side (running into a wall).
+
+        Verifies that a player moving right into a platform's left edge is
+        pushed back out with zeroed horizontal velocity.
+        """
+        player_rect = (185, 50, 20, 20)
+        platform_rect = (200, 0, 50, 200)
+        velocity = (3, 1)
+        
+        new_pos, new_vel, side = resolve_collision(player_rect, platform_rect, velocity)
+        assert side == ORIENTATION_WALL_RIGHT
+        assert new_pos == (180, 50)
+        assert new_vel == (0, 1)
+    
+    def test_no_resolution_against_velocity(self):
+        """Test no resolution when moving away from the nearest side.
+
+        Verifies that a player overlapping the top of a platform while
+        moving upward is left unchanged with no collision side.
+        """
+        player_rect = (50, 90, 20, 20)
+        platform_rect = (0, 100, 200, 20)
+        velocity = (0, -5)
+        
+        new_pos, new_vel, side = resolve_collision(player_rect, platform_rect, velocity)
+        assert side == ORIENTATION_NONE
+        assert new_pos == (50, 90)
+        assert new_vel == (0, -5)
+    
+    def test_scalar_form_matches(self):
+        """Test the scalar form matches the tuple form on every side.
+
+        Verifies that resolve_collision_xy, given the platform's edges,
+        returns the same position, velocity and side as resolve_collision
+        for floor, ceiling, wall and unresolved cases.
+        """
+        platform_rect = (100, 100, 80, 40)
+        cases = [
+            ((120, 85, 20, 20), (1, 5)),
+            ((120, 135, 20, 20), (-1, -5)),
+            ((85, 110, 20, 20), (5, 0)),
+            ((175, 110, 20, 20), (-5, 0)),
+            ((120, 85, 20, 20), (0, -5)),
+        ]
+        left, top, width, height = platform_rect
+        for player_rect, velocity in cases:
+            (x, y), (vx, vy), side = resolve_collision(player_rect, platform_rect, velocity)
+            assert resolve_collision_xy(
+                *player_rect, *velocity, left, top, left + width, top + height
+            ) == (x, y, vx, vy, side)
 
 
 class TestGetSurfaceNormal:
@@ -318,6 +451,16 @@ class TestGetSurfaceNormal:
         Verifies that unrecognized orientations fall back to floor normal.
         """
         assert get_surface_normal("unknown") == (0, -1)
+    
+    def test_normals_are_shared(self):
+        """Test repeated lookups return the same normal object.
+
+        Verifies that normals come from shared constants rather than
+        being rebuilt on every call.
+        """
+        for orientation in (ORIENTATION_FLOOR, ORIENTATION_CEILING,
+                            ORIENTATION_WALL_LEFT, ORIENTATION_WALL_RIGHT):
+            assert get_surface_normal(orientation) is get_surface_normal(orientation)
 
 
 class TestApplySurfaceGravity:
@@ -354,6 +497,32 @@ class TestApplySurfaceGravity:
         """
         velocity = apply_surface_gravity((0, 0), ORIENTATION_WALL_RIGHT)
         assert velocity[0] > 0  # Falls right
+    
+    def test_scalar_form_matches(self):
+        """Test the scalar form matches the tuple form.
+
+        Verifies that apply_surface_gravity_xy gives the same result as
+        apply_surface_gravity for every orientation, including when the
+        result is capped at MAX_FALL_SPEED.
+        """
+        orientations = (ORIENTATION_FLOOR, ORIENTATION_CEILING,
+                        ORIENTATION_WALL_LEFT, ORIENTATION_WALL_RIGHT, "unknown")
+        for orientation in orientations:
+            for velocity in ((0.0, 0.0), (3.0, -2.0), (MAX_FALL_SPEED, -MAX_FALL_SPEED),
+                             (-MAX_FALL_SPEED, MAX_FALL_SPEED)):
+                expected = apply_surface_gravity(velocity, orientation)
+                assert apply_surface_gravity_xy(velocity[0], velocity[1], orientation) == expected
+    
+    def test_capped_at_max_fall_speed(self):
+        """Test surface gravity never exceeds MAX_FALL_SPEED.
+
+        Verifies that the pulled component is clamped at the fall speed
+        limit in the direction of the surface.
+        """
+        assert apply_surface_gravity_xy(0, MAX_FALL_SPEED, ORIENTATION_FLOOR) == (0, MAX_FALL_SPEED)
+        assert apply_surface_gravity_xy(0, -MAX_FALL_SPEED, ORIENTATION_CEILING) == (0, -MAX_FALL_SPEED)
+        assert apply_surface_gravity_xy(-MAX_FALL_SPEED, 0, ORIENTATION_WALL_LEFT) == (-MAX_FALL_SPEED, 0)
+        assert apply_surface_gravity_xy(MAX_FALL_SPEED, 0, ORIENTATION_WALL_RIGHT) == (MAX_FALL_SPEED, 0)
 
 
 class TestClamp:
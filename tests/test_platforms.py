@@ -2,7 +2,8 @@
 
 import pytest
 
-from src.platforms import Platform, MovingPlatform
+from src.platforms import Platform, MovingPlatform, PlatformArray
+from src.physics import check_rect_collision
 from src.constants import (
     ORIENTATION_FLOOR, ORIENTATION_CEILING, 
     ORIENTATION_WALL_LEFT, ORIENTATION_WALL_RIGHT,
@@ -79,6 +80,19 @@ class TestPlatformProperties:
         assert rect.y == 200
         assert rect.width == 150
         assert rect.height == 30
+    
+    def test_pygame_rect_reused_and_refreshed(self):
+        """Test pygame_rect reuses one Rect that follows the platform.
+
+        Verifies that a moving platform returns the same Rect object after
+        it updates, and that the Rect reflects its new position.
+        """
+        platform = MovingPlatform(0, 0, 100, 20, end_x=200, end_y=0, speed=10.0)
+        first = platform.pygame_rect
+        platform.update()
+        second = platform.pygame_rect
+        assert first is second
+        assert second.x == int(platform.x)
 
 
 class TestPlatformSurfacePosition:
@@ -218,7 +232,7 @@ class TestPlatformSerialization:
         assert data['width'] == 150
         assert data['height'] == 30
         assert data['is_magnetic'] is True
-        assert data['orientation'] == ORIENTATION_CEILING
+        assert data['orientation'] == 'ceiling'
     
     def test_from_dict(self):
         """Test platform deserialization from dict.
@@ -244,6 +258,27 @@ class TestPlatformSerialization:
         assert platform.is_magnetic is True
         assert platform.orientation == ORIENTATION_WALL_LEFT
     
+    def test_from_dict_legacy_orientation_name(self):
+        """Test deserializing a platform saved with a string orientation.
+
+        Verifies that level data written before orientations became
+        integers still loads with the matching orientation constant.
+        """
+        data = {'x': 0, 'y': 0, 'width': 50, 'height': 200, 'orientation': 'wall_right'}
+        
+        platform = Platform.from_dict(data)
+        
+        assert platform.orientation == ORIENTATION_WALL_RIGHT
+    
+    def test_unknown_orientation_name_raises(self):
+        """Test an unrecognized orientation name is rejected.
+
+        Verifies that a misspelled name raises ValueError instead of
+        being stored as-is.
+        """
+        with pytest.raises(ValueError):
+            Platform(0, 0, 50, 20, orientation='Floor')
+    
     def test_roundtrip_serialization(self):
         """Test serialization roundtrip preserves data.
 
@@ -373,6 +408,41 @@ class TestMovingPlatformVelocity:
         reversed_velocity = platform.get_velocity()
         
         assert initial_velocity[0] == -reversed_velocity[0]
+    
+    def test_velocity_matches_update_step(self):
+        """Test velocity equals the per-frame displacement.
+
+        Verifies that away from the endpoints one update moves the
+        platform by exactly get_velocity().
+        """
+        platform = MovingPlatform(100, 200, 50, 20, end_x=300, end_y=250, speed=2.0)
+        velocity = platform.get_velocity()
+        start = (platform.x, platform.y)
+        
+        platform.update()
+        
+        assert platform.x - start[0] == pytest.approx(velocity[0])
+        assert platform.y - start[1] == pytest.approx(velocity[1])
+    
+    def test_path_changes_update_motion(self):
+        """Test changing speed or endpoints after construction takes effect.
+
+        Verifies that a zero speed stops the platform and that moving the
+        end point changes the velocity.
+        """
+        platform = MovingPlatform(100, 200, 50, 20, end_x=300, end_y=200, speed=2.0)
+        platform.speed = 0
+        
+        platform.update()
+        
+        assert platform.get_velocity() == (0.0, 0.0)
+        assert (platform.x, platform.y) == (100, 200)
+        
+        platform.speed = 1.0
+        platform.end_x = 100
+        platform.end_y = 400
+        
+        assert platform.get_velocity() == (0.0, pytest.approx(2.0))
 
 
 class TestMovingPlatformSerialization:
@@ -418,3 +488,280 @@ class TestMovingPlatformSerialization:
         assert platform.end_y == 400
         assert platform.speed == 2.5
         assert platform.is_magnetic is True
+
+
+class TestPlatformArray:
+    """Tests for PlatformArray class."""
+    
+    def test_columns_match_platforms(self):
+        """Test columns mirror the stored platforms.
+
+        Verifies that each column holds the matching platform field and
+        that indexing and iteration return the platform objects.
+        """
+        floor = Platform(0, 500, 800, 50)
+        wall = Platform(10, 20, 30, 40, is_magnetic=True, orientation=ORIENTATION_WALL_LEFT)
+        platforms = PlatformArray([floor, wall])
+        
+        assert len(platforms) == 2
+        assert platforms[1] is wall
+        assert list(platforms) == [floor, wall]
+        assert platforms.xs == [0, 10]
+        assert platforms.ys == [500, 20]
+        assert platforms.ws == [800, 30]
+        assert platforms.hs == [50, 40]
+        assert platforms.magnetic == [False, True]
+        assert platforms.orientations == [ORIENTATION_FLOOR, ORIENTATION_WALL_LEFT]
+    
+    def test_sync_after_move(self):
+        """Test sync copies a moved platform's position.
+
+        Verifies that columns keep the old position until sync is called
+        for the moved platform.
+        """
+        platform = MovingPlatform(100, 200, 50, 20, end_x=300, end_y=200)
+        platforms = PlatformArray([platform])
+        platform.update()
+        assert platforms.xs[0] == 100
+        
+        platforms.sync(0)
+        assert platforms.xs[0] == platform.x
+        assert platforms.ys[0] == platform.y
+    
+    def test_from_dicts(self):
+        """Test building an array from serialized platforms.
+
+        Verifies that moving platform entries are restored as
+        MovingPlatform and others as Platform.
+        """
+        platforms = PlatformArray.from_dicts([
+            Platform(0, 0, 10, 10).to_dict(),
+            MovingPlatform(0, 0, 10, 10, end_x=50, end_y=0).to_dict(),
+        ])
+        assert type(platforms[0]) is Platform
+        assert isinstance(platforms[1], MovingPlatform)
+    
+    def test_overlapping_matches_check_rect_collision(self):
+        """Test grid-backed overlap queries are exact.
+
+        Verifies that overlapping returns exactly the platforms for which
+        check_rect_collision is true, for static and moving platforms and
+        for queries spanning several grid cells.
+        """
+        platforms = PlatformArray([
+            Platform(0, 500, 2000, 50),
+            Platform(300, 300, 40, 40),
+            MovingPlatform(900, 100, 60, 20, end_x=1200, end_y=100),
+            Platform(5000, 5000, 10, 10),
+        ])
+        for query in [(310, 310, 5, 5), (0, 480, 400, 40), (910, 90, 32, 48), (4000, 0, 10, 10)]:
+            expected = [
+                index for index, platform in enumerate(platforms)
+                if check_rect_collision(query, platform.rect)
+            ]
+            assert platforms.overlapping(*query) == expected
+    
+    def test_overlapping_start(self):
+        """Test the start index of overlap queries.
+
+        Verifies that platforms before start are skipped.
+        """
+        platforms = PlatformArray([Platform(0, 0, 50, 50), Platform(0, 0, 50, 50)])
+        assert platforms.overlapping(10, 10, 5, 5) == [0, 1]
+        assert platforms.overlapping(10, 10, 5, 5, start=1) == [1]
+    
+    def test_colliding_matches_check_rect_collision(self):
+        """Test Rect-backed collision queries are exact at float positions.
+
+        Verifies that colliding agrees with check_rect_collision for
+        fractional rects that touch or nearly touch within one pixel,
+        where rounding to integer Rects alone would give the wrong answer.
+        """
+        platforms = PlatformArray([
+            Platform(10.5, 10.5, 20, 20),
+            Platform(30.5, 10.0, 0.2, 5),
+            Platform(-4.25, 40.75, 10, 0.5),
+            Platform(100, 100, 10, 10),
+        ])
+        queries = [
+            (0, 0, 10.5, 10.5), (0, 0, 10.6, 10.6), (30.4, 10, 1, 1),
+            (30.7, 10, 1, 1), (-5, 41, 1, 1), (5.75, 40, 1, 1), (100.9, 109.9, 5, 5)
+        ]
+        for query in queries:
+            expected = [
+                index for index, platform in enumerate(platforms)
+                if check_rect_collision(query, platform.rect)
+            ]
+            assert platforms.colliding(*query) == expected
+    
+    def test_colliding_start_and_sync(self):
+        """Test collision queries skip early rows and follow synced moves.
+
+        Verifies that platforms before start are skipped and that a moved
+        platform is found at its synced position only.
+        """
+        moving = MovingPlatform(0, 0, 20, 20, end_x=1000, end_y=0, speed=100.0)
+        platforms = PlatformArray([Platform(0, 0, 50, 50), moving])
+        assert platforms.colliding(10, 10, 5, 5) == [0, 1]
+        assert platforms.colliding(10, 10, 5, 5, start=1) == [1]
+        
+        platforms.update_moving()
+        
+        assert platforms.colliding(10, 10, 5, 5) == [0]
+        assert platforms.colliding(moving.x + 5, 5, 5, 5) == [1]
+    
+    def test_candidates_include_moved_platforms(self):
+        """Test moving platforms are found wherever they move.
+
+        Verifies that a moving platform is a candidate for any query and
+        that overlap queries see its synced position.
+        """
+        moving = MovingPlatform(0, 0, 20, 20, end_x=1000, end_y=0, speed=100.0)
+        platforms = PlatformArray([Platform(0, 500, 100, 20), moving])
+        assert platforms.moving_indices == [1]
+        
+        moving.update()
+        platforms.sync(1)
+        
+        assert 1 in platforms.candidates_near((5000, 5000, 1, 1))
+        assert platforms.overlapping(moving.x + 5, 5, 5, 5) == [1]
+        assert platforms.overlapping(5, 5, 5, 5) == []
+    
+    def test_update_moving(self):
+        """Test the batched moving platform update.
+
+        Verifies that update_moving advances each moving platform exactly
+        as its own update would, leaves static rows alone and syncs the
+        columns.
+        """
+        moving = MovingPlatform(0, 0, 20, 20, end_x=100, end_y=50, speed=30.0)
+        twin = MovingPlatform(0, 0, 20, 20, end_x=100, end_y=50, speed=30.0)
+        platforms = PlatformArray([Platform(0, 500, 100, 20), moving])
+        
+        for _ in range(7):
+            platforms.update_moving()
+            twin.update()
+        
+        assert (moving.x, moving.y, moving.direction) == (twin.x, twin.y, twin.direction)
+        assert platforms.xs == [0, moving.x]
+        assert platforms.ys == [500, moving.y]
+    
+    def test_tiles_shared_between_matching_platforms(self):
+        """Test platforms that look the same share one cached tile.
+
+        Verifies that two equal-sized magnetic platforms reuse a tile
+        while a non-magnetic one of the same size gets its own.
+        """
+        first = Platform(0, 0, 40, 10, is_magnetic=True)
+        second = Platform(100, 50, 40, 10, is_magnetic=True)
+        plain = Platform(200, 0, 40, 10)
+        array = PlatformArray([first, second, plain])
+        
+        assert array._get_tile(first) is array._get_tile(second)
+        assert array._get_tile(plain) is not array._get_tile(first)
+    
+    def test_tile_holds_platform_image(self):
+        """Test a tile is the platform drawn at its own origin.
+
+        Verifies that a plain tile is filled with the platform color and a
+        magnetic tile carries the magnetic outline at its edge.
+        """
+        plain = Platform(35.5, 80, 40, 10)
+        magnetic = Platform(120, 40, 40, 30, is_magnetic=True)
+        array = PlatformArray([plain, magnetic])
+        
+        plain_tile = array._get_tile(plain)
+        magnetic_tile = array._get_tile(magnetic)
+        
+        assert plain_tile.get_size() == (40, 10)
+        assert tuple(plain_tile.get_at((0, 0)))[:3] == COLOR_PLATFORM
+        assert tuple(magnetic_tile.get_at((0, 0)))[:3] == (150, 150, 255)
+        assert tuple(magnetic_tile.get_at((20, 15)))[:3] == COLOR_MAGNETIC_PLATFORM
+    
+    def test_edge_columns_follow_moves(self):
+        """Test right and bottom edge columns track platform moves.
+
+        Verifies that the edge columns equal position plus size after
+        construction, a batched moving update and a manual sync.
+        """
+        moving = MovingPlatform(0, 0, 20, 10, end_x=100, end_y=50, speed=30.0)
+        platforms = PlatformArray([Platform(5, 500, 100, 20), moving])
+        assert platforms.rights == [105, 20]
+        assert platforms.bottoms == [520, 10]
+        
+        platforms.update_moving()
+        assert platforms.rights[1] == moving.x + 20
+        assert platforms.bottoms[1] == moving.y + 10
+        
+        moving.x = 400
+        platforms.sync(1)
+        assert platforms.rights[1] == 420
+    
+    def test_overlapping_moving(self):
+        """Test the moving-only query skips static platforms.
+
+        Verifies that only moving platforms overlapping the rect are
+        returned, even when a static platform overlaps it too.
+        """
+        platforms = PlatformArray([
+            Platform(0, 0, 50, 50),
+            MovingPlatform(10, 10, 20, 10, 10, 10),
+            MovingPlatform(500, 500, 20, 10, 500, 500)
+        ])
+        assert platforms.overlapping_moving(0, 0, 40, 40) == [1]
+        assert platforms.colliding(0, 0, 40, 40) == [0, 1]
+    
+    def test_static_version_tracks_static_changes(self):
+        """Test the static version only changes with static platforms.
+
+        Verifies that appending a platform or syncing a static one bumps
+        the version, while syncing a moving platform leaves it alone.
+        """
+        platforms = PlatformArray([Platform(0, 0, 50, 50)])
+        version = platforms.static_version
+        platforms.append(MovingPlatform(100, 0, 20, 10, 200, 0))
+        assert platforms.static_version > version
+        
+        version = platforms.static_version
+        platforms[1].x = 150
+        platforms.sync(1)
+        assert platforms.static_version == version
+        
+        platforms[0].x = 10
+        platforms.sync(0)
+        assert platforms.static_version > version
+    
+    def test_static_layer_holds_static_platforms(self):
+        """Test static platforms are pre-rendered onto one layer.
+
+        Verifies that the layer spans the static platforms' bounding box,
+        shows each static platform at its offset within it, and leaves
+        out the moving platform.
+        """
+        plain = Platform(10, 20, 40, 10)
+        magnetic = Platform(70, 50, 30, 30, is_magnetic=True)
+        moving = MovingPlatform(20, 60, 20, 10, end_x=200, end_y=60)
+        array = PlatformArray([plain, magnetic, moving])
+        
+        array._build_static_layer([array._get_tile(platform) for platform in array])
+        layer = array._static_layer
+        
+        assert array._static_origin == (10, 20)
+        assert layer.get_size() == (90, 60)
+        assert tuple(layer.get_at((0, 0)))[:3] == COLOR_PLATFORM
+        assert tuple(layer.get_at((75, 45)))[:3] == COLOR_MAGNETIC_PLATFORM
+        assert tuple(layer.get_at((15, 45)))[:3] == tuple(layer.get_colorkey())[:3]
+    
+    def test_static_layer_skipped_when_too_large(self):
+        """Test oversized levels fall back to drawing tiles.
+
+        Verifies that no layer is built when the static platforms span
+        more than STATIC_LAYER_MAX_AREA pixels, or when there are none.
+        """
+        far_apart = PlatformArray([Platform(0, 0, 10, 10), Platform(100000, 100000, 10, 10)])
+        far_apart._build_static_layer([far_apart._get_tile(platform) for platform in far_apart])
+        assert far_apart._static_layer is None
+        
+        only_moving = PlatformArray([MovingPlatform(0, 0, 10, 10, end_x=50, end_y=0)])
+        only_moving._build_static_layer([only_moving._get_tile(platform) for platform in only_moving])
+        assert only_moving._static_layer is None
@@ -4,11 +4,12 @@ import pytest
 from unittest.mock import MagicMock
 
 from src.player import Player
-from src.platforms import Platform
+from src.platforms import Platform, MovingPlatform, PlatformArray
 from src.constants import (
     PLAYER_WIDTH, PLAYER_HEIGHT, PLAYER_SPEED, PLAYER_JUMP_STRENGTH,
     MAGNETIC_STATE_NORMAL, MAGNETIC_STATE_STICKING,
-    ORIENTATION_FLOOR, ORIENTATION_CEILING, ORIENTATION_WALL_LEFT, ORIENTATION_WALL_RIGHT
+    ORIENTATION_FLOOR, ORIENTATION_CEILING, ORIENTATION_WALL_LEFT, ORIENTATION_WALL_RIGHT,
+    GRID_MIN_PLATFORMS
 )
 
 
@@ -45,6 +46,17 @@ class TestPlayerInit:
         assert player.jump_count == 0
         assert player.max_jumps == 2
 
+    def test_magnetic_states_are_ints(self):
+        """Test magnetic state constants are distinct integers.
+
+        Verifies that the states compare as plain ints and that a new
+        player starts in the normal state.
+        """
+        assert isinstance(MAGNETIC_STATE_NORMAL, int)
+        assert isinstance(MAGNETIC_STATE_STICKING, int)
+        assert MAGNETIC_STATE_NORMAL != MAGNETIC_STATE_STICKING
+        assert Player(0, 0).magnetic_state == MAGNETIC_STATE_NORMAL
+
 
 class TestPlayerProperties:
     """Tests for Player properties."""
@@ -78,6 +90,19 @@ class TestPlayerProperties:
         player.velocity_x = 5.0
         player.velocity_y = 3.0
         assert player.velocity == (5.0, 3.0)
+    
+    def test_pygame_rect_reused_and_refreshed(self):
+        """Test pygame_rect reuses one Rect that follows the player.
+
+        Verifies that the same Rect object is returned after the player
+        moves, and that it holds the new position truncated to integers.
+        """
+        player = Player(100.7, 200.2)
+        first = player.pygame_rect
+        player.x = 150.9
+        second = player.pygame_rect
+        assert first is second
+        assert (second.x, second.y, second.width, second.height) == (150, 200, PLAYER_WIDTH, PLAYER_HEIGHT)
 
 
 class TestPlayerMove:
@@ -388,6 +413,79 @@ class TestPlayerUpdate:
         
         # Player should have landed on platform
         assert player.y <= 230 - player.height + 5  # Allowing some tolerance
+    
+    def test_update_with_platform_array(self):
+        """Test update accepts a PlatformArray.
+
+        Verifies that landing and sticking give the same result whether
+        platforms are passed as a list or as a PlatformArray.
+        """
+        platforms = [
+            Platform(0, 230, 200, 30, is_magnetic=True),
+            Platform(300, 0, 20, 400)
+        ]
+        from_list = Player(100, 200)
+        from_array = Player(100, 200)
+        from_list.velocity_y = 10
+        from_array.velocity_y = 10
+        
+        from_list.update(platforms)
+        from_array.update(PlatformArray(platforms))
+        
+        assert (from_array.x, from_array.y) == (from_list.x, from_list.y)
+        assert from_array.magnetic_state == from_list.magnetic_state == MAGNETIC_STATE_STICKING
+        assert from_array.current_surface is platforms[0]
+    
+    def test_update_in_large_level_uses_same_result(self):
+        """Test the grid broad phase gives the same collisions.
+
+        Pads a level past GRID_MIN_PLATFORMS with distant platforms and
+        verifies the player lands and hits the wall exactly as it does
+        with only the nearby platforms.
+        """
+        nearby = [Platform(0, 230, 200, 30), Platform(120, 100, 20, 200)]
+        filler = [Platform(5000 + 50 * i, 5000, 40, 40) for i in range(GRID_MIN_PLATFORMS)]
+        small = Player(100, 200)
+        large = Player(100, 200)
+        for player in (small, large):
+            player.velocity_x = 8
+            player.velocity_y = 10
+        
+        small.update(nearby)
+        large.update(PlatformArray(nearby + filler))
+        
+        assert (large.x, large.y) == (small.x, small.y)
+        assert (large.velocity_x, large.velocity_y) == (small.velocity_x, small.velocity_y)
+        assert large.on_ground is small.on_ground is True
+    
+    def test_resting_player_skips_static_sweep(self):
+        """Test a player resting in place only checks moving platforms.
+
+        Sticks the player to a floor, then verifies that once it has been
+        found clear at its resting spot the full sweep is no longer run,
+        while a moving platform pushed into it is still resolved.
+        """
+        floor = Platform(0, 230, 200, 30, is_magnetic=True)
+        crusher = MovingPlatform(90, 0, 20, 10, 90, 0, speed=0)
+        platforms = PlatformArray([floor, crusher])
+        platforms.colliding = MagicMock(wraps=platforms.colliding)
+        player = Player(100, 200)
+        player.velocity_y = 10
+        
+        player.update(platforms)
+        player.update(platforms)
+        calls = platforms.colliding.call_count
+        player.update(platforms)
+        
+        assert platforms.colliding.call_count == calls
+        assert player.magnetic_state == MAGNETIC_STATE_STICKING
+        
+        crusher.x = player.x - 18
+        crusher.y = player.y + 10
+        platforms.sync(1)
+        player.update(platforms)
+        
+        assert player.x == crusher.x + crusher.width
 
 
 class TestPlayerReset:
@@ -415,3 +513,36 @@ class TestPlayerReset:
         assert player.magnetic_state == MAGNETIC_STATE_NORMAL
         assert player.boots_active is True
         assert player.jump_count == 0
+
+
+class TestPlayerSprite:
+    """Tests for the cached player sprite."""
+    
+    def test_sprite_shared_between_matching_players(self):
+        """Test players in the same state share a sprite.
+
+        Verifies the sprite is rendered once and reused by another player
+        with the same size, sticking state, boots state and facing.
+        """
+        first = Player(0, 0)
+        second = Player(300, 100)
+        assert first._get_sprite() is second._get_sprite()
+    
+    def test_sprite_follows_state(self):
+        """Test the sprite changes with the player's look.
+
+        Verifies that facing, boots and sticking each select a different
+        sprite, and that the sticking sprite has the glowing body color.
+        """
+        player = Player(0, 0)
+        seen = {id(player._get_sprite())}
+        player.facing_right = False
+        seen.add(id(player._get_sprite()))
+        player.boots_active = False
+        seen.add(id(player._get_sprite()))
+        player.magnetic_state = MAGNETIC_STATE_STICKING
+        sprite = player._get_sprite()
+        seen.add(id(sprite))
+        
+        assert len(seen) == 4
+        assert tuple(sprite.get_at((0, 0)))[:3] == (100, 200, 255)
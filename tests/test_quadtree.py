@@ -0,0 +1,103 @@
+"""Tests for quadtree module."""
+
+import pytest
+
+from src.quadtree import QuadTree
+
+
+class TestQuadTreeInsert:
+    """Tests for QuadTree insertion and removal."""
+
+    def test_empty_tree(self):
+        """Test a new tree is empty.
+
+        Verifies that a fresh tree stores nothing and queries return nothing.
+        """
+        tree = QuadTree((0, 0, 800, 600))
+        assert len(tree) == 0
+        assert tree.query((0, 0, 800, 600)) == []
+
+    def test_insert_and_contains(self):
+        """Test inserted items are tracked.
+
+        Verifies that an inserted item is contained and its rect recorded.
+        """
+        tree = QuadTree((0, 0, 800, 600))
+        tree.insert('a', (10, 10, 20, 20))
+        assert 'a' in tree
+        assert len(tree) == 1
+        assert tree.rect_of('a') == (10, 10, 20, 20)
+
+    def test_remove(self):
+        """Test removing an item.
+
+        Verifies that removed items are no longer returned by queries and
+        that removing a missing item reports False.
+        """
+        tree = QuadTree((0, 0, 800, 600))
+        tree.insert('a', (10, 10, 20, 20))
+        assert tree.remove('a') is True
+        assert tree.remove('a') is False
+        assert tree.query((0, 0, 800, 600)) == []
+
+    def test_move(self):
+        """Test moving an item updates its position.
+
+        Verifies that after a move the item is found at its new position
+        and not at its old one.
+        """
+        tree = QuadTree((0, 0, 800, 600))
+        tree.insert('a', (10, 10, 20, 20))
+        tree.move('a', (700, 500, 20, 20))
+        assert tree.query((0, 0, 50, 50)) == []
+        assert tree.query((690, 490, 50, 50)) == ['a']
+
+
+class TestQuadTreeQuery:
+    """Tests for QuadTree queries."""
+
+    def test_query_after_split(self):
+        """Test queries stay correct once nodes split.
+
+        Inserts enough items to force splits and verifies that a query
+        returns exactly the overlapping items.
+        """
+        tree = QuadTree((0, 0, 800, 600), max_items=2)
+        for i in range(20):
+            tree.insert(i, (i * 40, 10, 20, 20))
+        result = tree.query((0, 0, 100, 100))
+        assert sorted(result) == [0, 1, 2]
+
+    def test_straddling_item_found(self):
+        """Test items crossing split lines are still found.
+
+        Verifies that an item over the center of the root is returned by
+        queries on either side of the split.
+        """
+        tree = QuadTree((0, 0, 800, 600), max_items=1)
+        tree.insert('center', (390, 290, 20, 20))
+        tree.insert('corner', (10, 10, 20, 20))
+        tree.insert('other', (700, 500, 20, 20))
+        assert tree.query((380, 280, 15, 15)) == ['center']
+        assert tree.query((405, 305, 15, 15)) == ['center']
+
+    def test_out_of_bounds_item_found(self):
+        """Test items outside the root bounds are still found.
+
+        Verifies that an item placed outside the tree bounds is returned
+        by an overlapping query.
+        """
+        tree = QuadTree((0, 0, 800, 600))
+        tree.insert('outside', (900, 700, 20, 20))
+        assert tree.query((890, 690, 40, 40)) == ['outside']
+
+    def test_clear(self):
+        """Test clearing the tree.
+
+        Verifies that clear removes all items.
+        """
+        tree = QuadTree((0, 0, 800, 600))
+        tree.insert('a', (10, 10, 20, 20))
+        tree.clear()
+        assert len(tree) == 0
+        assert 'a' not in tree
@@ -0,0 +1,101 @@
+"""Tests for renderer module."""
+
+import pytest
+from unittest.mock import patch
+import pygame
+
+from src.renderer import Camera, Renderer
+from src.level import Level
+from src.platforms import Platform
+from src.magnets import Magnet
+from src.constants import POLARITY_REPEL
+
+
+class TestCameraFollow:
+    """Tests for Camera.follow bounds handling."""
+    
+    def test_unbound_camera_is_not_pinned(self):
+        """Test an unbound camera follows past the viewport size.
+
+        Verifies that before any level is bound the camera is only kept
+        off negative coordinates, not pinned at the origin.
+        """
+        camera = Camera(800, 600)
+        camera.smoothing = 1.0
+        
+        camera.follow(2000, 1500)
+        
+        assert camera.offset == (1600, 1200)
+    
+    def test_bound_camera_is_clamped(self):
+        """Test following with level bounds clamps to the level edge.
+
+        Verifies that passing both level dimensions binds the camera and
+        keeps the view inside the level.
+        """
+        camera = Camera(800, 600)
+        camera.smoothing = 1.0
+        
+        camera.follow(2000, 1500, 1200, 800)
+        
+        assert camera.offset == (400, 200)
+    
+    def test_single_level_dimension_raises(self):
+        """Test passing only one level dimension is rejected.
+
+        Verifies that follow raises ValueError instead of silently ignoring
+        a lone level_width or level_height.
+        """
+        camera = Camera(800, 600)
+        
+        with pytest.raises(ValueError):
+            camera.follow(100, 100, level_width=1200)
+        with pytest.raises(ValueError):
+            camera.follow(100, 100, level_height=800)
+
+
+class TestRendererPresent:
+    """Tests for flipping versus partial display updates in present."""
+    
+    @staticmethod
+    def _present_frame(renderer, level):
+        """Draw and present one frame of the level.
+
+        Args:
+            renderer: The renderer to draw with.
+            level: The level to draw.
+
+        Returns:
+            str: 'flip' if the whole display was flipped, else 'update'.
+        """
+        with patch('src.renderer.pygame.display') as display:
+            renderer.draw_level(level)
+            renderer.present()
+        return 'flip' if display.flip.called else 'update'
+    
+    def test_static_changes_force_flip(self):
+        """Test any change to static content flips the whole display.
+
+        Verifies that a repeated frame only updates dirty areas, while
+        adding a platform or changing a magnet or the goal flips.
+        """
+        level = Level()
+        level.add_platform(Platform(0, 550, 800, 50))
+        magnet = Magnet(400, 300, range_=100)
+        level.add_magnet(magnet)
+        level.set_goal(700, 500)
+        renderer = Renderer(pygame.Surface((800, 600)))
+        
+        changes = (
+            lambda: level.add_platform(Platform(200, 400, 100, 30)),
+            lambda: setattr(magnet, 'range', 150),
+            lambda: setattr(magnet, 'x', 420),
+            lambda: setattr(magnet, 'polarity', POLARITY_REPEL),
+            magnet.toggle,
+            lambda: level.set_goal(600, 500),
+        )
+        self._present_frame(renderer, level)
+        for change in changes:
+            assert self._present_frame(renderer, level) == 'update'
+            change()
+            assert self._present_frame(renderer, level) == 'flip'
@@ -0,0 +1,40 @@
+"""Tests for the slotted game object classes."""
+
+import pytest
+
+from src.enemies import Enemy, PatrolEnemy, FlyingEnemy
+from src.level import Level
+from src.magnets import Magnet
+from src.platforms import Platform, MovingPlatform
+from src.player import Player
+
+
+SLOTTED_FACTORIES = [
+    lambda: Enemy(0, 0),
+    lambda: PatrolEnemy(0, 0),
+    lambda: FlyingEnemy(0, 0),
+    lambda: Level(),
+    lambda: Magnet(100, 200),
+    lambda: Platform(0, 0, 10, 10),
+    lambda: MovingPlatform(0, 0, 10, 10, end_x=50, end_y=0),
+    lambda: Player(0, 0),
+]
+
+
+class TestSlots:
+    """Tests for classes that store their attributes in __slots__."""
+    
+    @pytest.mark.parametrize(
+        "factory", SLOTTED_FACTORIES,
+        ids=lambda factory: type(factory()).__name__
+    )
+    def test_uses_slots(self, factory):
+        """Test instances store attributes in slots.
+
+        Verifies that the instance has no per-instance __dict__ and that
+        undeclared attributes cannot be set.
+        """
+        instance = factory()
+        assert not hasattr(instance, '__dict__')
+        with pytest.raises(AttributeError):
+            instance.unknown_attribute = 1
@@ -0,0 +1,87 @@
+"""Tests for spatial module."""
+
+import pytest
+
+from src.spatial import SpatialGrid
+
+
+class TestSpatialGridInsert:
+    """Tests for SpatialGrid insertion."""
+
+    def test_empty_grid(self):
+        """Test a new grid is empty.
+
+        Verifies that a fresh grid has no items and queries return nothing.
+        """
+        grid = SpatialGrid(cell_size=100)
+        assert len(grid) == 0
+        assert grid.query((0, 0, 10, 10)) == []
+
+    def test_insert_spans_cells(self):
+        """Test an item is bucketed into every cell it covers.
+
+        Inserts a rect spanning two columns and verifies both cells
+        reference the item.
+        """
+        grid = SpatialGrid(cell_size=100)
+        grid.insert('wide', (50, 10, 100, 10))
+        assert (0, 0) in grid.cells
+        assert (1, 0) in grid.cells
+        assert len(grid) == 1
+
+    def test_clear(self):
+        """Test clearing the grid.
+
+        Verifies that clear removes both items and cells.
+        """
+        grid = SpatialGrid(cell_size=100)
+        grid.insert('a', (0, 0, 10, 10))
+        grid.clear()
+        assert len(grid) == 0
+        assert grid.cells == {}
+
+
+class TestSpatialGridQuery:
+    """Tests for SpatialGrid queries."""
+
+    def test_query_finds_nearby_item(self):
+        """Test querying finds items sharing a cell.
+
+        Verifies that an item in the same cell as the query is returned.
+        """
+        grid = SpatialGrid(cell_size=100)
+        grid.insert('near', (10, 10, 20, 20))
+        assert grid.query((50, 50, 10, 10)) == ['near']
+
+    def test_query_skips_distant_item(self):
+        """Test querying skips items in other cells.
+
+        Verifies that an item several cells away is not returned.
+        """
+        grid = SpatialGrid(cell_size=100)
+        grid.insert('far', (1000, 1000, 20, 20))
+        assert grid.query((0, 0, 10, 10)) == []
+
+    def test_query_deduplicates_in_insertion_order(self):
+        """Test query results are unique and ordered.
+
+        Inserts items spanning several shared cells and verifies each is
+        returned once, in the order it was inserted.
+        """
+        grid = SpatialGrid(cell_size=100)
+        grid.insert('second_cell_item', (150, 0, 10, 10))
+        grid.insert('spanning', (0, 0, 300, 300))
+        grid.insert('first_cell_item', (0, 0, 10, 10))
+        result = grid.query((0, 0, 200, 200))
+        assert result == ['second_cell_item', 'spanning', 'first_cell_item']
+
+    def test_negative_coordinates(self):
+        """Test rects at negative coordinates are indexed.
+
+        Verifies that floor division places negative rects in negative
+        cells and queries still find them.
+        """
+        grid = SpatialGrid(cell_size=100)
+        grid.insert('negative', (-150, -50, 20, 20))
+        assert grid.query((-140, -40, 5, 5)) == ['negative']
+        assert grid.query((10, 10, 5, 5)) == []